@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark serial vs parallel PROJECT.md loading.
+
+Generates synthetic project trees in a temp directory and times
+load_all_projects() serially, with thread/process pools, frontmatter-only
+(lazy) and from a warm persistent index.
+
+Usage:
+    python3 benchmarks/bench_loader.py                 # 100, 1k, 10k projects
+    python3 benchmarks/bench_loader.py 500 5000        # custom sizes
+    python3 benchmarks/bench_loader.py --workers 16
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add mission-control to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.loader import load_all_projects
+
+
+PROJECT_TEMPLATE = """---
+title: "Synthetic Project {i}"
+category: "{category}"
+container: "bench"
+status: "{status}"
+priority: "{priority}"
+
+created: 2026-01-01
+due: {due}
+completed: null
+last_updated: 2026-01-{day:02d}
+
+tags:
+  - bench
+  - synthetic
+
+owner: "Bench Owner"
+
+progress_percent: {progress}
+estimated_hours: 10
+actual_hours: 4
+tasks_total: 12
+tasks_completed: 5
+
+needs_review: false
+blocked: {blocked}
+---
+
+# Synthetic Project {i}
+
+## Overview
+
+**Purpose**: Benchmark project number {i} used to measure loader throughput.
+
+**Context**: Generated by bench_loader.py with a realistic amount of markdown.
+
+## Current Status
+
+### Recent Updates
+{updates}
+
+### Next Steps
+1. Keep benchmarking
+
+## Project Details
+
+{filler}
+"""
+
+CATEGORIES = ["work", "personal", "development", "family"]
+STATUSES = ["active", "on-hold", "blocked", "completed"]
+PRIORITIES = ["high", "medium", "low"]
+
+
+def generate_projects(root: Path, count: int):
+    """Write count synthetic PROJECT.md files under root"""
+    filler = "\n".join(f"- Detail line {n} with some descriptive text" for n in range(60))
+    for i in range(count):
+        project_dir = root / "work" / "bench" / f"bench-project-{i:05d}"
+        project_dir.mkdir(parents=True, exist_ok=True)
+        updates = "\n".join(
+            f"- 2026-01-{(i + n) % 28 + 1:02d}: {'✓ ' if n % 2 else ''}Update {n} for project {i} (from bench)"
+            for n in range(8)
+        )
+        (project_dir / "PROJECT.md").write_text(PROJECT_TEMPLATE.format(
+            i=i,
+            category=CATEGORIES[i % len(CATEGORIES)],
+            status=STATUSES[i % len(STATUSES)],
+            priority=PRIORITIES[i % len(PRIORITIES)],
+            due="null" if i % 3 == 0 else f"2026-{i % 12 + 1:02d}-15",
+            day=i % 28 + 1,
+            progress=i % 101,
+            blocked="true" if i % 7 == 0 else "false",
+            updates=updates,
+            filler=filler
+        ))
+
+
+def time_call(fn, repeat: int = 3) -> float:
+    """Best-of-N wall time in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    args = sys.argv[1:]
+    workers = 8
+    if "--workers" in args:
+        idx = args.index("--workers")
+        workers = int(args[idx + 1])
+        del args[idx:idx + 2]
+    sizes = [int(a) for a in args] or [100, 1000, 10000]
+
+    print(f"{'projects':>10} {'serial':>10} {'thread':>10} {'process':>10} {'lazy':>10} {'indexed':>10}")
+    print("-" * 67)
+
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            generate_projects(root, size)
+
+            serial = time_call(lambda: load_all_projects(root, use_index=False))
+            thread = time_call(lambda: load_all_projects(
+                root, use_index=False, workers=workers, executor="thread"))
+            process = time_call(lambda: load_all_projects(
+                root, use_index=False, workers=workers, executor="process"), repeat=1)
+            lazy = time_call(lambda: load_all_projects(root, use_index=False, lazy=True))
+
+            # Same order regardless of strategy
+            expected = [p.project_md_path for p in load_all_projects(root, use_index=False)]
+            parallel = [p.project_md_path for p in load_all_projects(
+                root, use_index=False, workers=workers, executor="thread")]
+            assert expected == parallel, "parallel loader changed result order"
+
+            load_all_projects(root)  # Warm the persistent index
+            indexed = time_call(lambda: load_all_projects(root))
+
+            print(f"{size:>10} {serial * 1000:>8.1f}ms {thread * 1000:>8.1f}ms "
+                  f"{process * 1000:>8.1f}ms {lazy * 1000:>8.1f}ms {indexed * 1000:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark project-mention detection in import files.
+
+Compares the previous approach (one regex per project name run over the
+whole text) with MentionMatcher (one trie-shaped regex, one pass) on a
+synthetic transcript that mentions some projects with hyphens, spaces or
+no separator, and checks both find the same first match for every name.
+
+Usage:
+    python3 benchmarks/bench_mention_matcher.py                    # 1k names, 1 MB
+    python3 benchmarks/bench_mention_matcher.py --names 5000 --mb 4
+"""
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add mission-control to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.mention_matcher import MentionMatcher
+
+
+WORDS = """client remediation reporting migration payroll budget review website
+redesign onboarding audit forecast launch portal inventory quarterly annual
+management reports integration billing renewal security training""".split()
+
+FILLER = """so we talked about the numbers again and agreed to follow up next week
+with the updated plan once finance signs off on the revised figures""".split()
+
+
+def generate_names(rng: random.Random, count: int):
+    """count distinct hyphenated project names"""
+    names = set()
+    while len(names) < count:
+        client = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 9)))
+        names.add("-".join([client] + rng.sample(WORDS, rng.randint(1, 3))))
+    return sorted(names)
+
+
+def generate_text(rng: random.Random, names, size: int, mentions: int = 50) -> str:
+    """About size characters of filler with mentions of random projects"""
+    chunks, length = [], 0
+    mentioned = rng.sample(names, mentions)
+    while length < size:
+        sentence = " ".join(rng.choice(FILLER) for _ in range(20))
+        if mentioned and rng.random() < 0.02:
+            separator = rng.choice(["-", " ", ""])
+            sentence += " about " + mentioned.pop().replace("-", separator).title()
+        chunks.append(sentence)
+        length += len(sentence) + 1
+    return "\n".join(chunks)
+
+
+def per_project_regex(names, text):
+    """The previous detect_project_mentions loop (names escaped)"""
+    found = {}
+    for name in names:
+        pattern = re.escape(name.lower()).replace(r"\-", "[-\\s]?")
+        match = re.search(pattern, text)
+        if match:
+            found[name] = match.start()
+    return found
+
+
+def time_call(fn, repeat: int = 3) -> float:
+    """Best-of-N wall time in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    args = sys.argv[1:]
+    count = int(args[args.index("--names") + 1]) if "--names" in args else 1000
+    megabytes = float(args[args.index("--mb") + 1]) if "--mb" in args else 1.0
+
+    rng = random.Random(3)
+    names = generate_names(rng, count)
+    text = generate_text(rng, names, int(megabytes * 1024 * 1024)).lower()
+
+    matcher = MentionMatcher(names)
+    expected = per_project_regex(names, text)
+    actual = {name: span[0] for name, span in matcher.find(text).items()}
+    assert actual == expected, "matcher disagrees with per-project regex"
+
+    build = time_call(lambda: MentionMatcher(names))
+    old = time_call(lambda: per_project_regex(names, text), repeat=1)
+    new = time_call(lambda: matcher.find(text))
+
+    print(f"{count} names, {len(text) / 1024 / 1024:.1f} MB text, {len(expected)} projects mentioned")
+    print(f"  per-project regex: {old * 1000:>8.1f}ms")
+    print(f"  matcher build:     {build * 1000:>8.1f}ms  (once per registry version)")
+    print(f"  matcher scan:      {new * 1000:>8.1f}ms  ({old / new:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
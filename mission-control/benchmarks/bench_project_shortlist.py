@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Measure the hit rate of the project shortlist used in AI analysis prompts.
+
+Generates a synthetic portfolio (client-topic projects with tags and an
+overview) and transcripts about one target project. Transcripts refer to
+the project the way people talk - client name and a few overview words,
+the topic only half the time, never the directory name - and mention
+other clients and topics in passing. Reports how often the target makes
+the top K and how much of the prompt's project list the shortlist saves.
+
+Usage:
+    python3 benchmarks/bench_project_shortlist.py              # 300 and 1000 projects
+    python3 benchmarks/bench_project_shortlist.py 5000         # custom sizes
+    python3 benchmarks/bench_project_shortlist.py --transcripts 500
+"""
+import random
+import sys
+import time
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add mission-control to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.project_shortlist import HOLDING, ProjectShortlist
+
+
+TOPICS = """payroll migration audit remediation onboarding reporting dashboard
+forecast budget website redesign inventory compliance hiring warehouse
+integration billing renewal security backup crm erp analytics training
+benefits tax closing reconciliation portal mobile launch pricing vendor
+contract expansion relocation procurement marketing campaign newsletter""".split()
+
+FILLER = """so yeah I think we should circle back on that next week and see where
+things are because honestly the team has been really busy and nobody had a
+chance to look at it properly let me share my screen okay can everyone see
+this great thanks so the main thing is we need to make sure the numbers line
+up before Friday otherwise we will have to push everything again""".split()
+
+SYLLABLES = "ka ro mi tan vel or qua tro bel sun ix ar den lo pra zu fen".split()
+SIZES_K = (5, 10, 25, 50)
+
+
+def make_word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3)))
+
+
+def generate_portfolio(rng: random.Random, count: int):
+    """count synthetic projects shaped like load_all_projects() results"""
+    clients = sorted({make_word(rng) for _ in range(count // 2)})
+    projects, seen = [], set()
+    while len(projects) < count:
+        client = rng.choice(clients)
+        topics = rng.sample(TOPICS, 2)
+        name = f"{client}-{topics[0]}-{topics[1]}"
+        if name in seen:
+            continue
+        seen.add(name)
+        overview = rng.sample(TOPICS, 4) + [make_word(rng) for _ in range(3)]
+        projects.append(SimpleNamespace(
+            project_dir=Path(name),
+            title=f"{client.title()} {topics[0].title()} {topics[1].title()}",
+            tags=[client, topics[0]],
+            owner="Bench Owner",
+            description=" ".join(overview),
+            last_updated=date(2026, 1, 1) + timedelta(days=rng.randint(0, 300)),
+            client=client,
+            topics=topics,
+            overview=overview,
+        ))
+    return projects, clients
+
+
+def generate_transcript(rng: random.Random, target, clients, words: int = 1500) -> str:
+    """A transcript about target that never spells out its directory name"""
+    tokens = [rng.choice(FILLER) for _ in range(words)]
+    references = [target.client] * rng.randint(1, 2) + rng.sample(target.overview, 2)
+    if rng.random() < 0.5:
+        references.append(rng.choice(target.topics))
+    # Other clients and topics mentioned in passing
+    references += rng.sample(clients, 5) + rng.sample(TOPICS, 5)
+    for word in references:
+        tokens.insert(rng.randrange(len(tokens)), word)
+    return " ".join(tokens)
+
+
+def main():
+    args = sys.argv[1:]
+    transcripts = 200
+    if "--transcripts" in args:
+        i = args.index("--transcripts")
+        transcripts = int(args[i + 1])
+        del args[i:i + 2]
+    sizes = [int(arg) for arg in args] or [300, 1000]
+
+    rng = random.Random(7)
+    print(f"{'projects':>9} {'build':>9} {'select':>9} " +
+          " ".join(f"{'hit@' + str(k):>7}" for k in SIZES_K) +
+          f" {'list chars (all -> K=25)':>26}")
+    print("-" * 96)
+
+    for size in sizes:
+        projects, clients = generate_portfolio(rng, size)
+        names = [p.project_dir.name for p in projects]
+        samples = [(target, generate_transcript(rng, target, clients))
+                   for target in rng.choices(projects, k=transcripts)]
+
+        start = time.perf_counter()
+        shortlist = ProjectShortlist.from_projects(projects, size=max(SIZES_K))
+        build = time.perf_counter() - start
+
+        hits = Counter()
+        start = time.perf_counter()
+        for target, content in samples:
+            selected = shortlist.select(content, names)
+            assert selected[-1] == HOLDING
+            rank = selected.index(target.project_dir.name) if target.project_dir.name in selected else None
+            for k in SIZES_K:
+                if rank is not None and rank < k:
+                    hits[k] += 1
+        select = (time.perf_counter() - start) / len(samples)
+
+        full_chars = sum(len(f"- {name}\n") for name in names)
+        short_chars = sum(len(f"- {name}\n") for name in selected[:25]) + len(f"- {HOLDING}\n")
+        print(f"{size:>9} {build * 1000:>7.1f}ms {select * 1000:>7.2f}ms " +
+              " ".join(f"{hits[k] / len(samples):>7.0%}" for k in SIZES_K) +
+              f" {full_chars:>14} -> {short_chars:<9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark tasks.md parsing.
+
+Generates synthetic tasks.md files in a temp directory (each task with
+Assignee/Due/Context sub-items, every fifth with two sub-tasks) and times
+parse_tasks_file().
+
+Usage:
+    python3 benchmarks/bench_task_parser.py              # 1k, 10k, 50k tasks
+    python3 benchmarks/bench_task_parser.py 100000       # custom sizes
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add mission-control to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.task_parser import parse_tasks_file
+
+
+STATUSES = ["[ ]", "[→]", "[✓]", "[!]", "[~]", "[×]"]
+ASSIGNEES = ["Jason Pace", "Michelle Darby", "Jeri Snyder", "Yogesh"]
+
+
+def generate_tasks_file(path: Path, count: int):
+    """Write a tasks.md with count top-level tasks"""
+    lines = ["# Tasks - Synthetic", "", "## Active Tasks", ""]
+    for i in range(count):
+        if i % 50 == 0:
+            lines += [f"### Section {i // 50}", ""]
+        lines.append(f"- {STATUSES[i % len(STATUSES)]} Synthetic task {i} with a realistic description")
+        lines.append(f"  - Assignee: {ASSIGNEES[i % len(ASSIGNEES)]}")
+        lines.append(f"  - Due: 2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}")
+        lines.append(f"  - Context: Generated for benchmarking (from bench-{i // 100}.md)")
+        if i % 5 == 0:
+            lines.append("  - Notes: follow up with the team")
+            lines.append(f"  - [ ] Sub-task {i}.1")
+            lines.append("    - Assignee: Bench Owner")
+            lines.append(f"  - [✓] Sub-task {i}.2")
+        lines.append("")
+    path.write_text("\n".join(lines))
+
+
+def time_call(fn, repeat: int = 3) -> float:
+    """Best-of-N wall time in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 10000, 50000]
+
+    print(f"{'tasks':>10} {'size':>10} {'parse':>10} {'per task':>10}")
+    print("-" * 43)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            tasks_file = Path(tmp) / f"tasks-{size}.md"
+            generate_tasks_file(tasks_file, size)
+
+            tasks = parse_tasks_file(tasks_file)
+            assert len(tasks) == size, "parser dropped tasks"
+            assert all(t.assignee and t.due_date and t.source for t in tasks), "parser missed fields"
+            assert sum(len(t.children) for t in tasks) == 2 * ((size + 4) // 5), "parser missed sub-tasks"
+
+            elapsed = time_call(lambda: parse_tasks_file(tasks_file))
+            kb = tasks_file.stat().st_size / 1024
+            print(f"{size:>10} {kb:>8.0f}KB {elapsed * 1000:>8.1f}ms {elapsed / size * 1e6:>8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Persistent cache of AI content analyses.
+
+Analyzing a transcript costs an LLM call; the same input always gets the
+same answer, so results are stored in ~/projects/.mission-control/analysis-cache/
+keyed by a hash of everything that goes into the prompt (content, known
+project list, prompt date, prompt version, model). Dropping a file twice
+the same day, or retrying an import that failed after analysis, then
+costs nothing.
+
+One JSON file per entry (written atomically, safe for concurrent workers).
+Entries expire after max_age_days; beyond max_entries the least recently
+used ones are evicted. The directory is only listed for that on the first
+put() of a cache object and whenever the entry count passes max_entries
+by 10%, not after every store.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from .document_writer import atomic_write_text
+except ImportError:
+    from document_writer import atomic_write_text
+
+
+def get_analysis_cache_dir(root_dir: Path) -> Path:
+    """Get the analysis cache directory for a projects root"""
+    return root_dir / ".mission-control" / "analysis-cache"
+
+
+def analysis_cache_key(content: str, known_projects: List[str],
+                       prompt_version: int, model: str, prompt_date: str = "") -> str:
+    """
+    Hash the inputs that determine an analysis.
+
+    Args:
+        prompt_date: Date the prompt gives the model for new decisions
+                     (the same content on another day gets another answer)
+
+    Returns:
+        Hex digest used as the cache key
+    """
+    digest = hashlib.sha256()
+    for part in (f"v{prompt_version}", model, prompt_date, "\n".join(known_projects), content):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """
+    Disk cache of analysis results (plain dicts) by key.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int = 500, max_age_days: float = 90,
+                 warn: Callable[[str], None] = print):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding one JSON file per entry
+            max_entries: Entries kept before least recently used ones are evicted
+            max_age_days: Entries older than this are ignored and removed
+            warn: Receives warnings (e.g. the import worker's progress callback)
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_age = max_age_days * 86400
+        self.warn = warn
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: Optional[int] = None  # Entries on disk (None until the first prune)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached analysis.
+
+        Args:
+            key: analysis_cache_key() digest
+
+        Returns:
+            The stored analysis dict, or None on a miss (or expired entry)
+        """
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, ValueError):
+            self._count(hit=False)
+            return None
+
+        if time.time() - entry.get("created", 0) > self.max_age:
+            path.unlink(missing_ok=True)
+            self._count(hit=False)
+            return None
+
+        # Mark as recently used (eviction goes by mtime)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._count(hit=True)
+        return entry.get("analysis")
+
+    def put(self, key: str, analysis: Dict[str, Any]):
+        """
+        Store an analysis, then evict if the cache grew too large.
+
+        Args:
+            key: analysis_cache_key() digest
+            analysis: JSON-serializable analysis dict
+        """
+        path = self._path(key)
+        added = not path.exists()
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(path, json.dumps({
+                "created": time.time(),
+                "analysis": analysis
+            }))
+        except OSError as e:
+            self.warn(f"Warning: Could not write analysis cache: {e}")
+            return
+
+        with self._lock:
+            if self._entries is not None and added:
+                self._entries += 1
+            due = (self._entries is None or
+                   self._entries > self.max_entries + max(1, self.max_entries // 10))
+        if due:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        Drop expired entries and the least recently used beyond max_entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            entries = []
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    entries.append((path.stat().st_mtime, path))
+                except OSError:
+                    continue
+
+            now = time.time()
+            entries.sort(reverse=True)  # Most recently used first
+            doomed = entries[self.max_entries:]
+            doomed += [(mtime, path) for mtime, path in entries[:self.max_entries]
+                       if now - mtime > self.max_age]
+
+            for _, path in doomed:
+                path.unlink(missing_ok=True)
+            self._entries = len(entries) - len(doomed)
+            return len(doomed)
+
+    def clear(self):
+        """Remove every entry"""
+        with self._lock:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+            self._entries = 0
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
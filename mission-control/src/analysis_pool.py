@@ -0,0 +1,169 @@
+"""
+Concurrent AI analysis of import files.
+
+Each Claude call takes seconds, so analyzing a batch one file at a time is
+dominated by waiting. AnalysisPool runs up to max_workers analyses at once
+on a thread pool and yields the results in input order, so the caller can
+route them one after another (file writes never race) while later files
+are still being analyzed.
+
+When the API reports a rate limit (RateLimitError) every worker pauses -
+for the server's Retry-After if given, otherwise with exponential backoff
+plus jitter - and the call is retried up to max_retries times.
+
+A long file is analyzed as several chunk calls. If the analyzer has a
+call_gate attribute (ContentAnalyzer does) the pool installs api_call()
+there, so max_workers caps API calls in flight across all files and
+chunks, and a rate-limit pause holds back every call, not just new files.
+
+The analyzer is anything with analyze_file(path, known_projects), so tests
+can pass a local fake instead of ContentAnalyzer.
+"""
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, Sequence
+
+try:
+    from .content_analyzer import RateLimitError
+except ImportError:
+    from content_analyzer import RateLimitError
+
+
+DEFAULT_CONCURRENCY = 4
+
+
+class AnalysisOutcome(NamedTuple):
+    """Result of analyzing one file"""
+    path: Path
+    analysis: Any                  # ContentAnalysis, or None on error
+    error: Optional[Exception]
+    attempts: int                  # API calls made (1 unless rate limited)
+
+
+class AnalysisPool:
+    """
+    Bounded-concurrency analysis with shared rate-limit backoff.
+    """
+
+    def __init__(self, analyzer, max_workers: int = DEFAULT_CONCURRENCY,
+                 max_retries: int = 5, base_delay: float = 2.0, max_delay: float = 60.0,
+                 sleep: Callable[[float], None] = time.sleep,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the pool.
+
+        Args:
+            analyzer: Object with analyze_file(path, known_projects) -> ContentAnalysis
+            max_workers: Maximum analyses (and API calls) in flight (1 = sequential)
+            max_retries: Retries per file after a RateLimitError
+            base_delay: First backoff delay in seconds (doubles per retry)
+            max_delay: Upper bound for one backoff delay
+            sleep: Sleep function (injectable for tests)
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.analyzer = analyzer
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._resume_at = 0.0  # No new calls start before this clock time
+        self._slots = threading.BoundedSemaphore(self.max_workers)  # API calls in flight
+
+        if hasattr(analyzer, "call_gate"):
+            analyzer.call_gate = self.api_call
+
+    def analyze_files(self, paths: Sequence[Path],
+                      known_projects: List[str]) -> Iterator[AnalysisOutcome]:
+        """
+        Analyze files concurrently.
+
+        Args:
+            paths: Files to analyze
+            known_projects: Project names passed to the analyzer
+
+        Yields:
+            One AnalysisOutcome per path, in the order of paths
+        """
+        if self.max_workers == 1 or len(paths) <= 1:
+            for path in paths:
+                yield self._analyze(path, known_projects)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(paths)),
+                                      thread_name_prefix="analysis")
+        futures = [executor.submit(self._analyze, path, known_projects) for path in paths]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            # Consumer stopped early: drop what has not started yet
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    @contextmanager
+    def api_call(self):
+        """
+        Hold one of max_workers API call slots for the duration of a call.
+
+        Waits out any rate-limit pause first; a RateLimitError raised inside
+        starts a pause for every other caller.
+        """
+        while True:
+            self._wait_for_resume()
+            self._slots.acquire()
+            with self._lock:
+                paused = self._resume_at > self._clock()
+            if not paused:
+                break
+            self._slots.release()  # A pause began while waiting for the slot
+        try:
+            yield
+        except RateLimitError as e:
+            self._pause(self._backoff(1, e.retry_after))
+            raise
+        finally:
+            self._slots.release()
+
+    def _analyze(self, path: Path, known_projects: List[str]) -> AnalysisOutcome:
+        """Analyze one file, backing off and retrying while rate limited"""
+        attempts = 0
+        while True:
+            self._wait_for_resume()
+            attempts += 1
+            try:
+                analysis = self.analyzer.analyze_file(path, known_projects)
+                return AnalysisOutcome(path, analysis, None, attempts)
+            except RateLimitError as e:
+                if attempts > self.max_retries:
+                    return AnalysisOutcome(path, None, e, attempts)
+                self._pause(self._backoff(attempts, e.retry_after))
+            except Exception as e:
+                return AnalysisOutcome(path, None, e, attempts)
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        """Delay before retry number attempt"""
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _pause(self, delay: float):
+        """Hold back every worker for delay seconds"""
+        with self._lock:
+            self._resume_at = max(self._resume_at, self._clock() + delay)
+
+    def _wait_for_resume(self):
+        while True:
+            with self._lock:
+                remaining = self._resume_at - self._clock()
+            if remaining <= 0:
+                return
+            self._sleep(remaining)
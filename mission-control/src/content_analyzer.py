@@ -5,18 +5,62 @@ Dissects unstructured content into structured project updates:
 - Tasks to add to tasks.md
 - Decisions/anecdotes for PROJECT.md
 - Project narrative updates
+
+Content longer than one chunk (long meeting transcripts) is split on
+section/speaker boundaries, the chunks are analyzed concurrently and the
+results merged, with duplicate items removed.
 """
 import os
+import re
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, ContextManager, List, Dict, Optional, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
 try:
     from .file_reader import read_file_content
+    from .analysis_cache import AnalysisCache, analysis_cache_key
+    from .transcript_chunker import CHUNK_CHARS, split_transcript
+    from .project_shortlist import ProjectShortlist
 except ImportError:
     from file_reader import read_file_content
+    from analysis_cache import AnalysisCache, analysis_cache_key
+    from transcript_chunker import CHUNK_CHARS, split_transcript
+    from project_shortlist import ProjectShortlist
+
+
+MODEL = "claude-sonnet-4-20250514"
+
+# Bump when the prompt or response parsing changes (invalidates cached analyses)
+PROMPT_VERSION = 1
+
+MAX_OUTPUT_TOKENS = 4096
+
+# Chunks analyzed at once per document (API calls are further limited by call_gate)
+CHUNK_CONCURRENCY = 4
+
+# A chunk whose answer hits MAX_OUTPUT_TOKENS is split again, at most this often
+MAX_RESPLITS = 3
+
+
+# HTTP statuses worth retrying after a pause: rate limited, unavailable, overloaded
+RETRYABLE_STATUS = frozenset((429, 503, 529))
+
+
+class RateLimitError(RuntimeError):
+    """The API asked us to slow down; the call can be retried after a delay"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after  # Seconds, from the Retry-After header if sent
+
+
+class TruncatedResponseError(RuntimeError):
+    """The answer was cut off at MAX_OUTPUT_TOKENS (too much content for one call)"""
 
 
 @dataclass
@@ -64,14 +108,30 @@ class ContentAnalyzer:
     Analyzes unstructured content using Claude API.
 
     Extracts structured data: tasks, decisions, updates.
+
+    Safe to share between threads; one API client is reused for all calls.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache: Optional[AnalysisCache] = None,
+                 model: str = MODEL, chunk_chars: int = CHUNK_CHARS,
+                 chunk_concurrency: int = CHUNK_CONCURRENCY,
+                 shortlist: Optional[ProjectShortlist] = None,
+                 call_gate: Optional[Callable[[], ContextManager]] = None):
         """
         Initialize the content analyzer.
 
         Args:
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+            cache: Analysis cache; identical inputs are answered from it
+                   without an API call (optional)
+            model: Claude model to use
+            chunk_chars: Longer content is analyzed in chunks of this size
+            chunk_concurrency: Chunks of one document analyzed at once
+            shortlist: Ranks projects against the content so the prompt
+                       lists only the likely ones (optional; default lists all)
+            call_gate: Returns a context manager held around every API call,
+                       for limits shared with other analyses (AnalysisPool
+                       installs its own)
         """
         self.api_key = api_key or os.environ.get('ANTHROPIC_API_KEY')
         if not self.api_key:
@@ -79,12 +139,25 @@ class ContentAnalyzer:
                 "No API key provided. Set ANTHROPIC_API_KEY environment variable "
                 "or pass api_key parameter."
             )
+        self.cache = cache
+        self.model = model
+        self.chunk_chars = chunk_chars
+        self.chunk_concurrency = max(1, chunk_concurrency)
+        self.shortlist = shortlist
+        self.call_gate = call_gate
+        self.off_shortlist = 0  # Items the model assigned to a known project not on the shortlist
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
 
     def analyze_content(self, content: str, known_projects: List[str],
                        filename: str = "") -> ContentAnalysis:
         """
         Analyze content and extract structured information.
 
+        Content longer than chunk_chars is analyzed in chunks (concurrently)
+        and the results merged.
+
         Args:
             content: Raw text content to analyze
             known_projects: List of known project names
@@ -93,29 +166,126 @@ class ContentAnalyzer:
         Returns:
             ContentAnalysis object with extracted data
         """
+        chunks = split_transcript(content, self.chunk_chars)
+        if len(chunks) == 1:
+            return self._analyze_chunk(content, known_projects, filename)
+        return merge_analyses(self._analyze_chunks(chunks, known_projects, filename))
+
+    def _analyze_chunks(self, chunks: List[str], known_projects: List[str],
+                        filename: str, depth: int = 0) -> List[ContentAnalysis]:
+        """
+        Analyze chunks of one document concurrently.
+
+        Every chunk runs to completion (and is cached) before the first
+        failure is raised, so a retry only pays for the chunks that failed.
+
+        Returns:
+            One ContentAnalysis per chunk, in chunk order
+        """
+        parts = [(chunk, (i, len(chunks))) for i, chunk in enumerate(chunks, 1)]
+        if self.chunk_concurrency == 1:
+            return [self._analyze_chunk(chunk, known_projects, filename, part, depth)
+                    for chunk, part in parts]
+
+        with ThreadPoolExecutor(max_workers=min(self.chunk_concurrency, len(chunks)),
+                                thread_name_prefix="chunk") as executor:
+            futures = [executor.submit(self._analyze_chunk, chunk, known_projects,
+                                       filename, part, depth)
+                       for chunk, part in parts]
+        return [future.result() for future in futures]
+
+    def _analyze_chunk(self, content: str, known_projects: List[str], filename: str,
+                       part: Optional[Tuple[int, int]] = None,
+                       depth: int = 0) -> ContentAnalysis:
+        """
+        Analyze one piece of content with a single API call (cached).
+
+        If the answer is cut off at MAX_OUTPUT_TOKENS the content is split
+        in smaller chunks and analyzed again.
+
+        Args:
+            content: Text small enough for one call
+            known_projects: List of known project names
+            filename: Original filename (provides context)
+            part: (index, count) when content is a chunk of a longer document
+            depth: How often this content has already been re-split
+        """
+        candidates = known_projects
+        if self.shortlist is not None:
+            candidates = self.shortlist.select(content, known_projects)
+
+        # Decisions are dated in the prompt, so the date is part of the input
+        today = datetime.now().strftime('%Y-%m-%d')
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = analysis_cache_key(content, candidates, PROMPT_VERSION, self.model, today)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                try:
+                    analysis = analysis_from_dict(cached)
+                except (TypeError, KeyError):
+                    pass  # Unreadable entry - analyze again and overwrite it
+                else:
+                    self._count_off_shortlist(analysis, candidates, known_projects)
+                    return analysis
+
         # Build the analysis prompt
-        prompt = self._build_analysis_prompt(content, known_projects, filename)
+        prompt = self._build_analysis_prompt(content, candidates, filename, part, today)
 
-        # Call Claude API
-        response = self._call_claude_api(prompt)
+        try:
+            # Call Claude API
+            with (self.call_gate() if self.call_gate is not None else nullcontext()):
+                response = self._call_claude_api(prompt)
+
+            # Parse response into structured data
+            analysis = self._parse_analysis_response(response)
+            self._count_off_shortlist(analysis, candidates, known_projects)
+        except TruncatedResponseError:
+            smaller = split_transcript(content, len(content) // 2 + 1)
+            if depth >= MAX_RESPLITS or len(smaller) == 1:
+                raise
+            analysis = merge_analyses(
+                self._analyze_chunks(smaller, known_projects, filename, depth + 1)
+            )
 
-        # Parse response into structured data
-        analysis = self._parse_analysis_response(response)
+        if cache_key is not None:
+            self.cache.put(cache_key, analysis_to_dict(analysis))
 
         return analysis
 
+    def _count_off_shortlist(self, analysis: ContentAnalysis, candidates: List[str],
+                             known_projects: List[str]):
+        """Count items placed in a known project the shortlist did not offer (a miss)"""
+        if candidates is known_projects:
+            return
+        offered = set(candidates)
+        known = set(known_projects)
+        missed = sum(1 for item in (*analysis.tasks, *analysis.decisions, *analysis.updates)
+                     if item.project not in offered and item.project in known)
+        if missed:
+            with self._stats_lock:
+                self.off_shortlist += missed
+
     def _build_analysis_prompt(self, content: str, known_projects: List[str],
-                               filename: str) -> str:
+                               filename: str, part: Optional[Tuple[int, int]] = None,
+                               today: Optional[str] = None) -> str:
         """Build the analysis prompt for Claude"""
+        today = today or datetime.now().strftime('%Y-%m-%d')
         projects_list = "\n".join([f"- {p}" for p in known_projects])
 
+        source = f"Filename: {filename}"
+        if part is not None:
+            source += (f"\nThis is part {part[0]} of {part[1]} of a longer document; "
+                       f"extract only what appears in this part.")
+
         prompt = f"""You are analyzing meeting notes, transcripts, or email content to extract structured information for project management.
 
 KNOWN PROJECTS:
 {projects_list}
 
 CONTENT TO ANALYZE:
-Filename: {filename}
+{source}
 
 {content}
 
@@ -161,7 +331,7 @@ Respond ONLY with valid JSON in this exact format:
     {{
       "text": "Agreed to extend contract through Q2 2026",
       "project": "quatrro-the-one-group-remediation",
-      "date": "{datetime.now().strftime('%Y-%m-%d')}",
+      "date": "{today}",
       "importance": "important",
       "context": "Client meeting decision"
     }}
@@ -192,30 +362,46 @@ Be thorough but precise. Extract all actionable tasks, important decisions, and
 
         Returns:
             Claude's response text
+
+        Raises:
+            RateLimitError: Rate limited or overloaded (retry later)
+            TruncatedResponseError: The answer hit MAX_OUTPUT_TOKENS
+            RuntimeError: Any other API failure
         """
         try:
             import anthropic
 
-            client = anthropic.Anthropic(api_key=self.api_key)
+            with self._client_lock:
+                if self._client is None:
+                    # Retries are handled by the caller (see analysis_pool)
+                    self._client = anthropic.Anthropic(api_key=self.api_key, max_retries=0)
+            client = self._client
 
             message = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
+                model=self.model,
+                max_tokens=MAX_OUTPUT_TOKENS,
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
             )
 
-            return message.content[0].text
-
         except ImportError:
             raise ImportError(
                 "anthropic package not installed. "
                 "Install with: pip install anthropic"
             )
         except Exception as e:
+            status = getattr(e, 'status_code', None)
+            if status in RETRYABLE_STATUS:
+                raise RateLimitError(f"Claude API busy (HTTP {status})", _retry_after(e)) from e
             raise RuntimeError(f"Error calling Claude API: {e}")
 
+        if getattr(message, 'stop_reason', None) == "max_tokens":
+            raise TruncatedResponseError(
+                f"Claude response truncated at {MAX_OUTPUT_TOKENS} tokens"
+            )
+        return message.content[0].text
+
     def _parse_analysis_response(self, response: str) -> ContentAnalysis:
         """
         Parse Claude's JSON response into ContentAnalysis object.
@@ -254,21 +440,12 @@ Be thorough but precise. Extract all actionable tasks, important decisions, and
             # Get unmatched content
             unmatched = data.get("unmatched", [])
 
-            # Calculate project mentions
-            project_mentions = {}
-            for task in tasks:
-                project_mentions[task.project] = project_mentions.get(task.project, 0) + 1
-            for decision in decisions:
-                project_mentions[decision.project] = project_mentions.get(decision.project, 0) + 1
-            for update in updates:
-                project_mentions[update.project] = project_mentions.get(update.project, 0) + 1
-
             return ContentAnalysis(
                 tasks=tasks,
                 decisions=decisions,
                 updates=updates,
                 unmatched_content=unmatched,
-                project_mentions=project_mentions
+                project_mentions=_count_mentions(tasks, decisions, updates)
             )
 
         except json.JSONDecodeError as e:
@@ -292,19 +469,104 @@ Be thorough but precise. Extract all actionable tasks, important decisions, and
             if content is None:
                 raise ValueError(f"Unable to read file or unsupported format: {file_path.name}")
             return self.analyze_content(content, known_projects, file_path.name)
+        except RateLimitError:
+            raise
         except Exception as e:
             raise RuntimeError(f"Error analyzing file {file_path}: {e}")
 
 
-def save_analysis_to_json(analysis: ContentAnalysis, output_path: Path):
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds from an API error's Retry-After header, if present"""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None) or {}
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+def _count_mentions(tasks: List[ExtractedTask], decisions: List[ExtractedDecision],
+                    updates: List[ExtractedUpdate]) -> Dict[str, int]:
+    """Number of extracted items per project"""
+    project_mentions = {}
+    for item in [*tasks, *decisions, *updates]:
+        project_mentions[item.project] = project_mentions.get(item.project, 0) + 1
+    return project_mentions
+
+
+def _normalize(text: str) -> str:
+    """Comparison key for duplicate detection (case, punctuation, spacing ignored)"""
+    return " ".join(re.findall(r"[a-z0-9]+", (text or "").lower()))
+
+
+PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+IMPORTANCE_RANK = {"critical": 0, "important": 1, "notable": 2}
+
+
+def merge_analyses(analyses: List[ContentAnalysis]) -> ContentAnalysis:
     """
-    Save analysis results to JSON file for review.
+    Combine the analyses of a document's chunks into one.
+
+    The same item is often extracted from two chunks (action items recapped
+    at the end of a meeting, overlap at chunk edges). Duplicates - same
+    project and same text ignoring case/punctuation - are merged, keeping
+    the highest priority/importance and any assignee or due date. Updates
+    are combined into one per project.
 
     Args:
-        analysis: ContentAnalysis object
-        output_path: Where to save JSON
+        analyses: Chunk analyses in document order
+
+    Returns:
+        Merged ContentAnalysis
     """
-    data = {
+    tasks: Dict[Tuple[str, str], ExtractedTask] = {}
+    decisions: Dict[Tuple[str, str], ExtractedDecision] = {}
+    updates: Dict[str, ExtractedUpdate] = {}
+    unmatched: Dict[str, str] = {}
+
+    for analysis in analyses:
+        for task in analysis.tasks:
+            key = (task.project, _normalize(task.text))
+            kept = tasks.setdefault(key, task)
+            if kept is not task:
+                if PRIORITY_RANK.get(task.priority, 9) < PRIORITY_RANK.get(kept.priority, 9):
+                    kept.priority = task.priority
+                kept.assignee = kept.assignee or task.assignee
+                kept.due_date = kept.due_date or task.due_date
+
+        for decision in analysis.decisions:
+            key = (decision.project, _normalize(decision.text))
+            kept = decisions.setdefault(key, decision)
+            if (kept is not decision and IMPORTANCE_RANK.get(decision.importance, 9)
+                    < IMPORTANCE_RANK.get(kept.importance, 9)):
+                kept.importance = decision.importance
+
+        for update in analysis.updates:
+            kept = updates.setdefault(update.project, update)
+            if kept is not update:
+                if _normalize(update.details) not in _normalize(kept.details):
+                    kept.details = f"{kept.details} {update.details}".strip()
+                if update.sentiment != kept.sentiment:
+                    kept.sentiment = "mixed"
+
+        for text in analysis.unmatched_content:
+            unmatched.setdefault(_normalize(text), text)
+
+    tasks_list = list(tasks.values())
+    decisions_list = list(decisions.values())
+    updates_list = list(updates.values())
+    return ContentAnalysis(
+        tasks=tasks_list,
+        decisions=decisions_list,
+        updates=updates_list,
+        unmatched_content=list(unmatched.values()),
+        project_mentions=_count_mentions(tasks_list, decisions_list, updates_list)
+    )
+
+
+def analysis_to_dict(analysis: ContentAnalysis) -> Dict:
+    """Convert a ContentAnalysis to a JSON-serializable dict"""
+    return {
         "tasks": [asdict(t) for t in analysis.tasks],
         "decisions": [asdict(d) for d in analysis.decisions],
         "updates": [asdict(u) for u in analysis.updates],
@@ -312,4 +574,24 @@ def save_analysis_to_json(analysis: ContentAnalysis, output_path: Path):
         "project_mentions": analysis.project_mentions
     }
 
-    output_path.write_text(json.dumps(data, indent=2))
+
+def analysis_from_dict(data: Dict) -> ContentAnalysis:
+    """Rebuild a ContentAnalysis from analysis_to_dict() output"""
+    return ContentAnalysis(
+        tasks=[ExtractedTask(**t) for t in data["tasks"]],
+        decisions=[ExtractedDecision(**d) for d in data["decisions"]],
+        updates=[ExtractedUpdate(**u) for u in data["updates"]],
+        unmatched_content=data["unmatched_content"],
+        project_mentions=data["project_mentions"]
+    )
+
+
+def save_analysis_to_json(analysis: ContentAnalysis, output_path: Path):
+    """
+    Save analysis results to JSON file for review.
+
+    Args:
+        analysis: ContentAnalysis object
+        output_path: Where to save JSON
+    """
+    output_path.write_text(json.dumps(analysis_to_dict(analysis), indent=2))
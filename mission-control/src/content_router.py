@@ -7,7 +7,7 @@ Updates:
 - meeting-notes/ (saves original file)
 """
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 from datetime import datetime
 import re
 
@@ -15,10 +15,14 @@ try:
     from .content_analyzer import (
         ContentAnalysis, ExtractedTask, ExtractedDecision, ExtractedUpdate
     )
+    from .project_registry import get_project_registry
+    from .document_writer import DocumentTransaction, atomic_write_text
 except ImportError:
     from content_analyzer import (
         ContentAnalysis, ExtractedTask, ExtractedDecision, ExtractedUpdate
     )
+    from project_registry import get_project_registry
+    from document_writer import DocumentTransaction, atomic_write_text
 
 
 class ContentRouter:
@@ -34,15 +38,23 @@ class ContentRouter:
             projects_dir: Root projects directory
         """
         self.projects_dir = projects_dir
+        self.registry = get_project_registry(projects_dir)
 
-    def route_analysis(self, analysis: ContentAnalysis,
-                      source_filename: str) -> Dict[str, any]:
+    def route_analysis(self, analysis: ContentAnalysis, source_filename: str,
+                       before_commit: Optional[Callable[[DocumentTransaction, Dict], None]] = None
+                       ) -> Dict[str, any]:
         """
         Route all analyzed content to appropriate locations.
 
+        Edits are grouped per file and applied in memory; each touched
+        file is written once, atomically, at the end of the pass.
+
         Args:
             analysis: ContentAnalysis object
             source_filename: Original filename for reference
+            before_commit: Called with the transaction and the routing
+                           summary just before files are written (the
+                           import job queue records its write plan here)
 
         Returns:
             Routing summary
@@ -57,17 +69,19 @@ class ContentRouter:
             # PHASE 2: Add detailed tracking for undo functionality
             "task_details": [],
             "decision_details": [],
-            "update_details": []
+            "update_details": [],
+            "committed": True  # False if nothing could be written
         }
+        txn = DocumentTransaction()
 
         # Route tasks
         for task in analysis.tasks:
             try:
                 if task.project == "HOLDING":
-                    self._add_to_holding(task, source_filename)
+                    self._add_to_holding(task, source_filename, txn)
                     summary["holding_items"] += 1
                 else:
-                    self._add_task_to_project(task, source_filename)
+                    self._add_task_to_project(task, source_filename, txn)
                     summary["tasks_added"] += 1
                     summary["projects_updated"].add(task.project)
 
@@ -85,10 +99,10 @@ class ContentRouter:
         for decision in analysis.decisions:
             try:
                 if decision.project == "HOLDING":
-                    self._add_to_holding(decision, source_filename)
+                    self._add_to_holding(decision, source_filename, txn)
                     summary["holding_items"] += 1
                 else:
-                    self._add_decision_to_project(decision, source_filename)
+                    self._add_decision_to_project(decision, source_filename, txn)
                     summary["decisions_added"] += 1
                     summary["projects_updated"].add(decision.project)
 
@@ -105,10 +119,10 @@ class ContentRouter:
         for update in analysis.updates:
             try:
                 if update.project == "HOLDING":
-                    self._add_to_holding(update, source_filename)
+                    self._add_to_holding(update, source_filename, txn)
                     summary["holding_items"] += 1
                 else:
-                    self._add_update_to_project(update, source_filename)
+                    self._add_update_to_project(update, source_filename, txn)
                     summary["updates_applied"] += 1
                     summary["projects_updated"].add(update.project)
 
@@ -124,30 +138,41 @@ class ContentRouter:
         # Route unmatched content to holding
         if analysis.unmatched_content:
             for content in analysis.unmatched_content:
-                self._add_to_holding(content, source_filename)
+                self._add_to_holding(content, source_filename, txn)
                 summary["holding_items"] += len(analysis.unmatched_content)
 
+        # Write every touched file once
+        try:
+            if before_commit is not None:
+                before_commit(txn, summary)
+            txn.commit()
+        except Exception as e:
+            summary["errors"].append(f"Write error (no files changed): {e}")
+            summary["committed"] = False
+            for key in ("tasks_added", "decisions_added", "updates_applied", "holding_items"):
+                summary[key] = 0
+            summary["projects_updated"] = set()
+            for key in ("task_details", "decision_details", "update_details"):
+                summary[key] = []
+
         return summary
 
     def _find_project_dir(self, project_name: str) -> Optional[Path]:
         """Find project directory by name"""
-        for project_file in self.projects_dir.rglob("PROJECT.md"):
-            if project_file.parent.name == project_name:
-                return project_file.parent
-        return None
+        return self.registry.find(project_name)
 
-    def _add_task_to_project(self, task: ExtractedTask, source: str):
-        """Add a task to project's tasks.md"""
+    def _add_task_to_project(self, task: ExtractedTask, source: str,
+                             txn: DocumentTransaction):
+        """Add a task to project's tasks.md (staged in txn)"""
         project_dir = self._find_project_dir(task.project)
         if not project_dir:
             raise ValueError(f"Project not found: {task.project}")
 
         tasks_file = project_dir / "tasks.md"
-        if not tasks_file.exists():
+        content = txn.read(tasks_file)
+        if content is None:
             raise ValueError(f"tasks.md not found in {project_dir}")
 
-        # Read current content
-        content = tasks_file.read_text()
         original_content = content  # Keep backup to detect if changes were made
 
         # Build task text
@@ -220,22 +245,21 @@ class ContentRouter:
             # Nothing was added, append to end
             content += f"\n\n## Imported Tasks\n\n### {task.priority.capitalize()} Priority\n{task_text}"
 
-        # Write back
-        tasks_file.write_text(content)
+        # Stage for the batched write
+        txn.write(tasks_file, content)
 
-    def _add_decision_to_project(self, decision: ExtractedDecision, source: str):
-        """Add a decision to project's PROJECT.md Recent Updates"""
+    def _add_decision_to_project(self, decision: ExtractedDecision, source: str,
+                                 txn: DocumentTransaction):
+        """Add a decision to project's PROJECT.md Recent Updates (staged in txn)"""
         project_dir = self._find_project_dir(decision.project)
         if not project_dir:
             raise ValueError(f"Project not found: {decision.project}")
 
         project_file = project_dir / "PROJECT.md"
-        if not project_file.exists():
+        content = txn.read(project_file)
+        if content is None:
             raise ValueError(f"PROJECT.md not found in {project_dir}")
 
-        # Read current content
-        content = project_file.read_text()
-
         # Update last_updated in YAML
         today = datetime.now().strftime("%Y-%m-%d")
         content = re.sub(
@@ -266,22 +290,21 @@ class ContentRouter:
                 replacement = f"\\1### Recent Updates\n{update_text}\n\n"
                 content = re.sub(pattern, replacement, content, count=1, flags=re.DOTALL)
 
-        # Write back
-        project_file.write_text(content)
+        # Stage for the batched write
+        txn.write(project_file, content)
 
-    def _add_update_to_project(self, update: ExtractedUpdate, source: str):
-        """Add a narrative update to project's PROJECT.md"""
+    def _add_update_to_project(self, update: ExtractedUpdate, source: str,
+                               txn: DocumentTransaction):
+        """Add a narrative update to project's PROJECT.md (staged in txn)"""
         project_dir = self._find_project_dir(update.project)
         if not project_dir:
             raise ValueError(f"Project not found: {update.project}")
 
         project_file = project_dir / "PROJECT.md"
-        if not project_file.exists():
+        content = txn.read(project_file)
+        if content is None:
             raise ValueError(f"PROJECT.md not found in {project_dir}")
 
-        # Read current content
-        content = project_file.read_text()
-
         # Update last_updated in YAML
         today = datetime.now().strftime("%Y-%m-%d")
         content = re.sub(
@@ -322,11 +345,11 @@ class ContentRouter:
                 replacement = f"\\1### Recent Updates\n{update_text}\n\n"
                 content = re.sub(pattern, replacement, content, count=1, flags=re.DOTALL)
 
-        # Write back
-        project_file.write_text(content)
+        # Stage for the batched write
+        txn.write(project_file, content)
 
-    def _add_to_holding(self, item: any, source: str):
-        """Add item to holding project for unmatched content"""
+    def _add_to_holding(self, item: any, source: str, txn: DocumentTransaction):
+        """Add item to holding project for unmatched content (staged in txn)"""
         # Find or create holding project
         holding_dir = self.projects_dir / "work" / "internal" / "_holding-unprocessed-content"
         holding_dir.mkdir(parents=True, exist_ok=True)
@@ -355,11 +378,10 @@ class ContentRouter:
         entry += "\n---\n"
 
         # Append to file
-        if holding_file.exists():
-            content = holding_file.read_text()
-            holding_file.write_text(content + entry)
-        else:
-            holding_file.write_text(f"# Unprocessed Content\n\n{entry}")
+        content = txn.read(holding_file)
+        if content is None:
+            content = "# Unprocessed Content\n\n"
+        txn.write(holding_file, content + entry)
 
     def _create_holding_project(self, holding_dir: Path):
         """Create the holding project structure"""
@@ -436,8 +458,8 @@ auto_archive_on_complete: false
 **Project Owner**: Jason Pace
 """
 
-        project_md.write_text(content)
+        atomic_write_text(project_md, content)
 
         # Create unprocessed-content.md
         content_md = holding_dir / "unprocessed-content.md"
-        content_md.write_text("# Unprocessed Content\n\nContent that needs manual routing.\n\n---\n\n")
+        atomic_write_text(content_md, "# Unprocessed Content\n\nContent that needs manual routing.\n\n---\n\n")
@@ -0,0 +1,211 @@
+"""
+Atomic, batched writes for project documents (tasks.md, PROJECT.md, ...).
+
+A DocumentTransaction reads each file once, lets callers apply any number
+of edits to the in-memory text, and writes every changed file exactly once
+on commit(). Each write goes to a temp file in the same directory, is
+fsync'd, then renamed over the original, so a crash leaves either the old
+or the new file - never a truncated one.
+
+    with DocumentTransaction() as txn:
+        content = txn.read(tasks_file)
+        txn.write(tasks_file, content + "- [ ] New task\\n")
+    # committed here (discarded if the block raised)
+"""
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class DocumentConflictError(Exception):
+    """A file changed on disk after it was read into a transaction"""
+
+
+def atomic_write_text(path: Path, content: str):
+    """
+    Replace a file's content atomically (temp file + fsync + rename).
+
+    Args:
+        path: File to write
+        content: New text content
+    """
+    tmp_path = _write_temp(path, content)
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        _unlink_quietly(tmp_path)
+        raise
+    _fsync_dir(path.parent)
+
+
+class DocumentTransaction:
+    """
+    In-memory edits to a set of text files, written together on commit().
+
+    Files are read lazily on first access. commit() refuses to overwrite a
+    file that changed on disk since it was read (DocumentConflictError),
+    so edits are never silently lost.
+    """
+
+    def __init__(self):
+        # path -> [original content (None if missing), current content, stat key]
+        self._documents: Dict[Path, List] = {}
+
+    def read(self, path: Path) -> Optional[str]:
+        """
+        Current content of a file, including edits made in this transaction.
+
+        Args:
+            path: File to read
+
+        Returns:
+            File content, or None if the file does not exist
+        """
+        doc = self._documents.get(path)
+        if doc is None:
+            try:
+                stat_key = _stat_key(path)
+                content = path.read_text()
+            except FileNotFoundError:
+                stat_key, content = None, None
+            doc = self._documents[path] = [content, content, stat_key]
+        return doc[1]
+
+    def write(self, path: Path, content: str):
+        """
+        Replace a file's content (applied on commit).
+
+        Args:
+            path: File to write
+            content: New text content
+        """
+        self.read(path)
+        self._documents[path][1] = content
+
+    def edit(self, path: Path, fn: Callable[[str], str]) -> str:
+        """
+        Apply fn to a file's current content.
+
+        Args:
+            path: Existing file to edit
+            fn: Function returning the new content
+
+        Returns:
+            The new content
+        """
+        content = self.read(path)
+        if content is None:
+            raise FileNotFoundError(f"{path} not found")
+        content = fn(content)
+        self._documents[path][1] = content
+        return content
+
+    def changed_files(self) -> List[Path]:
+        """Files whose content differs from what was read"""
+        return [path for path, (original, current, _) in self._documents.items()
+                if current != original]
+
+    def commit(self) -> List[Path]:
+        """
+        Write every changed file once, atomically.
+
+        All temp files are written and fsync'd before any rename, so a
+        failure while writing leaves every original untouched.
+
+        Returns:
+            Files that were written
+
+        Raises:
+            DocumentConflictError: A file changed on disk since it was read
+            OSError: A file could not be written
+        """
+        changed = self.changed_files()
+        for path in changed:
+            if _stat_key(path) != self._documents[path][2]:
+                raise DocumentConflictError(f"{path} changed on disk, not overwriting")
+
+        staged: List[Tuple[Path, str]] = []
+        try:
+            for path in changed:
+                staged.append((path, _write_temp(path, self._documents[path][1])))
+        except OSError:
+            for _, tmp_path in staged:
+                _unlink_quietly(tmp_path)
+            raise
+
+        for path, tmp_path in staged:
+            os.replace(tmp_path, path)
+        for directory in {path.parent for path in changed}:
+            _fsync_dir(directory)
+
+        self._documents.clear()
+        return changed
+
+    def discard(self):
+        """Drop all pending edits"""
+        self._documents.clear()
+
+    def __enter__(self) -> "DocumentTransaction":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+        return False
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it does not exist"""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _write_temp(path: Path, content: str) -> str:
+    """Write content to an fsync'd temp file next to path, keeping its mode"""
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp_path, path.stat().st_mode & 0o7777)
+        except FileNotFoundError:
+            os.chmod(tmp_path, 0o666 & ~_umask())
+    except BaseException:
+        _unlink_quietly(tmp_path)
+        raise
+    return tmp_path
+
+
+def _fsync_dir(directory: Path):
+    """Persist a rename by fsyncing the directory (best effort)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _unlink_quietly(path: str):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
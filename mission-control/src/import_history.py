@@ -5,11 +5,24 @@ Tracks the last N imports with full rollback data to enable undo functionality.
 """
 import json
 import shutil
+import threading
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 from dataclasses import dataclass, asdict
 
+try:
+    from .project_registry import get_project_registry
+    from .document_writer import DocumentTransaction, atomic_write_text
+except ImportError:
+    from project_registry import get_project_registry
+    from document_writer import DocumentTransaction, atomic_write_text
+
+
+# Serializes load -> modify -> save of the history file: the background
+# import worker adds entries while the UI thread may be undoing one
+_history_lock = threading.Lock()
+
 
 @dataclass
 class TaskChange:
@@ -93,55 +106,61 @@ class ImportHistory:
         Returns:
             Import ID
         """
-        # Generate unique ID
-        import_id = datetime.now().strftime("%Y%m%d-%H%M%S")
-
-        # Backup original file
-        backup_path = None
-        if source_path and source_path.exists():
-            backup_filename = f"{import_id}-{source_file}"
-            backup_path = self.backup_dir / backup_filename
-            shutil.copy2(source_path, backup_path)
-
-        # Extract project changes from routing result
-        changes = self._extract_changes_from_routing(routing_result)
-
-        # Create history entry
-        entry = ImportHistoryEntry(
-            id=import_id,
-            timestamp=datetime.now().isoformat(),
-            source_file=source_file,
-            changes=changes,
-            can_undo=True,
-            undone=False,
-            original_file_backup=str(backup_path) if backup_path else None
-        )
-
-        # Load existing history
-        history = self._load_history()
-
-        # Add new entry
-        history.append(asdict(entry))
-
-        # Trim to max entries
-        if len(history) > self.max_entries:
-            # Remove oldest entries
-            removed = history[:-self.max_entries]
-            history = history[-self.max_entries:]
-
-            # Clean up old backups
-            for old_entry in removed:
-                backup_file = old_entry.get('original_file_backup')
-                if backup_file:
-                    try:
-                        Path(backup_file).unlink(missing_ok=True)
-                    except Exception:
-                        pass
-
-        # Save history
-        self._save_history(history)
-
-        return import_id
+        with _history_lock:
+            # Load existing history
+            history = self._load_history()
+
+            # Generate unique ID (imports within the same second get a suffix)
+            import_id = base_id = datetime.now().strftime("%Y%m%d-%H%M%S")
+            existing_ids = {e.get('id') for e in history}
+            suffix = 2
+            while import_id in existing_ids:
+                import_id = f"{base_id}-{suffix}"
+                suffix += 1
+
+            # Backup original file
+            backup_path = None
+            if source_path and source_path.exists():
+                backup_filename = f"{import_id}-{source_file}"
+                backup_path = self.backup_dir / backup_filename
+                shutil.copy2(source_path, backup_path)
+
+            # Extract project changes from routing result
+            changes = self._extract_changes_from_routing(routing_result)
+
+            # Create history entry
+            entry = ImportHistoryEntry(
+                id=import_id,
+                timestamp=datetime.now().isoformat(),
+                source_file=source_file,
+                changes=changes,
+                can_undo=True,
+                undone=False,
+                original_file_backup=str(backup_path) if backup_path else None
+            )
+
+            # Add new entry
+            history.append(asdict(entry))
+
+            # Trim to max entries
+            if len(history) > self.max_entries:
+                # Remove oldest entries
+                removed = history[:-self.max_entries]
+                history = history[-self.max_entries:]
+
+                # Clean up old backups
+                for old_entry in removed:
+                    backup_file = old_entry.get('original_file_backup')
+                    if backup_file:
+                        try:
+                            Path(backup_file).unlink(missing_ok=True)
+                        except Exception:
+                            pass
+
+            # Save history
+            self._save_history(history)
+
+            return import_id
 
     def _extract_changes_from_routing(self, routing_result: Dict) -> List[ProjectChanges]:
         """
@@ -241,6 +260,10 @@ class ImportHistory:
         """
         Undo an import by removing all added content.
 
+        All removals are staged in one transaction; each affected file is
+        written once, and if any write fails no file is changed and the
+        import stays undoable.
+
         Args:
             import_id: ID of import to undo
             projects_dir: Root projects directory
@@ -248,95 +271,105 @@ class ImportHistory:
         Returns:
             Summary of undo operation
         """
-        history = self._load_history()
+        with _history_lock:
+            history = self._load_history()
+
+            # Find the entry
+            entry = None
+            entry_idx = None
+            for idx, e in enumerate(history):
+                if e.get('id') == import_id:
+                    entry = e
+                    entry_idx = idx
+                    break
+
+            if not entry:
+                return {
+                    'success': False,
+                    'error': f'Import {import_id} not found in history'
+                }
 
-        # Find the entry
-        entry = None
-        entry_idx = None
-        for idx, e in enumerate(history):
-            if e.get('id') == import_id:
-                entry = e
-                entry_idx = idx
-                break
-
-        if not entry:
-            return {
-                'success': False,
-                'error': f'Import {import_id} not found in history'
-            }
+            if entry.get('undone'):
+                return {
+                    'success': False,
+                    'error': 'Import already undone'
+                }
 
-        if entry.get('undone'):
-            return {
-                'success': False,
-                'error': 'Import already undone'
-            }
+            if not entry.get('can_undo'):
+                return {
+                    'success': False,
+                    'error': 'Import cannot be undone'
+                }
 
-        if not entry.get('can_undo'):
-            return {
-                'success': False,
-                'error': 'Import cannot be undone'
+            summary = {
+                'success': True,
+                'import_id': import_id,
+                'source_file': entry.get('source_file'),
+                'projects_affected': [],
+                'tasks_removed': 0,
+                'decisions_removed': 0,
+                'updates_removed': 0,
+                'errors': []
             }
 
-        summary = {
-            'success': True,
-            'import_id': import_id,
-            'source_file': entry.get('source_file'),
-            'projects_affected': [],
-            'tasks_removed': 0,
-            'decisions_removed': 0,
-            'updates_removed': 0,
-            'errors': []
-        }
-
-        # Rollback changes for each project
-        for change_data in entry.get('changes', []):
-            project_name = change_data.get('project_name')
+            # Rollback changes for each project
+            txn = DocumentTransaction()
+            for change_data in entry.get('changes', []):
+                project_name = change_data.get('project_name')
 
-            try:
-                result = self._rollback_project_changes(
-                    project_name, change_data, projects_dir
-                )
+                try:
+                    result = self._rollback_project_changes(
+                        project_name, change_data, projects_dir, txn
+                    )
 
-                summary['projects_affected'].append(project_name)
-                summary['tasks_removed'] += result['tasks_removed']
-                summary['decisions_removed'] += result['decisions_removed']
-                summary['updates_removed'] += result['updates_removed']
-                summary['errors'].extend(result['errors'])
+                    summary['projects_affected'].append(project_name)
+                    summary['tasks_removed'] += result['tasks_removed']
+                    summary['decisions_removed'] += result['decisions_removed']
+                    summary['updates_removed'] += result['updates_removed']
+                    summary['errors'].extend(result['errors'])
 
-            except Exception as e:
-                error_msg = f"Error rolling back {project_name}: {e}"
-                summary['errors'].append(error_msg)
+                except Exception as e:
+                    error_msg = f"Error rolling back {project_name}: {e}"
+                    summary['errors'].append(error_msg)
 
-        # Restore original file to import directory if backup exists
-        backup_path = entry.get('original_file_backup')
-        if backup_path and Path(backup_path).exists():
             try:
-                import_dir = projects_dir / "import"
-                restore_path = import_dir / entry.get('source_file')
-
-                # Don't overwrite if file already exists
-                if not restore_path.exists():
-                    shutil.copy2(backup_path, restore_path)
-                    summary['file_restored'] = True
-                else:
-                    summary['file_restored'] = False
-                    summary['errors'].append(
-                        f"File {entry.get('source_file')} already exists in import directory"
-                    )
+                txn.commit()
             except Exception as e:
-                summary['errors'].append(f"Error restoring file: {e}")
-
-        # Mark as undone
-        entry['undone'] = True
-        entry['undone_at'] = datetime.now().isoformat()
-        history[entry_idx] = entry
-
-        self._save_history(history)
+                return {
+                    'success': False,
+                    'error': f'Could not write project files (nothing changed): {e}'
+                }
 
-        return summary
+            # Restore original file to import directory if backup exists
+            backup_path = entry.get('original_file_backup')
+            if backup_path and Path(backup_path).exists():
+                try:
+                    import_dir = projects_dir / "import"
+                    restore_path = import_dir / entry.get('source_file')
+
+                    # Don't overwrite if file already exists
+                    if not restore_path.exists():
+                        shutil.copy2(backup_path, restore_path)
+                        summary['file_restored'] = True
+                    else:
+                        summary['file_restored'] = False
+                        summary['errors'].append(
+                            f"File {entry.get('source_file')} already exists in import directory"
+                        )
+                except Exception as e:
+                    summary['errors'].append(f"Error restoring file: {e}")
+
+            # Mark as undone
+            entry['undone'] = True
+            entry['undone_at'] = datetime.now().isoformat()
+            history[entry_idx] = entry
+
+            self._save_history(history)
+
+            return summary
 
     def _rollback_project_changes(self, project_name: str, change_data: Dict,
-                                   projects_dir: Path) -> Dict:
+                                   projects_dir: Path, txn: DocumentTransaction) -> Dict:
         """
         Rollback changes for a single project.
 
@@ -344,6 +377,7 @@ class ImportHistory:
             project_name: Project directory name
             change_data: ProjectChanges dict
             projects_dir: Root projects directory
+            txn: Transaction the file edits are staged in
 
         Returns:
             Summary of rollback for this project
@@ -366,7 +400,7 @@ class ImportHistory:
         if tasks_file.exists() and change_data.get('tasks_added'):
             try:
                 removed = self._remove_tasks_from_file(
-                    tasks_file, change_data['tasks_added']
+                    tasks_file, change_data['tasks_added'], txn
                 )
                 result['tasks_removed'] = removed
             except Exception as e:
@@ -379,14 +413,14 @@ class ImportHistory:
                 # Remove decisions
                 if change_data.get('decisions_added'):
                     removed = self._remove_decisions_from_file(
-                        project_file, change_data['decisions_added']
+                        project_file, change_data['decisions_added'], txn
                     )
                     result['decisions_removed'] = removed
 
                 # Remove updates
                 if change_data.get('updates_added'):
                     removed = self._remove_updates_from_file(
-                        project_file, change_data['updates_added']
+                        project_file, change_data['updates_added'], txn
                     )
                     result['updates_removed'] = removed
 
@@ -397,23 +431,22 @@ class ImportHistory:
 
     def _find_project_dir(self, project_name: str, projects_dir: Path) -> Optional[Path]:
         """Find project directory by name"""
-        for project_file in projects_dir.rglob("PROJECT.md"):
-            if project_file.parent.name == project_name:
-                return project_file.parent
-        return None
+        return get_project_registry(projects_dir).find(project_name)
 
-    def _remove_tasks_from_file(self, tasks_file: Path, tasks_to_remove: List[Dict]) -> int:
+    def _remove_tasks_from_file(self, tasks_file: Path, tasks_to_remove: List[Dict],
+                                txn: DocumentTransaction) -> int:
         """
         Remove specific tasks from tasks.md file.
 
         Args:
             tasks_file: Path to tasks.md
             tasks_to_remove: List of task dicts to remove
+            txn: Transaction to stage the edit in
 
         Returns:
             Number of tasks removed
         """
-        content = tasks_file.read_text()
+        content = txn.read(tasks_file)
         lines = content.split('\n')
 
         # Extract task texts to remove
@@ -438,24 +471,26 @@ class ImportHistory:
 
             new_lines.append(line)
 
-        # Write back
-        tasks_file.write_text('\n'.join(new_lines))
+        # Stage for the batched write
+        txn.write(tasks_file, '\n'.join(new_lines))
 
         return removed_count
 
     def _remove_decisions_from_file(self, project_file: Path,
-                                     decisions_to_remove: List[Dict]) -> int:
+                                     decisions_to_remove: List[Dict],
+                                     txn: DocumentTransaction) -> int:
         """
         Remove specific decisions from PROJECT.md file.
 
         Args:
             project_file: Path to PROJECT.md
             decisions_to_remove: List of decision dicts to remove
+            txn: Transaction to stage the edit in
 
         Returns:
             Number of decisions removed
         """
-        content = project_file.read_text()
+        content = txn.read(project_file)
         lines = content.split('\n')
 
         # Extract decision texts to remove
@@ -489,23 +524,25 @@ class ImportHistory:
 
             new_lines.append(line)
 
-        project_file.write_text('\n'.join(new_lines))
+        txn.write(project_file, '\n'.join(new_lines))
 
         return removed_count
 
     def _remove_updates_from_file(self, project_file: Path,
-                                   updates_to_remove: List[Dict]) -> int:
+                                   updates_to_remove: List[Dict],
+                                   txn: DocumentTransaction) -> int:
         """
         Remove specific updates from PROJECT.md file.
 
         Args:
             project_file: Path to PROJECT.md
             updates_to_remove: List of update dicts to remove
+            txn: Transaction to stage the edit in
 
         Returns:
             Number of updates removed
         """
-        content = project_file.read_text()
+        content = txn.read(project_file)
         lines = content.split('\n')
 
         # Extract update texts to remove
@@ -539,7 +576,7 @@ class ImportHistory:
 
             new_lines.append(line)
 
-        project_file.write_text('\n'.join(new_lines))
+        txn.write(project_file, '\n'.join(new_lines))
 
         return removed_count
 
@@ -554,5 +591,5 @@ class ImportHistory:
             return []
 
     def _save_history(self, history: List[Dict]):
-        """Save history to JSON file"""
-        self.history_file.write_text(json.dumps(history, indent=2))
+        """Save history to JSON file (atomic replace)"""
+        atomic_write_text(self.history_file, json.dumps(history, indent=2))
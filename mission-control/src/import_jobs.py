@@ -0,0 +1,231 @@
+"""
+Durable import job queue - crash-safe progress of AI imports.
+
+Every file in the import directory becomes a job keyed by the SHA-256 of
+its content, stored in ~/projects/.mission-control/import-jobs.db:
+
+    discovered -> analyzed -> routed -> archived
+
+The analysis and the routing result are saved with the state, so an
+import interrupted at any point resumes where it stopped instead of
+calling the API again or adding the same tasks twice:
+
+- analyzed: the stored analysis is routed without a new API call
+- routed: the file is only recorded in history and archived
+- archived: the same content dropped again is archived as a duplicate
+
+Routing writes its files in one DocumentTransaction. Just before the
+commit the job records a hash of every file about to be written (the
+write plan); if the process dies around the commit, the plan tells on
+restart whether the writes landed.
+"""
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+try:
+    from .document_writer import DocumentTransaction
+except ImportError:
+    from document_writer import DocumentTransaction
+
+
+# Bump when the schema changes
+IMPORT_JOBS_VERSION = 1
+
+DISCOVERED = "discovered"
+ANALYZED = "analyzed"
+ROUTED = "routed"
+ARCHIVED = "archived"
+
+
+class ImportJob(NamedTuple):
+    """One import file's progress"""
+    content_hash: str
+    filename: str
+    state: str
+    analysis: Optional[Dict[str, Any]]     # analysis_to_dict() output (analyzed and later)
+    write_plan: Optional[Dict[str, str]]   # path -> sha256 of content about to be written
+    routing: Optional[Dict[str, Any]]      # route_analysis() result (routed and later)
+    import_id: Optional[str]               # ImportHistory entry (once recorded)
+
+
+def get_import_jobs_path(root_dir: Path) -> Path:
+    """Get the import job database for a projects root"""
+    return root_dir / ".mission-control" / "import-jobs.db"
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 hex digest of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _hash_text(text: Optional[str]) -> Optional[str]:
+    if text is None:
+        return None
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ImportJobQueue:
+    """
+    SQLite-backed job states. Use from one thread; every state change is
+    committed (and synced) before the method returns.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Open (or create) the job database.
+
+        Args:
+            db_path: Path to the SQLite database
+        """
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute("PRAGMA synchronous = FULL")
+        self._init_schema()
+
+    def discover(self, path: Path) -> ImportJob:
+        """
+        Register a file in the import directory.
+
+        Args:
+            path: Import file
+
+        Returns:
+            The file's job - new (discovered) or the existing one for the
+            same content, whatever state it reached
+        """
+        content_hash = hash_file(path)
+        now = datetime.now().isoformat()
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO jobs (content_hash, filename, state, created, updated) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (content_hash, path.name, DISCOVERED, now, now)
+            )
+        return self.get(content_hash)
+
+    def get(self, content_hash: str) -> Optional[ImportJob]:
+        """Current state of a job (None if unknown)"""
+        row = self.conn.execute(
+            "SELECT content_hash, filename, state, analysis, write_plan, routing, import_id "
+            "FROM jobs WHERE content_hash = ?", (content_hash,)
+        ).fetchone()
+        if row is None:
+            return None
+        content_hash, filename, state, analysis, write_plan, routing, import_id = row
+        return ImportJob(content_hash, filename, state, _loads(analysis), _loads(write_plan),
+                         _loads(routing), import_id)
+
+    def mark_analyzed(self, content_hash: str, analysis: Dict[str, Any]):
+        """Store the analysis; the job will not be analyzed again"""
+        self._update(content_hash, state=ANALYZED, analysis=json.dumps(analysis))
+
+    def record_write_plan(self, content_hash: str, txn: DocumentTransaction,
+                          routing: Dict[str, Any]):
+        """
+        Record the files a routing is about to write (call right before commit).
+
+        Args:
+            content_hash: Job key
+            txn: Transaction holding the routed edits
+            routing: Routing result as it will be if the commit succeeds
+        """
+        plan = {str(path): _hash_text(txn.read(path)) for path in txn.changed_files()}
+        self._update(content_hash, write_plan=json.dumps(plan),
+                     routing=json.dumps(routing, default=sorted))
+
+    def clear_write_plan(self, content_hash: str):
+        """The commit failed; nothing was written"""
+        self._update(content_hash, write_plan=None, routing=None)
+
+    def write_plan_applied(self, job: ImportJob) -> bool:
+        """
+        Whether a recorded write plan reached the disk.
+
+        True if any planned file already has its planned content (renames
+        are done back to back, so a partial commit counts as applied
+        rather than risking duplicate entries).
+        """
+        if not job.write_plan:
+            return job.write_plan is not None  # Empty plan: nothing to write
+        for path, expected in job.write_plan.items():
+            try:
+                current = _hash_text(Path(path).read_text())
+            except FileNotFoundError:
+                current = None
+            if current == expected:
+                return True
+        return False
+
+    def mark_routed(self, content_hash: str, routing: Dict[str, Any]):
+        """The routed changes are on disk"""
+        self._update(content_hash, state=ROUTED, write_plan=None,
+                     routing=json.dumps(routing, default=sorted))
+
+    def set_import_id(self, content_hash: str, import_id: str):
+        """Link the job to its ImportHistory entry"""
+        self._update(content_hash, import_id=import_id)
+
+    def mark_archived(self, content_hash: str):
+        """The file has left the import directory"""
+        self._update(content_hash, state=ARCHIVED)
+
+    def reopen(self, content_hash: str):
+        """Import the content again (its import was undone); the analysis is kept"""
+        self._update(content_hash, state=ANALYZED, write_plan=None, routing=None,
+                     import_id=None)
+
+    def jobs(self, state: Optional[str] = None) -> List[ImportJob]:
+        """All jobs, optionally only those in one state"""
+        query = "SELECT content_hash FROM jobs"
+        params: tuple = ()
+        if state is not None:
+            query += " WHERE state = ?"
+            params = (state,)
+        return [self.get(content_hash) for (content_hash,) in
+                self.conn.execute(query, params).fetchall()]
+
+    def close(self):
+        """Close the database connection"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def _update(self, content_hash: str, **fields):
+        fields["updated"] = datetime.now().isoformat()
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        with self.conn:
+            self.conn.execute(f"UPDATE jobs SET {assignments} WHERE content_hash = ?",
+                              (*fields.values(), content_hash))
+
+    def _init_schema(self):
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != IMPORT_JOBS_VERSION:
+            self.conn.executescript("DROP TABLE IF EXISTS jobs;")
+
+        self.conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS jobs (
+                content_hash TEXT PRIMARY KEY,
+                filename TEXT NOT NULL,
+                state TEXT NOT NULL,
+                analysis TEXT,
+                write_plan TEXT,
+                routing TEXT,
+                import_id TEXT,
+                created TEXT NOT NULL,
+                updated TEXT NOT NULL
+            );
+            PRAGMA user_version = {IMPORT_JOBS_VERSION};
+        """)
+
+
+def _loads(value: Optional[str]) -> Any:
+    return None if value is None else json.loads(value)
@@ -4,37 +4,68 @@ Import processor for meeting summaries and transcripts.
 Watches .import directory and routes files to appropriate projects.
 Uses AI to analyze content and extract structured data.
 """
-import re
+import io
 import os
+import threading
+from collections import OrderedDict
+from contextlib import redirect_stdout
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional
+from typing import Callable, Collection, List, Tuple, Dict, Optional
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 try:
     # Try relative imports first (when used as package)
-    from .content_analyzer import ContentAnalyzer
+    from .content_analyzer import ContentAnalyzer, analysis_to_dict, analysis_from_dict
     from .content_router import ContentRouter
     # from .staging import StagingManager  # PHASE 1: No longer needed
     from .import_history import ImportHistory  # PHASE 2: Undo/rollback system
+    from .analysis_pool import AnalysisPool, DEFAULT_CONCURRENCY
+    from .analysis_cache import AnalysisCache, get_analysis_cache_dir
+    from .import_jobs import (ImportJobQueue, get_import_jobs_path,
+                              DISCOVERED, ANALYZED, ARCHIVED)
+    from .project_shortlist import ProjectShortlist, DEFAULT_SHORTLIST_SIZE
+    from .document_writer import DocumentTransaction
     from .file_reader import read_file_content
+    from .project_registry import get_project_registry
+    from .mention_matcher import get_mention_matcher
+    from .import_watcher import is_import_candidate
+    from .loader import load_all_projects
     AI_ENABLED = True
 except ImportError:
     try:
         # Fall back to absolute imports (when used as standalone module)
-        from content_analyzer import ContentAnalyzer
+        from content_analyzer import ContentAnalyzer, analysis_to_dict, analysis_from_dict
         from content_router import ContentRouter
         # from staging import StagingManager  # PHASE 1: No longer needed
         from import_history import ImportHistory  # PHASE 2: Undo/rollback system
+        from analysis_pool import AnalysisPool, DEFAULT_CONCURRENCY
+        from analysis_cache import AnalysisCache, get_analysis_cache_dir
+        from import_jobs import (ImportJobQueue, get_import_jobs_path,
+                                 DISCOVERED, ANALYZED, ARCHIVED)
+        from project_shortlist import ProjectShortlist, DEFAULT_SHORTLIST_SIZE
+        from document_writer import DocumentTransaction
         from file_reader import read_file_content
+        from project_registry import get_project_registry
+        from mention_matcher import get_mention_matcher
+        from import_watcher import is_import_candidate
+        from loader import load_all_projects
         AI_ENABLED = True
     except ImportError:
         AI_ENABLED = False
-        # Try to import just the file reader
+        DEFAULT_CONCURRENCY = 4
+        DEFAULT_SHORTLIST_SIZE = 25
+        # Try to import just the file reader and registry
         try:
             from .file_reader import read_file_content
+            from .project_registry import get_project_registry
+            from .mention_matcher import get_mention_matcher
+            from .import_watcher import is_import_candidate
         except ImportError:
             from file_reader import read_file_content
+            from project_registry import get_project_registry
+            from mention_matcher import get_mention_matcher
+            from import_watcher import is_import_candidate
 
 
 @dataclass
@@ -48,12 +79,35 @@ class ProjectMention:
 
 @dataclass
 class ImportFile:
-    """Represents a file in the import directory"""
+    """
+    Represents a file in the import directory.
+
+    Scanning only records metadata; mentions are detected (reading the
+    file's content) the first time they are accessed.
+    """
     path: Path
     filename: str
-    mentions: List[ProjectMention]
     created: datetime
     processed: bool = False
+    size: int = 0
+    mtime_ns: int = 0
+    _detect: Optional[Callable[["ImportFile"], List[ProjectMention]]] = field(
+        default=None, repr=False, compare=False)
+    _mentions: Optional[List[ProjectMention]] = field(default=None, repr=False, compare=False)
+
+    @property
+    def mentions(self) -> List[ProjectMention]:
+        """Project mentions in the filename and content (detected on first access)"""
+        if self._mentions is None:
+            self._mentions = self._detect(self) if self._detect is not None else []
+        return self._mentions
+
+
+# Mentions already detected, shared by all processors:
+# path -> ((size, mtime_ns, registry version), mentions)
+MENTION_CACHE_SIZE = 256
+_mention_cache: "OrderedDict[Path, Tuple[Tuple[int, int, int], List[ProjectMention]]]" = OrderedDict()
+_mention_cache_lock = threading.Lock()
 
 
 class ImportProcessor:
@@ -78,50 +132,88 @@ class ImportProcessor:
         self.import_dir = import_dir
         self.projects_dir = projects_dir
         self.archive_dir = projects_dir / ".import-archive"
+        self.registry = get_project_registry(projects_dir)
 
         # Create directories
         self.import_dir.mkdir(parents=True, exist_ok=True)
         self.archive_dir.mkdir(parents=True, exist_ok=True)
 
-    def scan_import_directory(self) -> List[ImportFile]:
+    def scan_import_directory(self, paths: Optional[Collection[Path]] = None) -> List[ImportFile]:
         """
         Scan import directory for new files.
 
+        Only file metadata is read; each file's project mentions are
+        detected when first needed (ImportFile.mentions) and cached per
+        file version, so listing a large backlog stays cheap.
+
+        Args:
+            paths: Only consider these files (e.g. those an ImportWatcher
+                   reported complete); default is the whole directory
+
         Returns:
-            List of ImportFile objects
+            List of ImportFile objects, sorted by filename
         """
         import_files = []
 
-        for file_path in self.import_dir.glob('*'):
-            # Skip hidden files and directories
-            if file_path.name.startswith('.') or file_path.is_dir():
-                continue
-
-            # Skip README
-            if file_path.name == 'README.md':
+        candidates = self.import_dir.glob('*') if paths is None else paths
+        for file_path in sorted(candidates):
+            # Skip hidden files, directories, README and files gone meanwhile
+            if not is_import_candidate(file_path):
                 continue
 
             # Get file metadata
-            stat = file_path.stat()
-            created = datetime.fromtimestamp(stat.st_mtime)
-
-            # Detect project mentions
-            mentions = self.detect_project_mentions(file_path)
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
+                continue
 
             import_files.append(ImportFile(
                 path=file_path,
                 filename=file_path.name,
-                mentions=mentions,
-                created=created,
-                processed=False
+                created=datetime.fromtimestamp(stat.st_mtime),
+                processed=False,
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                _detect=self._cached_mentions
             ))
 
         return import_files
 
+    def _cached_mentions(self, import_file: ImportFile) -> List[ProjectMention]:
+        """
+        Project mentions of an import file, detected once per file version.
+
+        Args:
+            import_file: Scanned file (size and mtime identify the version)
+
+        Returns:
+            List of ProjectMention objects
+        """
+        # New or renamed projects change what can be mentioned
+        key = (import_file.size, import_file.mtime_ns, self.registry.version)
+        with _mention_cache_lock:
+            cached = _mention_cache.get(import_file.path)
+            if cached is not None and cached[0] == key:
+                _mention_cache.move_to_end(import_file.path)
+                return cached[1]
+
+        mentions = self.detect_project_mentions(import_file.path)
+        key = (import_file.size, import_file.mtime_ns, self.registry.version)  # May have rebuilt
+
+        with _mention_cache_lock:
+            _mention_cache[import_file.path] = (key, mentions)
+            _mention_cache.move_to_end(import_file.path)
+            while len(_mention_cache) > MENTION_CACHE_SIZE:
+                _mention_cache.popitem(last=False)
+        return mentions
+
     def detect_project_mentions(self, file_path: Path) -> List[ProjectMention]:
         """
         Detect project mentions in filename and content.
 
+        Hyphens in project names match a hyphen, a space or nothing. All
+        names are matched in one pass (see mention_matcher).
+
         Args:
             file_path: Path to file to analyze
 
@@ -130,16 +222,13 @@ class ImportProcessor:
         """
         mentions = []
 
-        # Get all project directories
-        project_names = self._get_all_project_names()
+        # One matcher for all project names, rebuilt when projects change
+        matcher = get_mention_matcher(self.registry)
 
         # Check filename
-        filename = file_path.name.lower()
-        for project_name in project_names:
-            # Create searchable pattern (handle hyphens, spaces, etc.)
-            pattern = project_name.lower().replace('-', '[-\\s]?')
-
-            if re.search(pattern, filename):
+        in_filename = matcher.find(file_path.name.lower())
+        for project_name in matcher.names:
+            if project_name in in_filename:
                 mentions.append(ProjectMention(
                     project_name=project_name,
                     confidence=0.9,
@@ -151,33 +240,25 @@ class ImportProcessor:
         try:
             content = read_file_content(file_path)
             if content:
-                content_lower = content.lower()
-
-                for project_name in project_names:
-                    # Create searchable pattern
-                    pattern = project_name.lower().replace('-', '[-\\s]?')
-
-                    # Find all matches in content
-                    for match in re.finditer(pattern, content_lower):
-                        # Extract context (50 chars before and after)
-                        start = max(0, match.start() - 50)
-                        end = min(len(content), match.end() + 50)
-                        context = content[start:end].strip()
-
-                        # Check if already found in filename
-                        already_found = any(
-                            m.project_name == project_name and m.source == 'filename'
-                            for m in mentions
-                        )
-
-                        if not already_found:
-                            mentions.append(ProjectMention(
-                                project_name=project_name,
-                                confidence=0.7,
-                                context=f"...{context}...",
-                                source='content'
-                            ))
-                            break  # Only add once per project
+                in_content = matcher.find(content.lower())
+
+                for project_name in matcher.names:
+                    # First match only; projects already found in the filename are skipped
+                    if project_name not in in_content or project_name in in_filename:
+                        continue
+
+                    # Extract context (50 chars before and after)
+                    match_start, match_end = in_content[project_name]
+                    start = max(0, match_start - 50)
+                    end = min(len(content), match_end + 50)
+                    context = content[start:end].strip()
+
+                    mentions.append(ProjectMention(
+                        project_name=project_name,
+                        confidence=0.7,
+                        context=f"...{context}...",
+                        source='content'
+                    ))
 
         except Exception as e:
             print(f"Error reading file {file_path}: {e}")
@@ -191,21 +272,34 @@ class ImportProcessor:
         Returns:
             List of project directory names
         """
-        project_names = []
+        return self.registry.names()
 
-        # Find all PROJECT.md files
-        for project_file in self.projects_dir.rglob("PROJECT.md"):
-            # Skip excluded directories
-            if any(pattern in str(project_file) for pattern in
-                   [".templates", "_archived", ".git", ".agents", ".docs", ".import"]):
-                continue
+    def _build_shortlist(self, size: int, projects: Optional[List] = None,
+                         report: Callable[[str], None] = print) -> ProjectShortlist:
+        """
+        Index project metadata for ranking candidates against content.
 
-            # Get directory name
-            project_dir = project_file.parent
-            project_name = project_dir.name
-            project_names.append(project_name)
+        Args:
+            size: Projects selected per prompt
+            projects: Projects the caller already loaded (default: load them)
+            report: Receives warnings (the loader's included)
 
-        return project_names
+        Returns:
+            ProjectShortlist over every routable project
+        """
+        if projects is None:
+            # The loader prints its warnings; pass them on instead, since the
+            # caller may be drawing a curses screen
+            output = io.StringIO()
+            try:
+                with redirect_stdout(output):
+                    projects = load_all_projects(self.projects_dir)
+            except Exception as e:
+                projects = []
+                report(f"Warning: Could not load project metadata for shortlist: {e}")
+            for line in output.getvalue().splitlines():
+                report(line)
+        return ProjectShortlist.from_projects(projects, self._get_all_project_names(), size)
 
     def route_file(self, import_file: ImportFile, project_name: str,
                    copy: bool = True) -> Optional[Path]:
@@ -272,10 +366,7 @@ class ImportProcessor:
         Returns:
             Path to project directory, or None if not found
         """
-        for project_file in self.projects_dir.rglob("PROJECT.md"):
-            if project_file.parent.name == project_name:
-                return project_file.parent
-        return None
+        return self.registry.find(project_name)
 
     def process_file(self, import_file: ImportFile,
                      auto_route: bool = True) -> Dict[str, any]:
@@ -335,21 +426,39 @@ class ImportProcessor:
         # Move file to archive
         import_file.path.rename(archive_path)
 
-    def process_all(self, auto_route: bool = True, use_ai: bool = False) -> Dict[str, any]:
+    def process_all(self, auto_route: bool = True, use_ai: bool = False,
+                    progress: Optional[Callable[[str], None]] = None,
+                    max_concurrency: int = DEFAULT_CONCURRENCY,
+                    shortlist_size: int = DEFAULT_SHORTLIST_SIZE,
+                    paths: Optional[Collection[Path]] = None,
+                    reimport_undone: bool = True,
+                    projects: Optional[List] = None) -> Dict[str, any]:
         """
         Process all files in import directory.
 
         Args:
             auto_route: If True, automatically route high-confidence matches
             use_ai: If True, use AI to analyze content and extract structured data
+            progress: Called with status messages during AI processing
+                      (defaults to print)
+            max_concurrency: Files analyzed at once in AI mode
+            shortlist_size: Candidate projects per prompt in AI mode (0 = all)
+            paths: Only process these files (default: the whole directory)
+            reimport_undone: In AI mode, import files whose earlier import
+                             was undone again (False leaves them in place)
+            projects: Already loaded projects for the AI shortlist
+                      (default: load them)
 
         Returns:
             Summary of processing results
         """
         if use_ai:
-            return self.process_all_with_ai()
+            return self.process_all_with_ai(progress, max_concurrency=max_concurrency,
+                                            shortlist_size=shortlist_size, paths=paths,
+                                            reimport_undone=reimport_undone,
+                                            projects=projects)
 
-        import_files = self.scan_import_directory()
+        import_files = self.scan_import_directory(paths)
 
         summary = {
             'total_files': len(import_files),
@@ -373,28 +482,66 @@ class ImportProcessor:
 
         return summary
 
-    def process_all_with_ai(self) -> Dict[str, any]:
+    def process_all_with_ai(self, progress: Optional[Callable[[str], None]] = None,
+                            analyzer=None,
+                            max_concurrency: int = DEFAULT_CONCURRENCY,
+                            shortlist_size: int = DEFAULT_SHORTLIST_SIZE,
+                            paths: Optional[Collection[Path]] = None,
+                            reimport_undone: bool = True,
+                            projects: Optional[List] = None) -> Dict[str, any]:
         """
         Process all files using AI content analysis.
 
         Extracts tasks, decisions, and updates from content and applies them immediately.
+        Up to max_concurrency files are analyzed at once; results are routed
+        one at a time in directory order, so file writes never race.
+        A file whose changes could not be written is left in the import
+        directory so the next run retries it.
+
+        Args:
+            progress: Called with status messages (defaults to print); the
+                      background import worker uses it to report to the UI
+            analyzer: Object with analyze_file(path, known_projects)
+                      (defaults to a ContentAnalyzer using ANTHROPIC_API_KEY
+                      and the on-disk analysis cache)
+            max_concurrency: Files analyzed at once (1 = sequential)
+            shortlist_size: Projects listed in each prompt, ranked against the
+                            content, plus HOLDING (0 = list every project;
+                            only used for the default analyzer)
+            paths: Only process these files (default: the whole import directory)
+            reimport_undone: Apply the stored analysis again to files whose
+                             import was undone (undo restores the source
+                             file). The background worker passes False so
+                             an undo is not reverted as soon as the file
+                             reappears; those files stay in the import
+                             directory until an explicit run.
+            projects: Already loaded projects to rank for the shortlist
+                      (default: load them from disk)
 
         Returns:
             Summary of AI processing results
         """
+        report = progress or print
+
         if not AI_ENABLED:
             raise RuntimeError("AI processing not available. Install: pip install anthropic")
 
-        # Check for API key
-        api_key = os.environ.get('ANTHROPIC_API_KEY')
-        if not api_key:
-            raise ValueError(
-                "ANTHROPIC_API_KEY environment variable not set. "
-                "AI processing requires Claude API access."
-            )
+        if analyzer is None:
+            # Check for API key
+            api_key = os.environ.get('ANTHROPIC_API_KEY')
+            if not api_key:
+                raise ValueError(
+                    "ANTHROPIC_API_KEY environment variable not set. "
+                    "AI processing requires Claude API access."
+                )
+            cache = AnalysisCache(get_analysis_cache_dir(self.projects_dir), warn=report)
+            shortlist = None
+            if shortlist_size > 0:
+                shortlist = self._build_shortlist(shortlist_size, projects, report)
+            analyzer = ContentAnalyzer(api_key, cache=cache, shortlist=shortlist)
 
         # Initialize AI components
-        analyzer = ContentAnalyzer(api_key)
+        pool = AnalysisPool(analyzer, max_workers=max_concurrency)
         router = ContentRouter(self.projects_dir)
 
         # PHASE 2: Initialize import history tracker
@@ -405,7 +552,7 @@ class ImportProcessor:
         known_projects = self._get_all_project_names()
 
         # Scan import directory
-        import_files = self.scan_import_directory()
+        import_files = self.scan_import_directory(paths)
 
         summary = {
             'total_files': len(import_files),
@@ -417,20 +564,87 @@ class ImportProcessor:
             'holding_items': 0,
             'errors': [],
             'results': [],
-            'import_ids': []  # PHASE 2: Track import IDs for history
+            'import_ids': [],  # PHASE 2: Track import IDs for history
+            'resumed': 0,      # Routed in an interrupted run, finished now
+            'duplicates': 0,   # Same content imported before, archived unchanged
+            'off_shortlist': 0,  # Items for a known project the prompt's shortlist left out
+            'undone_kept': []  # Filenames left in place because their import was undone
         }
 
+        # Durable per-file progress: resume interrupted imports, skip duplicates
+        jobs = ImportJobQueue(get_import_jobs_path(self.projects_dir))
+        undone_ids = {entry['id'] for entry in history.get_recent_imports(include_undone=True)
+                      if entry.get('undone')}
+
+        # Only files that have no stored analysis (first copy of each content) hit the API
+        pending = []  # (import_file, content_hash, needs_analysis)
+        queued = set()
         for import_file in import_files:
             try:
-                print(f"Analyzing: {import_file.filename}")
-
-                # Analyze content with AI
-                analysis = analyzer.analyze_file(import_file.path, known_projects)
+                job = jobs.discover(import_file.path)
+            except OSError as e:
+                summary['errors'].append(f"Error processing {import_file.filename}: {e}")
+                continue
+            if job.state == ARCHIVED and job.import_id in undone_ids:
+                if not reimport_undone:
+                    report(f"Kept: {import_file.filename} (import was undone; "
+                           f"run process-imports to import it again)")
+                    summary['undone_kept'].append(import_file.filename)
+                    continue
+                jobs.reopen(job.content_hash)  # Import was undone: apply it again
+            needs_analysis = job.state == DISCOVERED and job.content_hash not in queued
+            queued.add(job.content_hash)
+            pending.append((import_file, job.content_hash, needs_analysis))
+
+        to_analyze = [import_file.path for import_file, _, needs in pending if needs]
+        if to_analyze:
+            report(f"Analyzing {len(to_analyze)} file(s), up to {pool.max_workers} at a time")
+
+        # Analyses finish in any order but arrive here in file order
+        outcomes = pool.analyze_files(to_analyze, known_projects)
+        for position, (import_file, content_hash, needs_analysis) in enumerate(pending, 1):
+            try:
+                if needs_analysis:
+                    outcome = next(outcomes)
+                    if outcome.error is not None:
+                        raise outcome.error
+                    analysis = outcome.analysis
+                    jobs.mark_analyzed(content_hash, analysis_to_dict(analysis))
+                    report(f"Analyzed: {import_file.filename} ({position}/{len(pending)})")
+
+                job = jobs.get(content_hash)
+                if job.state == ARCHIVED:
+                    report(f"Skipped: {import_file.filename} (same content already imported)")
+                    summary['duplicates'] += 1
+                    self._archive_file(import_file)
+                    continue
+                if job.state == DISCOVERED:
+                    # Another copy of this content failed analysis in this run
+                    continue
 
+                analysis = analysis_from_dict(job.analysis)
                 summary['analyzed'] += 1
 
-                # Apply directly to projects
-                routing_result = router.route_analysis(analysis, import_file.filename)
+                if job.state == ANALYZED and job.write_plan is not None and jobs.write_plan_applied(job):
+                    # Interrupted right after routing wrote its files
+                    jobs.mark_routed(content_hash, job.routing)
+                    job = jobs.get(content_hash)
+
+                if job.state == ANALYZED:
+                    # Apply directly to projects
+                    routing_result = router.route_analysis(
+                        analysis, import_file.filename,
+                        before_commit=lambda txn, result: jobs.record_write_plan(content_hash, txn, result)
+                    )
+                    if routing_result.get('committed', True):
+                        jobs.mark_routed(content_hash, routing_result)
+                    else:
+                        jobs.clear_write_plan(content_hash)
+                else:
+                    # Routed in an earlier run that stopped before archiving
+                    routing_result = job.routing
+                    summary['resumed'] += 1
+                    report(f"Resumed: {import_file.filename} (already routed)")
 
                 summary['tasks_added'] += routing_result['tasks_added']
                 summary['decisions_added'] += routing_result['decisions_added']
@@ -439,16 +653,22 @@ class ImportProcessor:
                 summary['holding_items'] += routing_result['holding_items']
                 summary['errors'].extend(routing_result['errors'])
 
+                if not routing_result.get('committed', True):
+                    # Nothing was written (e.g. a file changed meanwhile) - retry next run
+                    continue
+
                 # PHASE 2: Add to import history for undo functionality
-                try:
-                    import_id = history.add_entry(
-                        import_file.filename,
-                        import_file.path,
-                        routing_result
-                    )
-                    summary['import_ids'].append(import_id)
-                except Exception as e:
-                    print(f"Warning: Failed to add import history: {e}")
+                if job.import_id is None:
+                    try:
+                        import_id = history.add_entry(
+                            import_file.filename,
+                            import_file.path,
+                            routing_result
+                        )
+                        jobs.set_import_id(content_hash, import_id)
+                        summary['import_ids'].append(import_id)
+                    except Exception as e:
+                        report(f"Warning: Failed to add import history: {e}")
 
                 summary['results'].append({
                     'filename': import_file.filename,
@@ -461,11 +681,15 @@ class ImportProcessor:
 
                 # Archive file after processing
                 self._archive_file(import_file)
+                jobs.mark_archived(content_hash)
 
             except Exception as e:
                 error_msg = f"Error processing {import_file.filename}: {e}"
                 summary['errors'].append(error_msg)
-                print(f"ERROR: {error_msg}")
+                report(f"ERROR: {error_msg}")
+
+        jobs.close()
+        summary['off_shortlist'] = getattr(analyzer, 'off_shortlist', 0)
 
         # Convert set to list for JSON serialization
         summary['projects_updated'] = list(summary['projects_updated'])
@@ -526,16 +750,17 @@ class ImportProcessor:
                     'updates': updates
                 }
 
-                # Route each type separately
+                # Route each type separately (written once per staging file)
                 source_filename = data['original_file']
+                txn = DocumentTransaction()
 
                 for task in tasks:
                     try:
                         if task.project == "HOLDING":
-                            router._add_to_holding(task, source_filename)
+                            router._add_to_holding(task, source_filename, txn)
                             summary['holding_items'] += 1
                         else:
-                            router._add_task_to_project(task, source_filename)
+                            router._add_task_to_project(task, source_filename, txn)
                             summary['tasks_added'] += 1
                             summary['projects_updated'].add(task.project)
                     except Exception as e:
@@ -544,10 +769,10 @@ class ImportProcessor:
                 for decision in decisions:
                     try:
                         if decision.project == "HOLDING":
-                            router._add_to_holding(decision, source_filename)
+                            router._add_to_holding(decision, source_filename, txn)
                             summary['holding_items'] += 1
                         else:
-                            router._add_decision_to_project(decision, source_filename)
+                            router._add_decision_to_project(decision, source_filename, txn)
                             summary['decisions_added'] += 1
                             summary['projects_updated'].add(decision.project)
                     except Exception as e:
@@ -556,15 +781,17 @@ class ImportProcessor:
                 for update in updates:
                     try:
                         if update.project == "HOLDING":
-                            router._add_to_holding(update, source_filename)
+                            router._add_to_holding(update, source_filename, txn)
                             summary['holding_items'] += 1
                         else:
-                            router._add_update_to_project(update, source_filename)
+                            router._add_update_to_project(update, source_filename, txn)
                             summary['updates_applied'] += 1
                             summary['projects_updated'].add(update.project)
                     except Exception as e:
                         summary['errors'].append(f"Update routing error: {e}")
 
+                txn.commit()
+
                 summary['results'].append({
                     'filename': source_filename,
                     'tasks': len(tasks),
@@ -0,0 +1,339 @@
+"""
+Event-driven watcher for the import directory.
+
+Reports files dropped into the import directory once they are complete,
+instead of rescanning the directory on a timer:
+
+- Linux: inotify (via ctypes). A file is ready on close-after-write or
+  when it is moved in; files written without a close event are ready
+  once their size stops changing.
+- macOS/BSD: kqueue on the directory. Directory changes trigger a
+  metadata-only listing; new files are ready once their size stops changing.
+- Elsewhere (or if neither is available): a metadata-only listing every
+  poll_interval seconds, with the same size-stability check.
+
+An idle directory costs nothing with inotify/kqueue: the watcher blocks
+in select() until the kernel reports a change.
+
+    watcher = ImportWatcher(import_dir)
+    while True:
+        for path in watcher.wait(timeout=None):
+            ...
+"""
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# Seconds a file's size must stay unchanged before it counts as complete
+SETTLE_SECONDS = 0.5
+
+# Directory listing interval for the polling backend
+POLL_INTERVAL = 1.0
+
+# inotify(7) event bits
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+              IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+# (size, mtime_ns) of a file
+Signature = Tuple[int, int]
+
+
+def is_import_candidate(path: Path) -> bool:
+    """True for files in the import directory that should be imported"""
+    return not path.name.startswith('.') and path.name != 'README.md' and path.is_file()
+
+
+class ImportWatcher:
+    """
+    Reports complete files in a directory as they arrive.
+    """
+
+    def __init__(self, directory: Path, settle: float = SETTLE_SECONDS,
+                 poll_interval: float = POLL_INTERVAL, backend: str = "auto"):
+        """
+        Start watching a directory.
+
+        Files already in the directory are reported by the first wait()
+        calls once they are stable.
+
+        Args:
+            directory: Directory to watch
+            settle: Seconds a file's size must be unchanged to be complete
+            poll_interval: Listing interval for the polling backend
+            backend: "inotify", "kqueue", "polling" or "auto" (best available)
+        """
+        self.directory = directory
+        self.settle = settle
+        self.poll_interval = poll_interval
+
+        self._pending: Dict[Path, Tuple[float, Optional[Signature]]] = {}  # path -> (deadline, signature)
+        self._reported: Dict[Path, Signature] = {}  # Signature each ready file was reported with
+        self._ready: List[Path] = []
+        self._next_poll = 0.0
+
+        self._fd: Optional[int] = None       # inotify fd
+        self._kqueue = None
+        self._dir_fd: Optional[int] = None   # Directory fd watched by kqueue
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+
+        self.backend = self._open_backend(backend)
+        self._sweep()
+
+    def wait(self, timeout: Optional[float] = None) -> List[Path]:
+        """
+        Block until files are ready, wake() is called or timeout expires.
+
+        Args:
+            timeout: Seconds to wait at most (None = no limit, 0 = just check)
+
+        Returns:
+            Newly complete files (each reported once per version of the file)
+        """
+        end = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self._settle_due()
+            if self._ready:
+                ready, self._ready = self._ready, []
+                return ready
+
+            now = time.monotonic()
+            wakeups = [deadline for deadline, _ in self._pending.values()]
+            if self.backend == "polling":
+                wakeups.append(self._next_poll)
+            if end is not None:
+                wakeups.append(end)
+            delay = max(0.0, min(wakeups) - now) if wakeups else None
+
+            fds = [self._wake_r]
+            if self._fd is not None:
+                fds.append(self._fd)
+            elif self._kqueue is not None:
+                fds.append(self._kqueue.fileno())
+
+            try:
+                readable, _, _ = select.select(fds, [], [], delay)
+            except InterruptedError:
+                continue
+
+            if self._wake_r in readable:
+                self._drain_wake()
+                self._settle_due()
+                ready, self._ready = self._ready, []
+                return ready
+            if self._fd is not None and self._fd in readable:
+                self._read_inotify()
+            elif self._kqueue is not None and readable:
+                self._kqueue.control(None, 16, 0)  # Drain; the listing finds what changed
+                self._sweep()
+            elif self.backend == "polling" and time.monotonic() >= self._next_poll:
+                self._sweep()
+
+            if end is not None and time.monotonic() >= end:
+                self._settle_due()
+                ready, self._ready = self._ready, []
+                return ready
+
+    def wake(self):
+        """Make a blocked wait() return now (safe from any thread)"""
+        try:
+            os.write(self._wake_w, b"x")
+        except BlockingIOError:
+            pass  # Already signalled
+
+    def close(self):
+        """Stop watching and release file descriptors"""
+        for fd in (self._fd, self._dir_fd, self._wake_r, self._wake_w):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        if self._kqueue is not None:
+            self._kqueue.close()
+        self._fd = self._dir_fd = self._kqueue = None
+
+    def __enter__(self) -> "ImportWatcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    # --- backends ---
+
+    def _open_backend(self, backend: str) -> str:
+        if backend in ("auto", "inotify") and sys.platform.startswith("linux"):
+            try:
+                self._open_inotify()
+                return "inotify"
+            except (OSError, AttributeError):  # AttributeError: libc without inotify
+                if backend == "inotify":
+                    raise
+        if backend in ("auto", "kqueue") and hasattr(select, "kqueue"):
+            try:
+                self._open_kqueue()
+                return "kqueue"
+            except OSError:
+                if backend == "kqueue":
+                    raise
+        if backend not in ("auto", "polling"):
+            raise OSError(f"{backend} is not available on this platform")
+        return "polling"
+
+    def _open_inotify(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(fd, os.fsencode(str(self.directory)), WATCH_MASK) < 0:
+            err = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(err, f"inotify_add_watch failed for {self.directory}")
+        self._fd = fd
+
+    def _open_kqueue(self):
+        self._dir_fd = os.open(self.directory, getattr(os, "O_EVTONLY", os.O_RDONLY))
+        self._kqueue = select.kqueue()
+        self._kqueue.control([select.kevent(
+            self._dir_fd, filter=select.KQ_FILTER_VNODE,
+            flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+            fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND | select.KQ_NOTE_RENAME
+        )], 0, 0)
+
+    def _read_inotify(self):
+        """Apply queued inotify events"""
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            except OSError as e:
+                if e.errno == errno.EINTR:
+                    continue
+                raise
+
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    self._sweep()  # Events were lost
+                    continue
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                    # Directory itself went away: keep going by listing it
+                    os.close(self._fd)
+                    self._fd = None
+                    self.backend = "polling"
+                    return
+                if not name or mask & IN_ISDIR:
+                    continue
+
+                path = self.directory / os.fsdecode(name)
+                if mask & (IN_DELETE | IN_MOVED_FROM):
+                    self._pending.pop(path, None)
+                    self._reported.pop(path, None)
+                elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                    self._mark_ready(path)
+                else:  # IN_CREATE, IN_MODIFY: still being written
+                    self._mark_pending(path)
+
+    # --- bookkeeping ---
+
+    def _sweep(self):
+        """List the directory (metadata only) and track new or changed files"""
+        self._next_poll = time.monotonic() + self.poll_interval
+        present = set()
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            return
+        for entry in entries:
+            path = Path(entry.path)
+            if entry.name.startswith('.') or entry.name == 'README.md':
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            present.add(path)
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if self._reported.get(path) != signature and path not in self._pending:
+                self._pending[path] = (time.monotonic() + self.settle, signature)
+
+        for path in list(self._reported):
+            if path not in present:
+                del self._reported[path]
+
+    def _mark_pending(self, path: Path):
+        """A file changed: wait for it to settle"""
+        if not is_import_candidate(path):
+            return
+        self._pending[path] = (time.monotonic() + self.settle, _signature(path))
+
+    def _mark_ready(self, path: Path):
+        """A file was closed after writing or moved in: complete now"""
+        self._pending.pop(path, None)
+        if not is_import_candidate(path):
+            return
+        signature = _signature(path)
+        if signature is not None and self._reported.get(path) != signature:
+            self._reported[path] = signature
+            self._ready.append(path)
+
+    def _settle_due(self):
+        """Move pending files whose size held still through the settle time to ready"""
+        now = time.monotonic()
+        for path, (deadline, signature) in list(self._pending.items()):
+            if deadline > now:
+                continue
+            current = _signature(path)
+            if current is None:
+                del self._pending[path]
+            elif current != signature:
+                self._pending[path] = (now + self.settle, current)  # Still growing
+            else:
+                self._mark_ready(path)
+
+    def _drain_wake(self):
+        try:
+            while os.read(self._wake_r, 64):
+                pass
+        except BlockingIOError:
+            pass
+
+
+def _signature(path: Path) -> Optional[Signature]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
@@ -0,0 +1,199 @@
+"""
+Background import worker - runs the AI import pipeline off the UI thread.
+
+The dashboard used to call ImportProcessor.process_all() inside its event
+loop, freezing the screen for the length of every Claude API call. The
+worker runs the scan + analyze + route pipeline on a daemon thread and
+reports through a queue of ImportEvents that the UI drains once per frame
+with poll(), so keystrokes stay responsive while imports run.
+
+The thread sleeps in an ImportWatcher until a file in the import
+directory is complete, so new files are imported within about a second
+and an idle directory is never rescanned. Files that fail to import are
+retried after retry_interval seconds. A file restored by undoing its
+import is left alone (only an explicit run imports it again).
+"""
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+try:
+    from .import_processor import ImportProcessor
+    from .import_watcher import ImportWatcher
+except ImportError:
+    from import_processor import ImportProcessor
+    from import_watcher import ImportWatcher
+
+
+class ImportEvent(NamedTuple):
+    """One progress report from the worker"""
+    kind: str                          # "started", "progress", "finished", "error"
+    message: str
+    summary: Optional[Dict[str, Any]] = None  # process_all() summary ("finished" only)
+
+
+class ImportWorker:
+    """
+    Imports files as they land in the import directory, on a background thread.
+
+    Usage:
+        worker = ImportWorker(import_dir, projects_root)
+        worker.start()
+        ...
+        for event in worker.poll():   # once per UI frame, never blocks
+            ...
+        worker.stop()
+    """
+
+    def __init__(self, import_dir: Path, projects_dir: Path, retry_interval: float = 30.0,
+                 projects: Optional[Callable[[], List]] = None):
+        """
+        Initialize the worker.
+
+        Args:
+            import_dir: Directory files are dropped into
+            projects_dir: Root projects directory
+            retry_interval: Seconds before files that failed to import are retried
+            projects: Returns the projects the UI has loaded, ranked for the AI
+                      shortlist instead of loading them again (optional)
+        """
+        self.import_dir = import_dir
+        self.projects_dir = projects_dir
+        self.retry_interval = retry_interval
+        self.projects = projects
+        self.busy = False  # True while a batch is being processed
+
+        self._events: "queue.Queue[ImportEvent]" = queue.Queue()
+        self._wake = threading.Event()  # trigger(): import everything now
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watcher: Optional[ImportWatcher] = None
+        self._failed: List[Path] = []  # Files left behind by the last run
+        self._retry_at: Optional[float] = None
+
+    def start(self):
+        """Start watching (files already waiting are imported once stable)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self.import_dir.mkdir(parents=True, exist_ok=True)
+        self._watcher = ImportWatcher(self.import_dir)
+        self._thread = threading.Thread(target=self._run, name="import-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """
+        Ask the worker to exit after the current file.
+
+        An API call in flight is not interrupted; the daemon thread is
+        abandoned if it does not finish within timeout.
+        """
+        self._stopping.set()
+        if self._watcher is not None:
+            self._watcher.wake()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def trigger(self):
+        """Import everything in the import directory now"""
+        self._wake.set()
+        if self._watcher is not None:
+            self._watcher.wake()
+
+    def poll(self) -> List[ImportEvent]:
+        """
+        Drain pending events without blocking.
+
+        Returns:
+            Events in the order they were reported (usually empty)
+        """
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _run(self):
+        watcher = self._watcher
+        try:
+            while not self._stopping.is_set():
+                timeout = None
+                if self._retry_at is not None:
+                    timeout = max(0.0, self._retry_at - time.monotonic())
+                ready = watcher.wait(timeout)
+                if self._stopping.is_set():
+                    break
+
+                if self._wake.is_set():
+                    self._wake.clear()
+                    self.run_once()
+                    continue
+
+                retry_due = self._retry_at is not None and time.monotonic() >= self._retry_at
+                if retry_due:
+                    # run_once() schedules whatever fails again
+                    ready = self._failed + [path for path in ready if path not in self._failed]
+                    self._failed, self._retry_at = [], None
+                if ready:
+                    self.run_once(ready, reimport_undone=False)
+        finally:
+            watcher.close()
+
+    def run_once(self, paths: Optional[List[Path]] = None,
+                 reimport_undone: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Import files from the import directory (on this thread).
+
+        Args:
+            paths: Files to import (default: everything in the import directory)
+            reimport_undone: Import files whose earlier import was undone again
+
+        Returns:
+            process_all() summary, or None if there was nothing to import
+            or the run failed
+        """
+        try:
+            processor = ImportProcessor(self.import_dir, self.projects_dir)
+            import_files = processor.scan_import_directory(paths)
+        except Exception as e:
+            self._events.put(ImportEvent("error", f"Import scan failed: {e}"))
+            self._schedule_retry(paths or [])
+            return None
+
+        if not import_files:
+            self._failed, self._retry_at = [], None
+            return None
+
+        summary = None
+        self.busy = True
+        self._events.put(ImportEvent("started", f"Importing {len(import_files)} file(s)..."))
+        try:
+            summary = processor.process_all(
+                auto_route=False, use_ai=True,
+                progress=lambda message: self._events.put(ImportEvent("progress", message)),
+                paths=[f.path for f in import_files],
+                reimport_undone=reimport_undone,
+                projects=self.projects() if self.projects is not None else None
+            )
+            self._events.put(ImportEvent(
+                "finished", f"Imported {summary['analyzed']} file(s)", summary
+            ))
+            return summary
+        except Exception as e:
+            self._events.put(ImportEvent("error", f"Import failed: {e}"))
+            return None
+        finally:
+            # Imported files are archived; whatever is still here is retried later
+            # (except files kept because their import was undone)
+            kept = set(summary['undone_kept']) if summary else set()
+            self._schedule_retry([f.path for f in import_files
+                                  if f.path.exists() and f.filename not in kept])
+            self.busy = False
+
+    def _schedule_retry(self, paths: List[Path]):
+        """Retry these files after retry_interval (nothing to retry if empty)"""
+        self._failed = [path for path in paths if path.exists()]
+        self._retry_at = time.monotonic() + self.retry_interval if self._failed else None
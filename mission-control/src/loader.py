@@ -2,12 +2,36 @@
 Project loader - discovers and parses PROJECT.md files.
 """
 import re
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable
 from datetime import date
 
-from .models import Project
-from .utils.date_utils import parse_date
+try:
+    from .models import Project, LazyProject, ProjectDetails, normalize_label
+    from .project_index import ProjectIndex
+    from .project_collection import SORT_KEYS
+    from .utils.date_utils import parse_date
+except ImportError:
+    # Standalone scripts (process-imports, watch-imports) put src/ on sys.path
+    from models import Project, LazyProject, ProjectDetails, normalize_label
+    from project_index import ProjectIndex
+    from project_collection import SORT_KEYS
+    from utils.date_utils import parse_date
+
+
+# Directory names skipped during project discovery and name lookups
+# (".import" also covers the ".import-archive" inbox archive)
+DEFAULT_EXCLUDE_PATTERNS = [".templates", "_archived", ".git", ".agents", ".docs", ".import"]
+
+
+def is_excluded(path: Path, exclude_patterns: Optional[List[str]] = None) -> bool:
+    """Returns True if path falls under an excluded directory"""
+    if exclude_patterns is None:
+        exclude_patterns = DEFAULT_EXCLUDE_PATTERNS
+    return any(pattern in str(path) for pattern in exclude_patterns)
 
 
 def discover_projects(root_dir: Path, exclude_patterns: Optional[List[str]] = None) -> List[Path]:
@@ -21,15 +45,12 @@ def discover_projects(root_dir: Path, exclude_patterns: Optional[List[str]] = No
     Returns:
         List of Path objects pointing to PROJECT.md files
     """
-    if exclude_patterns is None:
-        exclude_patterns = [".templates", "_archived", ".git", ".agents", ".docs"]
-
     project_files = []
 
     # Use glob to find all PROJECT.md files
     for project_file in root_dir.rglob("PROJECT.md"):
         # Check if any excluded pattern is in the path
-        if any(pattern in str(project_file) for pattern in exclude_patterns):
+        if is_excluded(project_file, exclude_patterns):
             continue
 
         project_files.append(project_file)
@@ -37,6 +58,107 @@ def discover_projects(root_dir: Path, exclude_patterns: Optional[List[str]] = No
     return sorted(project_files)
 
 
+# Compiled once; matched per line by the section scanner
+UPDATE_LINE_PATTERN = re.compile(r'^- (\d{4}-\d{2}-\d{2}): (.+?)(?:\(from .+?\))?$')
+
+# Leading markers that make a Recent Updates entry an "update" rather than a decision
+UPDATE_EMOJIS = ['✓', '⚠️', '•', '✅', '❌', '⚡', '🔴', '🟡', '🟢']
+
+PURPOSE_MARKER = '**Purpose**:'
+CONTEXT_MARKER = '**Context**:'
+
+
+@dataclass
+class ProjectSections:
+    """Pieces of a PROJECT.md collected by scan_project_document()"""
+    frontmatter: Optional[str] = None
+    purpose: Optional[str] = None
+    context: Optional[str] = None
+    recent_update_lines: List[str] = field(default_factory=list)
+
+    @property
+    def description(self) -> Optional[str]:
+        """Combined Purpose and Context text from the Overview section"""
+        parts = [part for part in (self.purpose, self.context) if part]
+        return ' '.join(parts) if parts else None
+
+
+def scan_project_document(lines: Iterable[str], details: bool = True) -> ProjectSections:
+    """
+    Single-pass, line-oriented scan of a PROJECT.md document.
+
+    Collects the YAML frontmatter, the Purpose/Context lines of the
+    ## Overview section and the lines of the ### Recent Updates section
+    in one sweep. Sections end at the next line starting with '##'.
+    Scanning stops as soon as everything requested has been collected,
+    so long logs at the end of a file are never read.
+
+    Args:
+        lines: Document lines (an open file object works and is streamed)
+        details: Also collect Overview and Recent Updates (default: True).
+                 If False, stop right after the frontmatter.
+
+    Returns:
+        ProjectSections with whatever was found
+    """
+    sections = ProjectSections()
+    frontmatter_lines = None
+    state = None  # None, "frontmatter", "overview_heading", "overview", "updates"
+    overview_done = not details
+    updates_done = not details
+
+    for raw_line in lines:
+        line = raw_line.rstrip('\n')
+        stripped = line.rstrip()
+
+        if state == "frontmatter":
+            if stripped == '---':
+                sections.frontmatter = '\n'.join(frontmatter_lines)
+                state = None
+                if overview_done and updates_done:
+                    break
+            else:
+                frontmatter_lines.append(line)
+            continue
+
+        if state == "overview_heading":
+            # "## Overview" must be followed by a blank line to count
+            state = "overview" if not stripped else None
+            if state == "overview":
+                continue
+
+        # Any '##' line closes the section being collected
+        if line.startswith('##'):
+            if state == "overview":
+                overview_done = True
+            elif state == "updates":
+                updates_done = True
+            state = None
+
+        if state == "overview":
+            if sections.purpose is None and PURPOSE_MARKER in line:
+                sections.purpose = line.split(PURPOSE_MARKER, 1)[1].strip() or None
+            if sections.context is None and CONTEXT_MARKER in line:
+                sections.context = line.split(CONTEXT_MARKER, 1)[1].strip() or None
+            if sections.purpose is not None and sections.context is not None:
+                overview_done = True
+                state = None
+        elif state == "updates":
+            sections.recent_update_lines.append(line)
+        elif sections.frontmatter is None and frontmatter_lines is None and stripped == '---':
+            frontmatter_lines = []
+            state = "frontmatter"
+        elif not overview_done and stripped.endswith('## Overview'):
+            state = "overview_heading"
+        elif not updates_done and stripped.endswith('### Recent Updates'):
+            state = "updates"
+
+        if sections.frontmatter is not None and overview_done and updates_done:
+            break
+
+    return sections
+
+
 def extract_yaml_frontmatter(content: str) -> Optional[str]:
     """
     Extract YAML frontmatter from PROJECT.md content.
@@ -49,14 +171,7 @@ def extract_yaml_frontmatter(content: str) -> Optional[str]:
     Returns:
         YAML frontmatter string (without ---), or None if not found
     """
-    # Match YAML frontmatter between --- markers
-    pattern = r'^---\s*\n(.*?)\n---\s*\n'
-    match = re.search(pattern, content, re.DOTALL | re.MULTILINE)
-
-    if match:
-        return match.group(1)
-
-    return None
+    return scan_project_document(content.split('\n'), details=False).frontmatter
 
 
 def extract_overview_description(content: str) -> Optional[str]:
@@ -69,29 +184,7 @@ def extract_overview_description(content: str) -> Optional[str]:
     Returns:
         Combined Purpose and Context text, or None if not found
     """
-    # Look for ## Overview section
-    overview_pattern = r'## Overview\s*\n\n(.*?)(?=\n##|\Z)'
-    overview_match = re.search(overview_pattern, content, re.DOTALL)
-
-    if not overview_match:
-        return None
-
-    overview_text = overview_match.group(1)
-
-    # Extract Purpose and Context lines
-    purpose_pattern = r'\*\*Purpose\*\*:\s*(.+?)(?:\n|$)'
-    context_pattern = r'\*\*Context\*\*:\s*(.+?)(?:\n|$)'
-
-    purpose_match = re.search(purpose_pattern, overview_text)
-    context_match = re.search(context_pattern, overview_text)
-
-    parts = []
-    if purpose_match:
-        parts.append(purpose_match.group(1).strip())
-    if context_match:
-        parts.append(context_match.group(1).strip())
-
-    return ' '.join(parts) if parts else None
+    return scan_project_document(content.split('\n')).description
 
 
 def extract_recent_updates(content: str) -> tuple[list[str], list[str]]:
@@ -107,28 +200,29 @@ def extract_recent_updates(content: str) -> tuple[list[str], list[str]]:
     Returns:
         Tuple of (decisions list, updates list)
     """
-    decisions = []
-    updates = []
+    return classify_recent_updates(scan_project_document(content.split('\n')).recent_update_lines)
 
-    # Look for ### Recent Updates section
-    updates_pattern = r'### Recent Updates\s*\n(.*?)(?=\n##|\Z)'
-    updates_match = re.search(updates_pattern, content, re.DOTALL)
 
-    if not updates_match:
-        return ([], [])
+def classify_recent_updates(update_lines: List[str]) -> tuple[list[str], list[str]]:
+    """
+    Split Recent Updates lines into decisions and updates.
 
-    updates_text = updates_match.group(1)
+    Args:
+        update_lines: Lines of the ### Recent Updates section
 
-    # Parse bullet points: - DATE: text (from source)
-    # We'll look for lines starting with "- " followed by a date
-    line_pattern = r'^- (\d{4}-\d{2}-\d{2}): (.+?)(?:\(from .+?\))?$'
+    Returns:
+        Tuple of (decisions list, updates list), at most 10 of each
+    """
+    decisions = []
+    updates = []
 
-    for line in updates_text.split('\n'):
+    # Parse bullet points: - DATE: text (from source)
+    for line in update_lines:
         line = line.strip()
-        if not line or not line.startswith('- '):
+        if not line.startswith('- '):
             continue
 
-        match = re.match(line_pattern, line)
+        match = UPDATE_LINE_PATTERN.match(line)
         if not match:
             continue
 
@@ -136,19 +230,11 @@ def extract_recent_updates(content: str) -> tuple[list[str], list[str]]:
         text = match.group(2).strip()
 
         # Check if text starts with emoji (updates) or plain text (decisions)
-        # Common emojis: ✓ ⚠️ • - and other unicode symbols
-        emoji_chars = ['✓', '⚠️', '•', '✅', '❌', '⚡', '🔴', '🟡', '🟢']
-
-        # Check if starts with emoji
-        is_update = any(text.startswith(emoji) for emoji in emoji_chars)
+        emoji = next((e for e in UPDATE_EMOJIS if text.startswith(e)), None)
 
-        if is_update:
+        if emoji:
             # Remove emoji and leading space for cleaner display
-            for emoji in emoji_chars:
-                if text.startswith(emoji):
-                    text = text[len(emoji):].strip()
-                    break
-            # Truncate if too long
+            text = text[len(emoji):].strip()
             if len(text) > 100:
                 text = text[:97] + "..."
             updates.append(f"{date_str}: {text}")
@@ -158,7 +244,10 @@ def extract_recent_updates(content: str) -> tuple[list[str], list[str]]:
                 text = text[:97] + "..."
             decisions.append(f"{date_str}: {text}")
 
-    # Return most recent 10 of each
+        # Only the most recent 10 of each are kept
+        if len(decisions) >= 10 and len(updates) >= 10:
+            break
+
     return (decisions[:10], updates[:10])
 
 
@@ -229,21 +318,48 @@ def parse_yaml_simple(yaml_str: str) -> Dict[str, Any]:
     return data
 
 
-def parse_project_file(project_file: Path) -> Optional[Project]:
+def load_project_details(project_file: Path) -> ProjectDetails:
+    """
+    Read the body-derived fields of a PROJECT.md file.
+
+    Used by LazyProject on first access to its detail fields.
+
+    Args:
+        project_file: Path to PROJECT.md file
+
+    Returns:
+        Tuple of (description, recent_decisions, recent_updates)
+    """
+    try:
+        with project_file.open() as f:
+            sections = scan_project_document(f)
+    except OSError as e:
+        print(f"Error reading details from {project_file}: {e}")
+        return (None, [], [])
+
+    decisions, updates = classify_recent_updates(sections.recent_update_lines)
+    return (sections.description, decisions, updates)
+
+
+def parse_project_file(project_file: Path, lazy: bool = False) -> Optional[Project]:
     """
     Parse a single PROJECT.md file into a Project object.
 
     Args:
         project_file: Path to PROJECT.md file
+        lazy: Only read the frontmatter and return a LazyProject whose
+              description and recent decisions/updates load on first access
 
     Returns:
         Project object, or None if parsing fails
     """
     try:
-        content = project_file.read_text()
+        # Stream the file once, collecting frontmatter and sections
+        with project_file.open() as f:
+            sections = scan_project_document(f, details=not lazy)
 
         # Extract YAML frontmatter
-        yaml_str = extract_yaml_frontmatter(content)
+        yaml_str = sections.frontmatter
         if not yaml_str:
             print(f"Warning: No YAML frontmatter found in {project_file}")
             return None
@@ -266,7 +382,7 @@ def parse_project_file(project_file: Path) -> Optional[Project]:
 
         due = parse_date(str(data.get("due")))
         completed = parse_date(str(data.get("completed")))
-        last_updated = parse_date(str(data.get("last_updated"))) or date.today()
+        last_updated = parse_date(str(data.get("last_updated")))
         hubspot_last_sync = parse_date(str(data.get("hubspot_last_sync")))
 
         # Parse tags (can be list or None)
@@ -276,14 +392,8 @@ def parse_project_file(project_file: Path) -> Optional[Project]:
         elif not isinstance(tags, list):
             tags = []
 
-        # Extract description from Overview section
-        description = extract_overview_description(content)
-
-        # Extract recent decisions and updates
-        recent_decisions, recent_updates = extract_recent_updates(content)
-
         # Create Project object
-        project = Project(
+        values = dict(
             title=data["title"],
             category=data["category"],
             container=data["container"],
@@ -294,7 +404,8 @@ def parse_project_file(project_file: Path) -> Optional[Project]:
             created=created,
             due=due,
             completed=completed,
-            last_updated=last_updated,
+            last_updated=last_updated or date.today(),
+            last_updated_missing=last_updated is None,
             progress_percent=int(data.get("progress_percent", 0)),
             tasks_total=int(data.get("tasks_total", 0)),
             tasks_completed=int(data.get("tasks_completed", 0)),
@@ -306,10 +417,23 @@ def parse_project_file(project_file: Path) -> Optional[Project]:
             hubspot_deal_id=data.get("hubspot_deal_id"),
             hubspot_last_sync=hubspot_last_sync,
             tags=tags,
-            owner=data.get("owner"),
+            owner=data.get("owner")
+        )
+
+        if lazy:
+            return LazyProject(load_project_details, **values)
+
+        # Description from Overview section
+        description = sections.description
+
+        # Recent decisions and updates
+        recent_decisions, recent_updates = classify_recent_updates(sections.recent_update_lines)
+
+        project = Project(
             description=description,
             recent_decisions=recent_decisions,
-            recent_updates=recent_updates
+            recent_updates=recent_updates,
+            **values
         )
 
         return project
@@ -319,12 +443,37 @@ def parse_project_file(project_file: Path) -> Optional[Project]:
         return None
 
 
-def load_all_projects(root_dir: Optional[Path] = None) -> List[Project]:
+def get_index_path(root_dir: Path) -> Path:
+    """Returns the location of the persistent project index for root_dir"""
+    return root_dir / ".mission-control" / "project-index.json"
+
+
+def load_all_projects(root_dir: Optional[Path] = None,
+                      use_index: bool = True,
+                      workers: Optional[int] = None,
+                      executor: str = "thread",
+                      lazy: bool = False) -> List[Project]:
     """
     Discover and load all projects from the projects directory.
 
+    With use_index enabled, parsed projects are cached on disk keyed by
+    each PROJECT.md's mtime, size and inode, so only changed files are
+    re-parsed.
+
+    Parsing is serial by default. Passing workers fans the files that
+    need parsing out over a pool: "thread" suits I/O-bound loads (cold
+    caches, network home directories), "process" suits CPU-bound regex
+    work on large trees. Results always come back in discovery order.
+
+    With lazy enabled only the frontmatter is parsed; each project's
+    description and recent decisions/updates are read on first access.
+
     Args:
         root_dir: Root directory to search (default: ~/projects)
+        use_index: Use the persistent project index (default: True)
+        workers: Pool size for parallel parsing (default: None = serial)
+        executor: "thread" or "process" (only used when workers is set)
+        lazy: Defer Overview/Recent Updates parsing until accessed
 
     Returns:
         List of Project objects
@@ -335,16 +484,182 @@ def load_all_projects(root_dir: Optional[Path] = None) -> List[Project]:
     # Discover PROJECT.md files
     project_files = discover_projects(root_dir)
 
-    # Parse each file
-    projects = []
-    for project_file in project_files:
-        project = parse_project_file(project_file)
-        if project:
-            projects.append(project)
+    index = _open_index(root_dir) if use_index else None
+
+    if workers:
+        projects = _load_parallel(project_files, index, workers, executor, lazy)
+    else:
+        # Parse each file (or reuse the indexed result)
+        projects = []
+        for project_file in project_files:
+            project = _load_project(project_file, index, lazy)
+            if project:
+                projects.append(project)
+
+    if index is not None:
+        index.prune(project_files)
+        index.save()
 
     return projects
 
 
+def _open_index(root_dir: Path) -> ProjectIndex:
+    """Open the persistent index; entries stored without details load lazily"""
+    return ProjectIndex(get_index_path(root_dir), details_loader=load_project_details)
+
+
+def _load_parallel(project_files: List[Path], index: Optional[ProjectIndex],
+                   workers: int, executor: str, lazy: bool = False) -> List[Project]:
+    """
+    Parse project files on a thread or process pool.
+
+    Index hits are resolved up front; only misses are sent to the pool.
+    Executor.map preserves input order, so the result matches discovery order.
+    """
+    if executor == "thread":
+        pool_class = ThreadPoolExecutor
+    elif executor == "process":
+        pool_class = ProcessPoolExecutor
+    else:
+        raise ValueError(f"Unknown executor '{executor}' (expected 'thread' or 'process')")
+
+    results: List[Optional[Project]] = [None] * len(project_files)
+    pending = []  # (position, project_file, signature)
+
+    for i, project_file in enumerate(project_files):
+        if index is None:
+            pending.append((i, project_file, None))
+            continue
+
+        hit, project, signature = index.lookup(project_file)
+        if hit:
+            results[i] = project
+        else:
+            pending.append((i, project_file, signature))
+
+    if pending:
+        # Batch work items so process pools don't pay IPC per file
+        chunksize = max(1, len(pending) // (workers * 4))
+        with pool_class(max_workers=workers) as pool:
+            parsed = pool.map(partial(parse_project_file, lazy=lazy), [f for _, f, _ in pending],
+                              chunksize=chunksize)
+            for (i, project_file, signature), project in zip(pending, parsed):
+                results[i] = project
+                if index is not None:
+                    index.store(project_file, project, signature)
+
+    return [project for project in results if project]
+
+
+def _load_project(project_file: Path, index: Optional[ProjectIndex],
+                  lazy: bool = False) -> Optional[Project]:
+    """Parse a PROJECT.md file, going through the index when one is given"""
+    if index is None:
+        return parse_project_file(project_file, lazy=lazy)
+
+    hit, project, signature = index.lookup(project_file)
+    if not hit:
+        project = parse_project_file(project_file, lazy=lazy)
+        index.store(project_file, project, signature)
+    return project
+
+
+def _resolve_project_files(changed_path: Path, root_dir: Path) -> tuple[List[Path], Optional[Path]]:
+    """
+    Map a changed path to the PROJECT.md files it can affect.
+
+    Args:
+        changed_path: A file or directory that was written, created or removed
+        root_dir: Root projects directory
+
+    Returns:
+        Tuple of (PROJECT.md files to re-read, removed subtree or None)
+    """
+    if changed_path.name == "PROJECT.md":
+        return ([changed_path], None)
+
+    # A whole directory changed (created, moved or deleted)
+    if changed_path.is_dir():
+        if (changed_path / "PROJECT.md").exists():
+            return ([changed_path / "PROJECT.md"], None)
+        return (discover_projects(changed_path), changed_path)
+    if not changed_path.exists() and not changed_path.suffix:
+        return ([], changed_path)
+
+    # Any other file belongs to the nearest enclosing project
+    for parent in changed_path.parents:
+        if (parent / "PROJECT.md").exists():
+            return ([parent / "PROJECT.md"], None)
+        if parent == root_dir or root_dir not in parent.parents:
+            break
+    return ([], None)
+
+
+def reload_projects(projects: List[Project], changed_paths: Iterable[Path],
+                    root_dir: Optional[Path] = None,
+                    use_index: bool = True,
+                    lazy: bool = False) -> List[Project]:
+    """
+    Incrementally reload projects affected by a set of changed paths.
+
+    Only the PROJECT.md files touched by changed_paths are re-parsed;
+    every other Project object in the list is reused as-is. Paths can be
+    PROJECT.md files, other files inside a project (tasks.md, meeting
+    notes), or directories that were created or removed.
+
+    Args:
+        projects: Current list of Project objects (as from load_all_projects)
+        changed_paths: Paths reported by a file watcher or the code that wrote them
+        root_dir: Root directory (default: ~/projects)
+        use_index: Keep the persistent project index in sync (default: True)
+        lazy: Defer Overview/Recent Updates parsing until accessed
+
+    Returns:
+        New list of Project objects in discovery order
+    """
+    if root_dir is None:
+        root_dir = Path.home() / "projects"
+
+    by_path = {project.project_md_path: project for project in projects}
+
+    to_reload = set()
+    removed_trees = []
+    for changed_path in changed_paths:
+        project_files, removed_tree = _resolve_project_files(Path(changed_path), root_dir)
+        to_reload.update(f for f in project_files if not is_excluded(f))
+        if removed_tree is not None:
+            removed_trees.append(removed_tree)
+
+    # Drop projects under directories that were removed or replaced
+    for removed_tree in removed_trees:
+        for project_md_path in list(by_path):
+            if removed_tree in project_md_path.parents:
+                del by_path[project_md_path]
+
+    if not to_reload and not removed_trees:
+        return projects
+
+    index = _open_index(root_dir) if use_index else None
+
+    for project_file in to_reload:
+        if not project_file.exists():
+            by_path.pop(project_file, None)
+            if index is not None:
+                index.discard(project_file)
+            continue
+
+        project = _load_project(project_file, index, lazy)
+        if project:
+            by_path[project_file] = project
+        else:
+            by_path.pop(project_file, None)
+
+    if index is not None:
+        index.save()
+
+    return [by_path[path] for path in sorted(by_path)]
+
+
 def filter_projects(projects: List[Project],
                     status: Optional[str] = None,
                     category: Optional[str] = None,
@@ -366,13 +681,16 @@ def filter_projects(projects: List[Project],
     filtered = projects
 
     if status:
-        filtered = [p for p in filtered if p.status.lower() == status.lower()]
+        status = normalize_label(status)
+        filtered = [p for p in filtered if p.status == status]
 
     if category:
-        filtered = [p for p in filtered if p.category.lower() == category.lower()]
+        category = normalize_label(category)
+        filtered = [p for p in filtered if p.category == category]
 
     if priority:
-        filtered = [p for p in filtered if p.priority.lower() == priority.lower()]
+        priority = normalize_label(priority)
+        filtered = [p for p in filtered if p.priority == priority]
 
     if blocked is not None:
         filtered = [p for p in filtered if p.blocked == blocked]
@@ -391,31 +709,9 @@ def sort_projects(projects: List[Project], sort_by: str = "priority") -> List[Pr
     Returns:
         Sorted list of Project objects
     """
-    if sort_by == "priority":
-        # Sort by priority: high > medium > low
-        priority_order = {"high": 0, "medium": 1, "low": 2}
-        return sorted(projects, key=lambda p: priority_order.get(p.priority.lower(), 3))
-
-    elif sort_by == "category":
-        # Sort by category: work > development > personal > family
-        category_order = {"work": 0, "development": 1, "personal": 2, "family": 3}
-        return sorted(projects, key=lambda p: (category_order.get(p.category.lower(), 4), p.title.lower()))
-
-    elif sort_by == "due_date":
-        # Sort by due date: sooner first, None last
-        return sorted(projects, key=lambda p: (p.due is None, p.due))
-
-    elif sort_by == "last_updated":
-        # Sort by last updated: most recent first
-        return sorted(projects, key=lambda p: p.last_updated, reverse=True)
-
-    elif sort_by == "name":
-        # Sort by title alphabetically
-        return sorted(projects, key=lambda p: p.title.lower())
-
-    elif sort_by == "risk":
-        # Sort by risk score: highest risk first
-        return sorted(projects, key=lambda p: p.risk_score, reverse=True)
-
-    else:
+    spec = SORT_KEYS.get(sort_by)
+    if spec is None:
         return projects
+
+    key_func, reverse = spec
+    return sorted(projects, key=key_func, reverse=reverse)
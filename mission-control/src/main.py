@@ -7,7 +7,11 @@ import sys
 import time
 from pathlib import Path
 
-from .loader import load_all_projects, sort_projects, filter_projects
+from .loader import load_all_projects, reload_projects
+from .task_cache import TaskCache
+from .task_index import TaskIndex, get_task_index_path
+from .search_index import SearchIndex, get_search_db_path
+from .project_collection import ProjectCollection
 from .views.dashboard import render_dashboard, init_colors
 from .views.split_view import render_split_view
 from .views.three_pane_view import render_three_pane_view
@@ -18,8 +22,13 @@ from .views.task_move_view import render_project_picker, show_move_result  # PHA
 from .views.project_create_view import render_project_create_modal, show_project_create_result  # PHASE 4: Create project
 from .views.marquee import Marquee, render_marquee_border_top, render_marquee_border_bottom  # PHASE 5: Scrolling marquee
 from .views.help_view import render_help_modal
-from .task_parser import parse_tasks_file, toggle_task_completion, delete_task, undo_task_deletion
-from .import_processor import create_import_dir_readme, ImportProcessor
+from .views.stats_view import render_stats_modal
+from .views.task_index_view import render_task_index_modal
+from .views.search_view import render_search_modal
+from .task_parser import toggle_task_completion, delete_task, undo_task_deletion
+from .import_processor import create_import_dir_readme
+from .import_worker import ImportWorker
+from .project_registry import get_project_registry
 from .import_history import ImportHistory  # PHASE 2: Import history
 from .task_manager import TaskManager  # PHASE 3: Task management
 from .project_creator import ProjectCreator  # PHASE 4: Project creation
@@ -48,9 +57,9 @@ def main_loop(stdscr):
     if not readme_path.exists():
         create_import_dir_readme(import_dir)
 
-    # Load projects
+    # Load projects (frontmatter only; summaries load on first display)
     try:
-        projects = load_all_projects()
+        projects = load_all_projects(lazy=True)
     except Exception as e:
         stdscr.addstr(0, 0, f"Error loading projects: {e}")
         stdscr.addstr(1, 0, "Press any key to exit...")
@@ -71,84 +80,130 @@ def main_loop(stdscr):
     sort_by = "priority"  # Can be: priority, category, due_date, last_updated, name, risk
     filter_by = "all"  # Can be: all, active, blocked, work, personal, development, family, high
     deletion_history = []  # Stack of deleted tasks for undo
-    last_import_check = time.time()  # Track last auto-import check
-    auto_import_interval = 30  # Check for imports every 30 seconds
+    # Auto-import files as they land (ranking the projects already loaded here)
+    import_worker = ImportWorker(import_dir, projects_root, projects=lambda: all_projects)
+    status_message = None  # Import progress shown in the footer
+    status_expires = 0.0
     summary_scroll_offset = 0  # Scroll position for summary pane
     all_projects = projects  # Keep unfiltered list
+    collection = ProjectCollection(all_projects)  # Cached sorted/filtered views
+    task_cache = TaskCache()  # Parsed tasks.md per project, validated by mtime/size
+    task_index = None  # Cross-project task index, opened on first use of [a]
+    search_index = None  # Full-text search index, opened on first use of [/]
     marquee = Marquee(refresh_interval=30)  # PHASE 5: Scrolling marquee for project updates
 
-    # Apply initial filter and sort
-    def apply_filter_and_sort(all_projs, filt, sort):
-        """Apply filter then sort to projects"""
-        if filt == "all":
-            filtered = all_projs
-        elif filt == "active":
-            filtered = filter_projects(all_projs, status="active")
-        elif filt == "blocked":
-            filtered = filter_projects(all_projs, blocked=True)
-        elif filt == "work":
-            filtered = filter_projects(all_projs, category="work")
-        elif filt == "personal":
-            filtered = filter_projects(all_projs, category="personal")
-        elif filt == "development":
-            filtered = filter_projects(all_projs, category="development")
-        elif filt == "family":
-            filtered = filter_projects(all_projs, category="family")
-        elif filt == "high":
-            filtered = filter_projects(all_projs, priority="high")
-        else:
-            filtered = all_projs
-        return sort_projects(filtered, sort)
-
-    projects = apply_filter_and_sort(all_projects, filter_by, sort_by)
+    def reload_changed(all_projs, changed_names=(), changed_paths=()):
+        """Incrementally reload only the projects touched by a mutation"""
+        dirs_by_name = {p.project_dir.name: p.project_dir for p in all_projs}
+        paths = list(changed_paths)
+        for name in changed_names:
+            if name not in dirs_by_name:
+                # Unknown project (e.g. created outside the TUI) - full reload
+                return load_all_projects(lazy=True)
+            paths.append(dirs_by_name[name])
+        return reload_projects(all_projs, paths, projects_root, lazy=True)
+
+    def apply_filter_and_sort():
+        """Get the current filter/sort view of all_projects"""
+        collection.update(all_projects)
+        return collection.view(filter_by, sort_by)
+
+    def jump_to_project(project_name, line_number=None):
+        """Select a project (clearing the filter if it hides it), optionally a task by line"""
+        nonlocal projects, filter_by, selected_project_idx, tasks, selected_task_idx
+        nonlocal summary_scroll_offset, active_pane
+
+        names = [p.project_dir.name for p in projects]
+        if project_name not in names:
+            filter_by = "all"
+            projects = apply_filter_and_sort()
+            names = [p.project_dir.name for p in projects]
+        if project_name not in names:
+            return
+
+        selected_project_idx = names.index(project_name)
+        tasks = task_cache.get(projects[selected_project_idx].project_dir / "tasks.md")
+        selected_task_idx = 0
+        summary_scroll_offset = 0
+        if line_number is None:
+            active_pane = "projects"
+            return
+
+        active_pane = "tasks"
+        for i, task in enumerate(tasks):
+            if task.line_number <= line_number <= task.end_line:
+                selected_task_idx = i
+                break
+
+    projects = apply_filter_and_sort()
 
     # Load tasks for selected project
     tasks = []
     if projects:
         tasks_file = projects[selected_project_idx].project_dir / "tasks.md"
-        tasks = parse_tasks_file(tasks_file)
+        tasks = task_cache.get(tasks_file)
 
     # Render tracking
     needs_render = True  # Initial render
 
     # Main loop
+    import_worker.start()
     while True:
-        # Check for auto-import (every 30 seconds)
-        current_time = time.time()
-        if current_time - last_import_check >= auto_import_interval:
-            last_import_check = current_time
-
-            # Check if there are files to process
-            processor = ImportProcessor(import_dir, projects_root)
-            import_files = processor.scan_import_directory()
-
-            if import_files:
-                # Auto-process files with AI
-                try:
-                    summary = processor.process_all(auto_route=False, use_ai=True, stage_for_review=True)
-
-                    if summary['analyzed'] > 0:
-                        # Show brief notification
-                        stdscr.clear()
-                        height, width = stdscr.getmaxyx()
-                        msg = f"✓ Auto-imported {summary['analyzed']} file(s) - Press [i] to review"
-                        stdscr.addstr(height // 2, (width - len(msg)) // 2, msg, curses.A_BOLD)
-                        stdscr.refresh()
-                        curses.napms(2000)  # Show for 2 seconds
-
-                        # Refresh projects in case new data
-                        all_projects = load_all_projects()
-                        projects = apply_filter_and_sort(all_projects, filter_by, sort_by)
-                        needs_render = True  # Need to re-render after import
-                except Exception as e:
-                    # Silent fail - don't interrupt user
-                    pass
+        # Keep risk/overdue/stale correct when the day rolls over
+        if collection.refresh_metrics():
+            projects = apply_filter_and_sort()
+            needs_render = True
+
+        # Auto-import runs on a background thread; apply its progress here
+        for event in import_worker.poll():
+            if event.kind == "finished":
+                summary = event.summary
+                if summary['analyzed'] > 0:
+                    status_message = (f"✓ Auto-imported {summary['analyzed']} file(s): "
+                                      f"{summary['tasks_added']} tasks, {summary['decisions_added']} decisions, "
+                                      f"{summary['updates_applied']} updates  [u] Undo")
+
+                    # Refresh only the projects the import touched
+                    selected_name = projects[selected_project_idx].project_dir.name \
+                        if projects and selected_project_idx < len(projects) else None
+                    changed_paths = []
+                    if summary.get('holding_items'):
+                        changed_paths.append(projects_root / "work" / "internal" / "_holding-unprocessed-content")
+                    all_projects = reload_changed(all_projects, summary.get('projects_updated', []),
+                                                  changed_paths)
+                    projects = apply_filter_and_sort()
+
+                    # Keep the same project selected and pick up new tasks
+                    names = [p.project_dir.name for p in projects]
+                    if selected_name in names:
+                        selected_project_idx = names.index(selected_name)
+                    selected_project_idx = min(selected_project_idx, max(0, len(projects) - 1))
+                    if projects:
+                        tasks = task_cache.get(projects[selected_project_idx].project_dir / "tasks.md")
+                        selected_task_idx = min(selected_task_idx, max(0, len(tasks) - 1))
+                elif summary['errors']:
+                    status_message = f"✗ Import: {summary['errors'][0]}"
+                else:
+                    status_message = None
+                status_expires = time.time() + 8
+            elif event.kind == "error":
+                status_message = f"✗ {event.message}"
+                status_expires = time.time() + 8
+            else:  # started / progress
+                status_message = f"⟳ {event.message}"
+                status_expires = float("inf")
+            needs_render = True
+
+        if status_message and time.time() >= status_expires:
+            status_message = None
+            needs_render = True
 
         # Render dashboard if something changed
         if needs_render:
             render_three_pane_view(stdscr, projects, tasks, selected_project_idx,
                                   selected_task_idx, active_pane, sort_by, summary_scroll_offset,
-                                  filter_by, len(all_projects))
+                                  filter_by, len(all_projects), collection.stats(),
+                                  status_message)
             needs_render = False
 
         # PHASE 5: Always render scrolling marquee for continuous animation
@@ -166,6 +221,13 @@ def main_loop(stdscr):
         try:
             key = stdscr.getch()
             if key == -1:  # No key pressed (timeout)
+                # Idle: warm the task cache for projects next to the selection
+                if projects:
+                    neighbours = [selected_project_idx + offset for offset in (1, -1, 2, -2, 3, -3)]
+                    task_cache.prefetch(
+                        projects[i].project_dir / "tasks.md"
+                        for i in neighbours if 0 <= i < len(projects)
+                    )
                 continue
         except KeyboardInterrupt:
             break
@@ -195,7 +257,7 @@ def main_loop(stdscr):
                     selected_project_idx -= 1
                     # Load tasks for new selection
                     tasks_file = projects[selected_project_idx].project_dir / "tasks.md"
-                    tasks = parse_tasks_file(tasks_file)
+                    tasks = task_cache.get(tasks_file)
                     selected_task_idx = 0
                     summary_scroll_offset = 0  # Reset summary scroll
                     needs_render = True
@@ -216,7 +278,7 @@ def main_loop(stdscr):
                     selected_project_idx += 1
                     # Load tasks for new selection
                     tasks_file = projects[selected_project_idx].project_dir / "tasks.md"
-                    tasks = parse_tasks_file(tasks_file)
+                    tasks = task_cache.get(tasks_file)
                     selected_task_idx = 0
                     summary_scroll_offset = 0  # Reset summary scroll
                     needs_render = True
@@ -234,10 +296,12 @@ def main_loop(stdscr):
             if active_pane == "tasks" and tasks and selected_task_idx < len(tasks):
                 task = tasks[selected_task_idx]
                 tasks_file = projects[selected_project_idx].project_dir / "tasks.md"
-                if toggle_task_completion(tasks_file, task.line_number):
-                    # Reload tasks
-                    tasks = parse_tasks_file(tasks_file)
-                    needs_render = True
+                # Reload either way: on failure the file changed under us
+                toggle_task_completion(tasks_file, task)
+                tasks = task_cache.reload(tasks_file)
+                if selected_task_idx >= len(tasks):
+                    selected_task_idx = max(0, len(tasks) - 1)
+                needs_render = True
 
         elif key == ord('d') or key == ord('D'):  # Delete key
             # Delete task (only in tasks pane)
@@ -246,14 +310,14 @@ def main_loop(stdscr):
                 tasks_file = projects[selected_project_idx].project_dir / "tasks.md"
 
                 # Delete the task and store for undo
-                deleted_task = delete_task(tasks_file, task.line_number)
+                deleted_task = delete_task(tasks_file, task)
 
                 if deleted_task:
                     # Add to deletion history
                     deletion_history.append(deleted_task)
 
                     # Reload tasks
-                    tasks = parse_tasks_file(tasks_file)
+                    tasks = task_cache.reload(tasks_file)
 
                     # Adjust selection if needed
                     if selected_task_idx >= len(tasks):
@@ -267,6 +331,12 @@ def main_loop(stdscr):
                     stdscr.refresh()
                     curses.napms(800)  # Show for 800ms
                     needs_render = True
+                else:
+                    # File changed since it was read - show its current tasks
+                    tasks = task_cache.reload(tasks_file)
+                    if selected_task_idx >= len(tasks):
+                        selected_task_idx = max(0, len(tasks) - 1)
+                    needs_render = True
 
         elif key == ord('u') or key == ord('U'):  # Undo key (context-aware)
             # PHASE 2: Context-aware undo - task deletion when in tasks pane, import undo otherwise
@@ -278,7 +348,7 @@ def main_loop(stdscr):
                     # Reload tasks
                     if projects:
                         tasks_file = projects[selected_project_idx].project_dir / "tasks.md"
-                        tasks = parse_tasks_file(tasks_file)
+                        tasks = task_cache.reload(tasks_file)
 
                     # Show feedback
                     stdscr.clear()
@@ -293,6 +363,14 @@ def main_loop(stdscr):
                     stdscr.refresh()
                     curses.napms(800)  # Show for 800ms
                     needs_render = True
+                else:
+                    stdscr.clear()
+                    height, width = stdscr.getmaxyx()
+                    msg = "✗ Cannot restore task: tasks.md changed since the deletion"
+                    stdscr.addstr(height // 2, max(0, (width - len(msg)) // 2), msg[:width - 1], curses.A_BOLD)
+                    stdscr.refresh()
+                    curses.napms(1200)
+                    needs_render = True
             else:
                 # Show import undo modal (new Phase 2 functionality)
                 import_id_to_undo = render_import_history_modal(stdscr, projects_root)
@@ -308,14 +386,14 @@ def main_loop(stdscr):
                     show_undo_result(stdscr, result)
 
                     if result.get('success'):
-                        # Refresh projects after undo
-                        all_projects = load_all_projects()
-                        projects = apply_filter_and_sort(all_projects, filter_by, sort_by)
+                        # Refresh projects touched by the undo
+                        all_projects = reload_changed(all_projects, result.get('projects_affected', []))
+                        projects = apply_filter_and_sort()
 
                         # Refresh tasks if in tasks pane
                         if projects and selected_project_idx < len(projects):
                             tasks_file = projects[selected_project_idx].project_dir / "tasks.md"
-                            tasks = parse_tasks_file(tasks_file)
+                            tasks = task_cache.reload(tasks_file)
 
                 needs_render = True
 
@@ -348,14 +426,17 @@ def main_loop(stdscr):
                         show_move_result(stdscr, result, action="move")
 
                         if result.get('success'):
-                            # Reload projects and tasks
-                            all_projects = load_all_projects()
-                            projects = apply_filter_and_sort(all_projects, filter_by, sort_by)
+                            # Reload source/destination projects and tasks
+                            all_projects = reload_changed(
+                                all_projects, [dest_project_name],
+                                [current_project.project_dir]
+                            )
+                            projects = apply_filter_and_sort()
 
                             # Reload tasks for current project
                             if projects and selected_project_idx < len(projects):
                                 tasks_file = projects[selected_project_idx].project_dir / "tasks.md"
-                                tasks = parse_tasks_file(tasks_file)
+                                tasks = task_cache.reload(tasks_file)
 
                                 # Adjust selection
                                 if selected_task_idx >= len(tasks):
@@ -372,7 +453,7 @@ def main_loop(stdscr):
                 sort_by = sort_options[next_idx]
 
                 # Re-apply filter and sort
-                projects = apply_filter_and_sort(all_projects, filter_by, sort_by)
+                projects = apply_filter_and_sort()
 
                 # Reset selection if needed
                 if selected_project_idx >= len(projects):
@@ -388,13 +469,13 @@ def main_loop(stdscr):
                 filter_by = filter_options[next_idx]
 
                 # Re-apply filter and sort
-                projects = apply_filter_and_sort(all_projects, filter_by, sort_by)
+                projects = apply_filter_and_sort()
 
                 # Reset selection
                 selected_project_idx = 0
                 if projects:
                     tasks_file = projects[selected_project_idx].project_dir / "tasks.md"
-                    tasks = parse_tasks_file(tasks_file)
+                    tasks = task_cache.get(tasks_file)
                     selected_task_idx = 0
                     summary_scroll_offset = 0
                 needs_render = True
@@ -402,8 +483,11 @@ def main_loop(stdscr):
         elif key == ord('r') or key == ord('R'):
             # Refresh data
             try:
-                all_projects = load_all_projects()
-                projects = apply_filter_and_sort(all_projects, filter_by, sort_by)
+                # Projects renamed or deleted outside Mission Control: re-walk the tree
+                get_project_registry(projects_root).invalidate()
+                all_projects = load_all_projects(lazy=True)
+                projects = apply_filter_and_sort()
+                task_cache.clear()
 
                 # Reset project selection if needed
                 if selected_project_idx >= len(projects):
@@ -412,7 +496,7 @@ def main_loop(stdscr):
                 # Reload tasks for selected project
                 if projects:
                     tasks_file = projects[selected_project_idx].project_dir / "tasks.md"
-                    tasks = parse_tasks_file(tasks_file)
+                    tasks = task_cache.get(tasks_file)
                     selected_task_idx = 0
 
                 # Show brief confirmation
@@ -434,7 +518,7 @@ def main_loop(stdscr):
                 # Reload tasks for new selection
                 if projects:
                     tasks_file = projects[selected_project_idx].project_dir / "tasks.md"
-                    tasks = parse_tasks_file(tasks_file)
+                    tasks = task_cache.get(tasks_file)
                     selected_task_idx = 0
                     summary_scroll_offset = 0  # Reset summary scroll
                 needs_render = True
@@ -449,7 +533,7 @@ def main_loop(stdscr):
                 # Reload tasks for new selection
                 if projects:
                     tasks_file = projects[selected_project_idx].project_dir / "tasks.md"
-                    tasks = parse_tasks_file(tasks_file)
+                    tasks = task_cache.get(tasks_file)
                     selected_task_idx = 0
                     summary_scroll_offset = 0  # Reset summary scroll
                 needs_render = True
@@ -484,8 +568,9 @@ def main_loop(stdscr):
 
                 # Refresh project list if successful
                 if result.get('success'):
-                    all_projects = load_all_projects()
-                    projects = apply_filter_and_sort(all_projects, filter_by, sort_by)
+                    all_projects = reload_changed(all_projects,
+                                                  changed_paths=[Path(result['project_path'])])
+                    projects = apply_filter_and_sort()
 
                     # Try to select the newly created project
                     new_project_name = result.get('project_name')
@@ -495,18 +580,56 @@ def main_loop(stdscr):
                                 selected_project_idx = i
                                 # Load tasks for new project
                                 tasks_file = projects[selected_project_idx].project_dir / "tasks.md"
-                                tasks = parse_tasks_file(tasks_file)
+                                tasks = task_cache.get(tasks_file)
                                 selected_task_idx = 0
                                 summary_scroll_offset = 0
                                 break
 
                 needs_render = True
 
+        elif key == ord('t') or key == ord('T'):
+            # Show portfolio stats modal
+            render_stats_modal(stdscr, collection.stats())
+            needs_render = True
+
+        elif key == ord('a') or key == ord('A'):
+            # Cross-project task view backed by the global task index
+            if task_index is None:
+                task_index = TaskIndex(get_task_index_path(projects_root))
+            task_index.refresh(all_projects)
+            task_index.save()
+
+            chosen = render_task_index_modal(stdscr, task_index)
+            if chosen:
+                jump_to_project(chosen.project, chosen.line_number)
+
+            needs_render = True
+
+        elif key == ord('/'):
+            # Full-text search across projects, tasks, meeting notes and messages
+            if search_index is None:
+                search_index = SearchIndex(get_search_db_path(projects_root),
+                                           projects_root / "client-monitoring" / "data")
+            try:
+                stdscr.addstr(0, 0, "Updating search index...", curses.A_BOLD)
+                stdscr.refresh()
+            except curses.error:
+                pass
+            search_index.update(all_projects)
+
+            hit = render_search_modal(stdscr, search_index)
+            if hit and hit.project:
+                jump_to_project(hit.project, hit.line if hit.kind == "task" else None)
+
+            needs_render = True
+
         elif key == ord('?'):
             # Show help modal
             render_help_modal(stdscr)
             needs_render = True
 
+    import_worker.stop()
+
 
 def main():
     """Main entry point"""
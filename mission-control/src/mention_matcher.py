@@ -0,0 +1,143 @@
+"""
+Find project-name mentions in text in a single pass.
+
+detect_project_mentions used to run one regex per project over the whole
+file - O(projects x content). MentionMatcher compiles every project name
+into one trie-shaped regex, so the regex engine scans the text once and
+only stops where some name can start; a walk of the same trie from there
+reports every name that matches at that position (names that are
+prefixes of other names included).
+
+Matching is case-insensitive on lowercased text, and a hyphen in a
+project name matches a hyphen, one whitespace character or nothing
+("acme-payroll" matches "acme payroll", "Acme-Payroll" and "acmepayroll").
+
+Matchers are cached per projects root and rebuilt when the project
+registry's version changes.
+"""
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Trie keys besides characters
+_END = "end"   # Names ending at this node
+_SEP = "sep"   # Hyphen: optional separator
+
+_SEPARATOR_PATTERN = r"[-\s]?"
+
+
+class MentionMatcher:
+    """
+    Multi-pattern matcher over a fixed list of project names.
+    """
+
+    def __init__(self, names: List[str]):
+        """
+        Build the matcher.
+
+        Args:
+            names: Project names (directory names)
+        """
+        self.names = list(names)
+        self._trie: Dict = {}
+        for name in self.names:
+            node = self._trie
+            for char in name.lower():
+                node = node.setdefault(_SEP if char == "-" else char, {})
+            node.setdefault(_END, []).append(name)
+
+        pattern = _trie_pattern(self._trie)
+        self._pattern = re.compile(pattern) if pattern else None
+
+    def find(self, text: str) -> Dict[str, Tuple[int, int]]:
+        """
+        Locate the first mention of each project.
+
+        Args:
+            text: Lowercased text to search
+
+        Returns:
+            Project name -> (start, end) of its first match in text
+        """
+        found: Dict[str, Tuple[int, int]] = {}
+        if self._pattern is None:
+            return found
+
+        pos = 0
+        search = self._pattern.search
+        while len(found) < len(self.names):
+            match = search(text, pos)
+            if match is None:
+                break
+            start = match.start()
+            for names, end in self._matches_at(text, start):
+                for name in names:
+                    if name not in found:
+                        found[name] = (start, end)
+            pos = start + 1
+        return found
+
+    def _matches_at(self, text: str, start: int):
+        """Yield (names, end) for every name matching text at start"""
+        length = len(text)
+        stack = [(self._trie, start)]
+        while stack:
+            node, i = stack.pop()
+            names = node.get(_END)
+            if names:
+                yield names, i
+            if i < length:
+                child = node.get(text[i])
+                if child is not None:
+                    stack.append((child, i + 1))
+            child = node.get(_SEP)
+            if child is not None:
+                stack.append((child, i))
+                if i < length and (text[i] == "-" or text[i].isspace()):
+                    stack.append((child, i + 1))
+
+
+def _trie_pattern(node: Dict) -> str:
+    """Regex matching any path from node to a name end (shared prefixes factored)"""
+    if _END in node:
+        # A name ends here: enough to know some name starts at the match;
+        # _matches_at() finds the longer ones
+        return ""
+
+    alternatives = []
+    for key in sorted(node):
+        atom = _SEPARATOR_PATTERN if key == _SEP else re.escape(key)
+        alternatives.append(atom + _trie_pattern(node[key]))
+
+    if not alternatives:
+        return ""
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return "(?:" + "|".join(alternatives) + ")"
+
+
+_matchers: Dict[Path, Tuple[int, MentionMatcher]] = {}
+_matchers_lock = threading.Lock()
+
+
+def get_mention_matcher(registry) -> MentionMatcher:
+    """
+    Get the matcher for a project registry's current names.
+
+    Args:
+        registry: ProjectRegistry for the projects root
+
+    Returns:
+        MentionMatcher shared by all callers until the registry changes
+    """
+    names = registry.names()
+    version = registry.version
+    with _matchers_lock:
+        cached: Optional[Tuple[int, MentionMatcher]] = _matchers.get(registry.projects_dir)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+    matcher = MentionMatcher(names)
+    with _matchers_lock:
+        _matchers[registry.projects_dir] = (version, matcher)
+    return matcher
@@ -1,14 +1,142 @@
 """
 Data models for Mission Control dashboard.
 """
-from dataclasses import dataclass
-from datetime import date, datetime
+import sys
+import time
+from dataclasses import dataclass, field, fields
+from datetime import date, datetime, timedelta
+from enum import IntEnum
 from pathlib import Path
-from typing import Optional
-from functools import cached_property
+from typing import Optional, Dict, Any, Callable, Tuple, List, Type, NamedTuple, Iterable
 
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to __dict__
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+# Field groups used when (de)serializing a Project to plain JSON types
+_PATH_FIELDS = ("project_dir", "project_md_path")
+_DATE_FIELDS = ("created", "due", "completed", "last_updated", "hubspot_last_sync")
+
+# Body-derived fields that LazyProject reads from disk on first access
+DETAIL_FIELDS = ("description", "recent_decisions", "recent_updates")
+
+
+class Priority(IntEnum):
+    """Priority ranks in sort order (high first)"""
+    HIGH = 0
+    MEDIUM = 1
+    LOW = 2
+    OTHER = 3
+
+
+class Category(IntEnum):
+    """Category ranks in sort order (work first)"""
+    WORK = 0
+    DEVELOPMENT = 1
+    PERSONAL = 2
+    FAMILY = 3
+    OTHER = 4
+
+
+class Status(IntEnum):
+    """Status ranks"""
+    ACTIVE = 0
+    ON_HOLD = 1
+    BLOCKED = 2
+    COMPLETED = 3
+    OTHER = 4
+
+
+def normalize_label(value: Any) -> str:
+    """
+    Normalize a status/priority/category value.
+
+    Returns a stripped, lowercased, interned string so equal labels share
+    one object and can be compared without calling .lower() again.
+    """
+    return sys.intern(str(value).strip().lower())
+
+
+def label_rank(enum_cls: Type[IntEnum], label: str) -> IntEnum:
+    """
+    Map a normalized label (e.g. "on-hold") to its enum member.
+
+    Unknown labels map to enum_cls.OTHER.
+    """
+    return enum_cls.__members__.get(label.upper().replace("-", "_"), enum_cls.OTHER)
+
+
+# Current date shared by every derived metric, refreshed at local midnight
+_epoch: Dict[str, Any] = {"day": None, "expires": 0.0}
+
+
+def current_day() -> date:
+    """
+    Returns today's date.
+
+    date.today() is only called again once the local day has rolled over,
+    so metrics can check the date on every access for the cost of a
+    time.time() call.
+    """
+    now = time.time()
+    if now >= _epoch["expires"]:
+        today = date.today()
+        tomorrow = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        _epoch["day"] = today
+        _epoch["expires"] = tomorrow.timestamp()
+    return _epoch["day"]
+
+
+class DerivedMetrics(NamedTuple):
+    """Date-dependent values computed together for one project"""
+    is_overdue: bool
+    is_stale: bool
+    days_until_due: Optional[int]
+    days_since_update: int
+    risk_score: int
+
+
+def compute_metrics(due: Optional[date], status: str, last_updated: date,
+                    blocked: bool, needs_review: bool, today: date) -> DerivedMetrics:
+    """
+    Compute the derived metrics for one project.
+
+    Risk scoring (capped at 100):
+    - Blocked: +50 points
+    - Overdue: +30 points
+    - Stale (7+ days): +10 points
+    - Needs review: +10 points
+
+    Args:
+        due: Due date or None
+        status: Normalized status
+        last_updated: Last update date
+        blocked: Blocked flag
+        needs_review: Needs-review flag
+        today: Date to measure against
+
+    Returns:
+        DerivedMetrics
+    """
+    days_until_due = None if due is None else (due - today).days
+    days_since_update = (today - last_updated).days
+    is_overdue = days_until_due is not None and days_until_due < 0 and status != "completed"
+    is_stale = days_since_update >= 7
+
+    score = 0
+    if blocked:
+        score += 50
+    if is_overdue:
+        score += 30
+    if is_stale:
+        score += 10
+    if needs_review:
+        score += 10
+
+    return DerivedMetrics(is_overdue, is_stale, days_until_due, days_since_update, min(score, 100))
+
+
+@dataclass(**SLOTS)
 class Project:
     """Represents a project with all its metadata from PROJECT.md"""
 
@@ -52,66 +180,79 @@ class Project:
     recent_decisions: list[str]  # Recent project decisions
     recent_updates: list[str]    # Recent project updates
 
-    @cached_property
+    # No last_updated in the frontmatter (last_updated then holds the load day)
+    last_updated_missing: bool = False
+
+    # Derived from category/status/priority in __post_init__
+    category_rank: Category = field(init=False, repr=False, compare=False)
+    status_rank: Status = field(init=False, repr=False, compare=False)
+    priority_rank: Priority = field(init=False, repr=False, compare=False)
+
+    # (day, inputs, DerivedMetrics) cache used by metrics()
+    _metrics: Optional[Tuple[date, tuple, DerivedMetrics]] = field(
+        init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.category = normalize_label(self.category)
+        self.status = normalize_label(self.status)
+        self.priority = normalize_label(self.priority)
+        self.category_rank = label_rank(Category, self.category)
+        self.status_rank = label_rank(Status, self.status)
+        self.priority_rank = label_rank(Priority, self.priority)
+        self._metrics = None
+
+    def metrics(self, today: Optional[date] = None) -> DerivedMetrics:
+        """
+        Returns the date-dependent metrics, recomputing them only when the
+        day or one of their inputs (due, status, last_updated, blocked,
+        needs_review) has changed since the last call.
+
+        Args:
+            today: Date to measure against (default: current_day())
+        """
+        if today is None:
+            today = current_day()
+        inputs = (self.due, self.status, self.last_updated, self.blocked, self.needs_review)
+        cached = self._metrics
+        if cached is None or cached[0] != today or cached[1] != inputs:
+            cached = (today, inputs, compute_metrics(*inputs, today))
+            self._metrics = cached
+        return cached[2]
+
+    @property
     def is_overdue(self) -> bool:
         """
         Returns True if project has a due date that has passed
         and the project is not completed.
         """
-        if self.due is None or self.status == "completed":
-            return False
-        return date.today() > self.due
+        return self.metrics().is_overdue
 
-    @cached_property
+    @property
     def is_stale(self) -> bool:
         """
         Returns True if project hasn't been updated in 7+ days.
         """
-        days_since_update = (date.today() - self.last_updated).days
-        return days_since_update >= 7
+        return self.metrics().is_stale
 
-    @cached_property
+    @property
     def days_until_due(self) -> Optional[int]:
         """
         Returns number of days until due date.
         Negative if overdue, None if no due date.
         """
-        if self.due is None:
-            return None
-        delta = self.due - date.today()
-        return delta.days
+        return self.metrics().days_until_due
 
-    @cached_property
+    @property
     def days_since_update(self) -> int:
         """Returns number of days since last update"""
-        return (date.today() - self.last_updated).days
+        return self.metrics().days_since_update
 
-    @cached_property
+    @property
     def risk_score(self) -> int:
         """
-        Calculates a composite risk score (0-100).
-
-        Scoring:
-        - Blocked: +50 points
-        - Overdue: +30 points
-        - Stale (7+ days): +10 points
-        - Needs review: +10 points
+        Composite risk score (0-100), see compute_metrics().
         """
-        score = 0
-
-        if self.blocked:
-            score += 50
-
-        if self.is_overdue:
-            score += 30
-
-        if self.is_stale:
-            score += 10
-
-        if self.needs_review:
-            score += 10
-
-        return min(score, 100)  # Cap at 100
+        return self.metrics().risk_score
 
     @property
     def short_name(self) -> str:
@@ -129,7 +270,7 @@ class Project:
             "blocked": "BLCK",
             "completed": "DONE"
         }
-        return status_map.get(self.status.lower(), self.status.upper()[:4])
+        return status_map.get(self.status, self.status.upper()[:4])
 
     @property
     def priority_display(self) -> str:
@@ -139,7 +280,7 @@ class Project:
             "medium": "MED",
             "low": "LOW"
         }
-        return priority_map.get(self.priority.lower(), self.priority.upper()[:4])
+        return priority_map.get(self.priority, self.priority.upper()[:4])
 
     @property
     def category_display(self) -> str:
@@ -150,16 +291,146 @@ class Project:
             "development": "DEV",
             "family": "FAM"
         }
-        return category_map.get(self.category.lower(), self.category.upper()[:4])
+        return category_map.get(self.category, self.category.upper()[:4])
 
     @property
     def has_hubspot(self) -> bool:
         """Returns True if project has HubSpot integration"""
         return self.hubspot_company_id is not None
 
+    @property
+    def details_loaded(self) -> bool:
+        """Returns True if description and recent decisions/updates are in memory"""
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the project fields as JSON-serializable values.
+
+        Detail fields that have not been loaded yet are left out.
+        """
+        data = {}
+        for f in fields(self):
+            if not f.init:
+                continue
+            if f.name in DETAIL_FIELDS and not self.details_loaded:
+                continue
+            value = getattr(self, f.name)
+            if f.name in _PATH_FIELDS:
+                value = str(value)
+            elif f.name in _DATE_FIELDS and value is not None:
+                value = value.isoformat()
+            data[f.name] = value
+        if self.last_updated_missing:
+            data["last_updated"] = None  # Fallback date is applied on load, not stored
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any],
+                  details_loader: Optional[Callable[[Path], "ProjectDetails"]] = None) -> "Project":
+        """
+        Rebuilds a Project from the output of to_dict().
+
+        If the detail fields are missing and a details_loader is given,
+        a LazyProject is returned instead.
+        """
+        values = dict(data)
+        for name in _PATH_FIELDS:
+            values[name] = Path(values[name])
+        for name in _DATE_FIELDS:
+            if values.get(name) is not None:
+                values[name] = date.fromisoformat(values[name])
+        if values.get("last_updated") is None:
+            values["last_updated"] = date.today()
+            values["last_updated_missing"] = True
+        if details_loader is not None and not all(name in values for name in DETAIL_FIELDS):
+            for name in DETAIL_FIELDS:
+                values.pop(name, None)
+            return LazyProject(details_loader, **values)
+        return cls(**values)
+
     def __str__(self) -> str:
         """String representation for debugging"""
         return f"Project({self.title}, {self.status}, {self.priority})"
 
     def __repr__(self) -> str:
         return self.__str__()
+
+
+def refresh_metrics(projects: Iterable[Project], today: Optional[date] = None) -> int:
+    """
+    Bring the derived metrics of many projects up to date in one pass.
+
+    Args:
+        projects: Projects to refresh
+        today: Date to measure against (default: current_day())
+
+    Returns:
+        Number of projects whose risk score changed
+    """
+    if today is None:
+        today = current_day()
+
+    changed = 0
+    for project in projects:
+        cached = project._metrics
+        before = cached[2].risk_score if cached is not None else None
+        if project.metrics(today).risk_score != before:
+            changed += 1
+    return changed
+
+
+# (description, recent_decisions, recent_updates)
+ProjectDetails = Tuple[Optional[str], List[str], List[str]]
+
+
+class LazyProject(Project):
+    """
+    Project built from frontmatter only.
+
+    description, recent_decisions and recent_updates are read from
+    PROJECT.md the first time any of them is accessed (e.g. when the
+    summary pane or the marquee shows the project). Sorting and filtering
+    never touch them, so large trees load without scanning file bodies.
+    """
+
+    __slots__ = ("_details_loader",)
+
+    def __init__(self, details_loader: Callable[[Path], ProjectDetails], **values):
+        """
+        Initialize a lazy project.
+
+        Args:
+            details_loader: Called with project_md_path, returns
+                            (description, recent_decisions, recent_updates)
+            **values: All other Project fields
+        """
+        super().__init__(description=None, recent_decisions=[], recent_updates=[], **values)
+        # Drop the placeholders so attribute access falls through to __getattr__
+        for name in DETAIL_FIELDS:
+            delattr(self, name)
+        self._details_loader = details_loader
+
+    def __getattr__(self, name: str):
+        # Only called for attributes that are not set yet
+        if name in DETAIL_FIELDS:
+            self.load_details()
+            return object.__getattribute__(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    @property
+    def details_loaded(self) -> bool:
+        """Returns True once the detail fields have been read"""
+        try:
+            for name in DETAIL_FIELDS:
+                object.__getattribute__(self, name)
+        except AttributeError:
+            return False
+        return True
+
+    def load_details(self):
+        """Read description and recent decisions/updates from PROJECT.md"""
+        description, decisions, updates = self._details_loader(self.project_md_path)
+        self.description = description
+        self.recent_decisions = decisions
+        self.recent_updates = updates
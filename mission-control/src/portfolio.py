@@ -0,0 +1,243 @@
+"""
+Portfolio metrics - aggregate numbers across all projects.
+
+With NumPy installed the project fields are copied once into columnar
+arrays and every aggregate is a vectorized expression, so stats for
+thousands of projects take milliseconds. Without NumPy the same numbers
+are computed with plain loops.
+"""
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+try:
+    from .models import Project, Category, current_day
+except ImportError:
+    from models import Project, Category, current_day
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+# Risk buckets, matching the dashboard's risk indicator thresholds
+RISK_BUCKETS = (("high", 50), ("medium", 30), ("low", 10), ("none", 0))
+
+# Remaining-task buckets by days until due: (name, upper bound exclusive)
+DUE_BUCKETS = (("overdue", 0), ("this_week", 7), ("next_4_weeks", 35), ("later", None))
+
+CATEGORY_NAMES = [member.name.lower() for member in Category]
+
+
+def portfolio_stats(projects: List[Project], today: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Compute portfolio-wide statistics.
+
+    Args:
+        projects: Projects to aggregate
+        today: Date to measure against (default: current_day())
+
+    Returns:
+        Dict with project counts, risk distribution, overdue counts per
+        category, task burn-down and hours variance
+    """
+    if today is None:
+        today = current_day()
+    if NUMPY_AVAILABLE:
+        return PortfolioColumns(projects).stats(today)
+    return _stats_python(projects, today)
+
+
+class PortfolioColumns:
+    """Project fields as NumPy arrays (one element per project)"""
+
+    def __init__(self, projects: List[Project]):
+        """
+        Build the columns.
+
+        Args:
+            projects: Projects to store
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy package not installed. Install with: pip install numpy")
+
+        self.size = len(projects)
+        # Dates as proleptic ordinals; missing due dates are masked by has_due
+        self.due = np.array([p.due.toordinal() if p.due else 0 for p in projects], dtype=np.int64)
+        self.has_due = np.array([p.due is not None for p in projects], dtype=bool)
+        self.last_updated = np.array([p.last_updated.toordinal() for p in projects], dtype=np.int64)
+        self.progress_percent = np.array([p.progress_percent for p in projects], dtype=np.float64)
+        self.tasks_total = np.array([p.tasks_total for p in projects], dtype=np.int64)
+        self.tasks_completed = np.array([p.tasks_completed for p in projects], dtype=np.int64)
+        self.estimated_hours = np.array([p.estimated_hours for p in projects], dtype=np.float64)
+        self.actual_hours = np.array([p.actual_hours for p in projects], dtype=np.float64)
+        self.blocked = np.array([p.blocked for p in projects], dtype=bool)
+        self.needs_review = np.array([p.needs_review for p in projects], dtype=bool)
+        self.category = np.array([p.category_rank for p in projects], dtype=np.int8)
+        self.active = np.array([p.status == "active" for p in projects], dtype=bool)
+        self.completed = np.array([p.status == "completed" for p in projects], dtype=bool)
+
+    def overdue(self, today: date):
+        """Boolean array: due date passed and not completed"""
+        return self.has_due & (self.due < today.toordinal()) & ~self.completed
+
+    def stale(self, today: date):
+        """Boolean array: not updated in 7+ days"""
+        return (today.toordinal() - self.last_updated) >= 7
+
+    def risk_scores(self, today: date):
+        """Risk scores (same scoring as Project.risk_score)"""
+        score = (50 * self.blocked + 30 * self.overdue(today)
+                 + 10 * self.stale(today) + 10 * self.needs_review)
+        return np.minimum(score, 100)
+
+    def risk_distribution(self, today: date) -> Dict[str, int]:
+        """Number of projects per risk bucket"""
+        scores = self.risk_scores(today)
+        distribution = {}
+        upper = None
+        for name, lower in RISK_BUCKETS:
+            in_bucket = scores >= lower
+            if upper is not None:
+                in_bucket &= scores < upper
+            distribution[name] = int(in_bucket.sum())
+            upper = lower
+        return distribution
+
+    def overdue_by_category(self, today: date) -> Dict[str, int]:
+        """Overdue project count per category"""
+        counts = np.bincount(self.category[self.overdue(today)], minlength=len(CATEGORY_NAMES))
+        return {name: int(count) for name, count in zip(CATEGORY_NAMES, counts)}
+
+    def burn_down(self, today: date) -> Dict[str, Any]:
+        """Task totals and remaining tasks grouped by how soon they are due"""
+        remaining = np.maximum(self.tasks_total - self.tasks_completed, 0)
+        days_left = self.due - today.toordinal()
+
+        by_due = {}
+        lower = None
+        for name, upper in DUE_BUCKETS:
+            in_bucket = self.has_due.copy()
+            if lower is not None:
+                in_bucket &= days_left >= lower
+            if upper is not None:
+                in_bucket &= days_left < upper
+            by_due[name] = int(remaining[in_bucket].sum())
+            lower = upper
+        by_due["no_due"] = int(remaining[~self.has_due].sum())
+
+        total = int(self.tasks_total.sum())
+        done = int(self.tasks_completed.sum())
+        return {
+            "tasks_total": total,
+            "tasks_completed": done,
+            "tasks_remaining": int(remaining.sum()),
+            "percent_complete": round(100.0 * done / total, 1) if total else 0.0,
+            "remaining_by_due": by_due,
+        }
+
+    def hours_variance(self) -> Dict[str, Any]:
+        """Estimated vs actual hours"""
+        estimated = float(self.estimated_hours.sum())
+        actual = float(self.actual_hours.sum())
+        return {
+            "estimated": estimated,
+            "actual": actual,
+            "variance": actual - estimated,
+            "variance_percent": round(100.0 * (actual - estimated) / estimated, 1) if estimated else 0.0,
+            "over_budget": int((self.actual_hours > self.estimated_hours).sum()),
+        }
+
+    def stats(self, today: date) -> Dict[str, Any]:
+        """All aggregates (see portfolio_stats())"""
+        return {
+            "projects": self.size,
+            "active": int(self.active.sum()),
+            "completed": int(self.completed.sum()),
+            "blocked": int(self.blocked.sum()),
+            "needs_review": int(self.needs_review.sum()),
+            "overdue": int(self.overdue(today).sum()),
+            "stale": int((self.stale(today) & self.active).sum()),
+            "avg_progress": round(float(self.progress_percent.mean()), 1) if self.size else 0.0,
+            "risk": self.risk_distribution(today),
+            "overdue_by_category": self.overdue_by_category(today),
+            "burn_down": self.burn_down(today),
+            "hours": self.hours_variance(),
+        }
+
+
+def _bucket(value: int, buckets, default: str) -> str:
+    """Name of the first (name, bound) bucket whose bound value falls under"""
+    for name, bound in buckets:
+        if bound is None or value < bound:
+            return name
+    return default
+
+
+def _stats_python(projects: List[Project], today: date) -> Dict[str, Any]:
+    """Loop-based fallback for portfolio_stats() when NumPy is missing"""
+    risk = {name: 0 for name, _ in RISK_BUCKETS}
+    overdue_by_category = {name: 0 for name in CATEGORY_NAMES}
+    by_due = {name: 0 for name, _ in DUE_BUCKETS}
+    by_due["no_due"] = 0
+    counts = {"active": 0, "completed": 0, "blocked": 0, "needs_review": 0, "overdue": 0, "stale": 0}
+    tasks_total = tasks_completed = tasks_remaining = 0
+    estimated = actual = 0.0
+    over_budget = 0
+    progress = 0
+
+    for p in projects:
+        metrics = p.metrics(today)
+        counts["active"] += p.status == "active"
+        counts["completed"] += p.status == "completed"
+        counts["blocked"] += bool(p.blocked)
+        counts["needs_review"] += bool(p.needs_review)
+        counts["overdue"] += metrics.is_overdue
+        counts["stale"] += metrics.is_stale and p.status == "active"
+        progress += p.progress_percent
+
+        for name, lower in RISK_BUCKETS:
+            if metrics.risk_score >= lower:
+                risk[name] += 1
+                break
+
+        if metrics.is_overdue:
+            overdue_by_category[CATEGORY_NAMES[p.category_rank]] += 1
+
+        remaining = max(p.tasks_total - p.tasks_completed, 0)
+        tasks_total += p.tasks_total
+        tasks_completed += p.tasks_completed
+        tasks_remaining += remaining
+        if metrics.days_until_due is None:
+            by_due["no_due"] += remaining
+        else:
+            by_due[_bucket(metrics.days_until_due, DUE_BUCKETS, "later")] += remaining
+
+        estimated += p.estimated_hours
+        actual += p.actual_hours
+        over_budget += p.actual_hours > p.estimated_hours
+
+    size = len(projects)
+    return {
+        "projects": size,
+        **counts,
+        "avg_progress": round(progress / size, 1) if size else 0.0,
+        "risk": risk,
+        "overdue_by_category": overdue_by_category,
+        "burn_down": {
+            "tasks_total": tasks_total,
+            "tasks_completed": tasks_completed,
+            "tasks_remaining": tasks_remaining,
+            "percent_complete": round(100.0 * tasks_completed / tasks_total, 1) if tasks_total else 0.0,
+            "remaining_by_due": by_due,
+        },
+        "hours": {
+            "estimated": estimated,
+            "actual": actual,
+            "variance": actual - estimated,
+            "variance_percent": round(100.0 * (actual - estimated) / estimated, 1) if estimated else 0.0,
+            "over_budget": over_budget,
+        },
+    }
@@ -0,0 +1,199 @@
+"""
+Project collection - cached sorted/filtered views of the project list.
+
+The dashboard switches sort modes (s) and filters (f) far more often than
+the project list changes. ProjectCollection computes each sort key once
+per project, sorts each mode at most once, and keeps a bitmap per filter,
+so switching views only walks a cached ordering and picks the members.
+"""
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from .models import Project, current_day, refresh_metrics
+    from .portfolio import portfolio_stats
+except ImportError:
+    from models import Project, current_day, refresh_metrics
+    from portfolio import portfolio_stats
+
+
+# sort mode -> (key function, reverse)
+SORT_KEYS: Dict[str, Tuple[Callable[[Project], object], bool]] = {
+    # Priority: high > medium > low
+    "priority": (lambda p: p.priority_rank, False),
+    # Category: work > development > personal > family, then title
+    "category": (lambda p: (p.category_rank, p.title.lower()), False),
+    # Due date: sooner first, None last
+    "due_date": (lambda p: (p.due is None, p.due or date.min), False),
+    # Last updated: most recent first
+    "last_updated": (lambda p: p.last_updated, True),
+    # Title alphabetically
+    "name": (lambda p: p.title.lower(), False),
+    # Risk score: highest risk first
+    "risk": (lambda p: p.risk_score, True),
+}
+
+# Sort modes whose keys depend on the current date
+DATE_DEPENDENT_SORTS = ("risk",)
+
+# filter name -> membership test (None = every project)
+FILTERS: Dict[str, Optional[Callable[[Project], bool]]] = {
+    "all": None,
+    "active": lambda p: p.status == "active",
+    "blocked": lambda p: p.blocked,
+    "work": lambda p: p.category == "work",
+    "personal": lambda p: p.category == "personal",
+    "development": lambda p: p.category == "development",
+    "family": lambda p: p.category == "family",
+    "high": lambda p: p.priority == "high",
+}
+
+
+class ProjectCollection:
+    """
+    All loaded projects plus cached views over them.
+
+    Orderings, filter bitmaps and assembled views are built on first use
+    and kept until the project list is replaced with update(). Sorting is
+    stable, so a filtered view taken from the full ordering is identical
+    to sorting the filtered list directly.
+    """
+
+    def __init__(self, projects: List[Project]):
+        """
+        Initialize the collection.
+
+        Args:
+            projects: Projects in load order (sorted by project_md_path)
+        """
+        self.projects: List[Project] = []
+        self.update(projects)
+
+    def update(self, projects: List[Project]):
+        """
+        Replace the project list.
+
+        Passing the same list object again (reload_projects returns it
+        unchanged when nothing was modified) keeps every cached view.
+
+        Args:
+            projects: New project list
+        """
+        if projects is self.projects:
+            return
+
+        self.projects = projects
+        self.metrics_day = None
+        self.invalidate()
+
+    def refresh_metrics(self) -> bool:
+        """
+        Recompute date-dependent metrics if the day has rolled over.
+
+        Cheap to call every frame: nothing happens until current_day()
+        changes. Orderings that depend on the date are dropped only if a
+        risk score actually changed.
+
+        Returns:
+            True when the day rolled over (overdue flags, days until due
+            and stats changed, so views should be refetched and redrawn)
+        """
+        today = current_day()
+        if today == self.metrics_day:
+            return False
+
+        self.metrics_day = today
+        self._stats = None
+        if refresh_metrics(self.projects, today) > 0:
+            for sort_by in DATE_DEPENDENT_SORTS:
+                self.invalidate(sort_by)
+        return True
+
+    def invalidate(self, sort_by: Optional[str] = None):
+        """
+        Drop cached views.
+
+        Args:
+            sort_by: Only drop orderings for this sort mode (e.g. "risk"
+                     when date-dependent metrics change); None drops all
+        """
+        if sort_by is None:
+            self._orders: Dict[str, List[int]] = {}
+            self._masks: Dict[str, bytearray] = {}
+            self._views: Dict[Tuple[str, str], List[Project]] = {}
+            self._stats: Optional[Dict[str, Any]] = None
+            return
+
+        self._orders.pop(sort_by, None)
+        for key in [key for key in self._views if key[1] == sort_by]:
+            del self._views[key]
+
+    def view(self, filter_by: str = "all", sort_by: str = "priority") -> List[Project]:
+        """
+        Get the filtered, sorted projects for the dashboard.
+
+        Args:
+            filter_by: Filter name from FILTERS (unknown names show everything)
+            sort_by: Sort mode from SORT_KEYS (unknown modes keep load order)
+
+        Returns:
+            New list of projects (safe for the caller to modify)
+        """
+        self.refresh_metrics()
+
+        key = (filter_by, sort_by)
+        cached = self._views.get(key)
+        if cached is None:
+            order = self._order(sort_by)
+            mask = self._mask(filter_by)
+            projects = self.projects
+            if mask is None:
+                cached = [projects[i] for i in order]
+            else:
+                cached = [projects[i] for i in order if mask[i]]
+            self._views[key] = cached
+        return list(cached)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Portfolio-wide statistics for all projects (see portfolio_stats()).
+
+        Cached until the project list changes or the day rolls over.
+        """
+        self.refresh_metrics()
+        if self._stats is None:
+            self._stats = portfolio_stats(self.projects, self.metrics_day)
+        return self._stats
+
+    def count(self, filter_by: str = "all") -> int:
+        """Number of projects matching a filter"""
+        mask = self._mask(filter_by)
+        if mask is None:
+            return len(self.projects)
+        return sum(mask)
+
+    def _order(self, sort_by: str) -> List[int]:
+        """Cached positions of all projects in sort_by order"""
+        order = self._orders.get(sort_by)
+        if order is None:
+            spec = SORT_KEYS.get(sort_by)
+            if spec is None:
+                order = list(range(len(self.projects)))
+            else:
+                key_func, reverse = spec
+                keys = [key_func(p) for p in self.projects]
+                order = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+            self._orders[sort_by] = order
+        return order
+
+    def _mask(self, filter_by: str) -> Optional[bytearray]:
+        """Cached membership bitmap for a filter (None = no filtering)"""
+        predicate = FILTERS.get(filter_by)
+        if predicate is None:
+            return None
+
+        mask = self._masks.get(filter_by)
+        if mask is None:
+            mask = bytearray(1 if predicate(p) else 0 for p in self.projects)
+            self._masks[filter_by] = mask
+        return mask
@@ -6,6 +6,11 @@ from typing import Dict, Optional
 from datetime import datetime
 import re
 
+try:
+    from .project_registry import get_project_registry
+except ImportError:
+    from project_registry import get_project_registry
+
 
 class ProjectCreator:
     """
@@ -91,6 +96,9 @@ class ProjectCreator:
                 (project_path / 'meeting-notes').mkdir(exist_ok=True)
                 self._create_meeting_notes_readme(project_path)
 
+            # Make the new project routable without a registry rebuild
+            get_project_registry(self.projects_dir).register(project_path)
+
             result['success'] = True
             result['project_name'] = project_name
             result['project_path'] = str(project_path)
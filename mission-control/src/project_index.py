@@ -0,0 +1,161 @@
+"""
+Persistent project index - caches parsed PROJECT.md data between runs.
+
+Each entry stores the parsed Project fields together with the file's
+mtime, size and inode. A warm start only has to stat every PROJECT.md and
+re-parse the files whose signature changed.
+"""
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from .models import Project, ProjectDetails
+    from .document_writer import atomic_write_text
+except ImportError:
+    from models import Project, ProjectDetails
+    from document_writer import atomic_write_text
+
+
+# Bump whenever the cached parse output changes: stored Project fields,
+# PROJECT.md parsing/scanning rules or date fallbacks
+INDEX_VERSION = 2
+
+
+def file_signature(stat: os.stat_result) -> List[int]:
+    """
+    Build the change-detection signature for a file.
+
+    Args:
+        stat: Result of Path.stat() for the file
+
+    Returns:
+        [mtime_ns, size, inode]
+    """
+    return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+
+class ProjectIndex:
+    """
+    On-disk cache of parsed projects keyed by PROJECT.md path.
+
+    Stored as JSON under ~/projects/.mission-control/project-index.json.
+    Files that failed to parse are cached too (as None) so broken files
+    are not re-parsed on every start.
+    """
+
+    def __init__(self, index_file: Path,
+                 details_loader: Optional[Callable[[Path], ProjectDetails]] = None):
+        """
+        Initialize the project index.
+
+        Args:
+            index_file: Path to the JSON index file
+            details_loader: Loader for entries stored without detail fields
+                            (they come back as LazyProject)
+        """
+        self.index_file = index_file
+        self.details_loader = details_loader
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = False
+        self._load()
+
+    def lookup(self, project_file: Path) -> Tuple[bool, Optional[Project], Optional[List[int]]]:
+        """
+        Look up a cached project, validating it against the file on disk.
+
+        Args:
+            project_file: Path to PROJECT.md
+
+        Returns:
+            Tuple of (hit, project, signature). On a hit, project is the
+            cached Project (or None for a cached parse failure). On a miss,
+            signature is the current file signature to pass to store().
+        """
+        try:
+            signature = file_signature(project_file.stat())
+        except OSError:
+            return (False, None, None)
+
+        entry = self.entries.get(str(project_file))
+        if entry is None or entry.get("signature") != signature:
+            return (False, None, signature)
+
+        data = entry.get("project")
+        if data is None:
+            return (True, None, signature)
+
+        try:
+            return (True, Project.from_dict(data, self.details_loader), signature)
+        except Exception:
+            # Corrupt or outdated entry - treat as a miss
+            return (False, None, signature)
+
+    def store(self, project_file: Path, project: Optional[Project],
+              signature: Optional[List[int]]):
+        """
+        Record the parse result for a file.
+
+        Args:
+            project_file: Path to PROJECT.md
+            project: Parsed Project, or None if parsing failed
+            signature: File signature captured before parsing
+        """
+        if signature is None:
+            return
+
+        self.entries[str(project_file)] = {
+            "signature": signature,
+            "project": project.to_dict() if project else None
+        }
+        self.dirty = True
+
+    def discard(self, project_file: Path):
+        """Remove a file from the index"""
+        if self.entries.pop(str(project_file), None) is not None:
+            self.dirty = True
+
+    def prune(self, live_files: List[Path]):
+        """
+        Drop entries for files that no longer exist.
+
+        Args:
+            live_files: PROJECT.md paths found by the latest discovery
+        """
+        live = {str(path) for path in live_files}
+        stale = [key for key in self.entries if key not in live]
+        for key in stale:
+            del self.entries[key]
+        if stale:
+            self.dirty = True
+
+    def save(self):
+        """Write the index to disk if it changed (atomic replace)"""
+        if not self.dirty:
+            return
+
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(self.index_file, json.dumps({
+                "version": INDEX_VERSION,
+                "entries": self.entries
+            }))
+            self.dirty = False
+        except OSError as e:
+            print(f"Warning: Could not save project index {self.index_file}: {e}")
+
+    def _load(self):
+        """Load the index from disk, starting empty if missing or outdated"""
+        if not self.index_file.exists():
+            return
+
+        try:
+            data = json.loads(self.index_file.read_text())
+        except Exception:
+            return
+
+        if data.get("version") != INDEX_VERSION:
+            return
+
+        self.entries = data.get("entries", {})
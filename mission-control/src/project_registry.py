@@ -0,0 +1,171 @@
+"""
+Project registry - shared, cached lookup of project directories by name.
+
+Routers and managers resolve project names (directory names) to paths
+through one registry per projects root instead of walking the tree with
+rglob("PROJECT.md") on every lookup.
+"""
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    from .loader import DEFAULT_EXCLUDE_PATTERNS
+except ImportError:
+    from loader import DEFAULT_EXCLUDE_PATTERNS
+
+
+class ProjectRegistry:
+    """
+    Maps project names to project directories.
+
+    The tree is walked once and cached. A lookup that misses (or hits a
+    directory that no longer has a PROJECT.md) triggers a rebuild, at most
+    once per min_rebuild_interval seconds, so projects created or renamed
+    outside Mission Control are still picked up.
+    """
+
+    def __init__(self, projects_dir: Path, exclude_patterns: Optional[List[str]] = None,
+                 min_rebuild_interval: float = 2.0):
+        """
+        Initialize the project registry.
+
+        Args:
+            projects_dir: Root projects directory
+            exclude_patterns: Path fragments to skip (default: DEFAULT_EXCLUDE_PATTERNS)
+            min_rebuild_interval: Minimum seconds between rebuilds triggered by misses
+        """
+        self.projects_dir = projects_dir
+        self.exclude_patterns = exclude_patterns or DEFAULT_EXCLUDE_PATTERNS
+        self.min_rebuild_interval = min_rebuild_interval
+        self.version = 0  # Incremented whenever the name -> dir mapping changes
+
+        self._dirs: Dict[str, Path] = {}
+        self._duplicates: Dict[str, List[Path]] = {}
+        self._built_at: Optional[float] = None
+        self._lock = threading.RLock()
+
+    def find(self, project_name: str) -> Optional[Path]:
+        """
+        Find a project directory by name.
+
+        Args:
+            project_name: Project directory name
+
+        Returns:
+            Path to the project directory, or None if not found
+        """
+        with self._lock:
+            self._ensure_built()
+
+            project_dir = self._dirs.get(project_name)
+            if project_dir is not None and (project_dir / "PROJECT.md").exists():
+                return project_dir
+
+            # Missing or stale entry - the tree may have changed underneath us
+            if self._can_rebuild():
+                self.rebuild()
+                return self._dirs.get(project_name)
+
+            return None
+
+    def names(self) -> List[str]:
+        """
+        Get all project names.
+
+        Returns:
+            List of project directory names in path order
+        """
+        with self._lock:
+            self._ensure_built()
+            return list(self._dirs)
+
+    def duplicates(self) -> Dict[str, List[Path]]:
+        """
+        Get project names that are used by more than one directory.
+
+        Lookups for these names resolve to the first directory in path order.
+
+        Returns:
+            Dict of project name -> all matching directories
+        """
+        with self._lock:
+            self._ensure_built()
+            return {name: list(dirs) for name, dirs in self._duplicates.items()}
+
+    def register(self, project_dir: Path):
+        """
+        Add a newly created project without rebuilding.
+
+        Args:
+            project_dir: Directory containing the new PROJECT.md
+        """
+        with self._lock:
+            self._ensure_built()
+            self._add(project_dir)
+            self.version += 1
+
+    def invalidate(self):
+        """Forget the cached mapping (call after renames or deletions)"""
+        with self._lock:
+            self._built_at = None
+
+    def rebuild(self):
+        """Walk the projects tree and rebuild the mapping"""
+        with self._lock:
+            self._dirs = {}
+            self._duplicates = {}
+
+            project_files = sorted(
+                project_file for project_file in self.projects_dir.rglob("PROJECT.md")
+                if not any(pattern in str(project_file) for pattern in self.exclude_patterns)
+            )
+            for project_file in project_files:
+                self._add(project_file.parent)
+
+            self._built_at = time.monotonic()
+            self.version += 1
+
+    def _add(self, project_dir: Path):
+        """Record a project directory, tracking duplicate names"""
+        name = project_dir.name
+        existing = self._dirs.get(name)
+
+        if existing is None or existing == project_dir:
+            self._dirs[name] = project_dir
+            return
+
+        dirs = self._duplicates.setdefault(name, [existing])
+        if project_dir not in dirs:
+            dirs.append(project_dir)
+
+    def _ensure_built(self):
+        if self._built_at is None:
+            self.rebuild()
+
+    def _can_rebuild(self) -> bool:
+        return time.monotonic() - self._built_at >= self.min_rebuild_interval
+
+
+_registries: Dict[Path, ProjectRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_project_registry(projects_dir: Path) -> ProjectRegistry:
+    """
+    Get the shared registry for a projects root.
+
+    Args:
+        projects_dir: Root projects directory
+
+    Returns:
+        ProjectRegistry instance shared by all callers in this process
+    """
+    key = Path(projects_dir)
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = ProjectRegistry(key)
+            _registries[key] = registry
+        return registry
@@ -0,0 +1,172 @@
+"""
+Project shortlist - pick the projects a piece of content is likely about.
+
+Every analysis prompt used to list every known project. With hundreds of
+projects that is most of the prompt's input tokens, and the model
+attributes items worse when choosing from a long list. ProjectShortlist
+ranks projects against the content locally (TF-IDF over each project's
+directory name, title, tags, owner and overview) so only the top
+candidates plus HOLDING go into the prompt.
+
+Projects with no textual evidence in the content fill remaining slots in
+order of last update, since meetings mostly concern active work.
+"""
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Candidates put in the prompt (0 = no shortlist, list every project)
+DEFAULT_SHORTLIST_SIZE = 25
+
+HOLDING = "HOLDING"
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Weight of each field in a project's term vector
+NAME_WEIGHT = 3
+TITLE_WEIGHT = 2
+TAG_WEIGHT = 2
+TEXT_WEIGHT = 1
+
+STOPWORDS = frozenset("""
+a about after all also an and any are as at be been but by can could did do
+does for from had has have he her his i if in into is it its just me more my
+no not of on or our out she so some than that the their them then there they
+this to up us was we were what when which will with would you your
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens of text, without stopwords and one-letter words"""
+    return [token for token in TOKEN_PATTERN.findall(text.lower())
+            if len(token) > 1 and token not in STOPWORDS]
+
+
+class ProjectShortlist:
+    """
+    TF-IDF ranking of projects against content.
+
+    Built once per import run; select() is cheap (one pass over the
+    content's distinct terms).
+    """
+
+    def __init__(self, documents: Dict[str, Counter], size: int = DEFAULT_SHORTLIST_SIZE,
+                 recent: Optional[List[str]] = None):
+        """
+        Initialize the shortlist.
+
+        Args:
+            documents: Project name -> weighted term counts (see from_projects)
+            size: Projects selected per call (0 = all)
+            recent: Project names, most recently updated first (fills slots
+                    left when fewer projects match the content)
+        """
+        self.size = size
+        self.recent = list(recent or [])
+
+        doc_freq = Counter()
+        for terms in documents.values():
+            doc_freq.update(terms.keys())
+        total = len(documents)
+        self._idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in doc_freq.items()}
+
+        # term -> [(project, normalized weight)]
+        self._postings: Dict[str, List[Tuple[str, float]]] = {}
+        for name, terms in documents.items():
+            weights = {term: (1 + math.log(count)) * self._idf[term]
+                       for term, count in terms.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for term, weight in weights.items():
+                self._postings.setdefault(term, []).append((name, weight / norm))
+
+    @classmethod
+    def from_projects(cls, projects: Iterable, names: Iterable[str] = (),
+                      size: int = DEFAULT_SHORTLIST_SIZE) -> "ProjectShortlist":
+        """
+        Build a shortlist from loaded projects.
+
+        Args:
+            projects: Project objects (load_all_projects())
+            names: Further project names without metadata (indexed by name only)
+            size: Projects selected per call (0 = all)
+
+        Returns:
+            ProjectShortlist instance
+        """
+        documents: Dict[str, Counter] = {}
+        dated = []
+        for project in projects:
+            name = project.project_dir.name
+            terms = Counter()
+            for token in tokenize(name.replace("-", " ").replace("_", " ")):
+                terms[token] += NAME_WEIGHT
+            for token in tokenize(project.title or ""):
+                terms[token] += TITLE_WEIGHT
+            for token in tokenize(" ".join(project.tags or [])):
+                terms[token] += TAG_WEIGHT
+            for token in tokenize(" ".join(filter(None, (project.owner, project.description)))):
+                terms[token] += TEXT_WEIGHT
+            documents[name] = terms
+            dated.append((project.last_updated, name))
+
+        for name in names:
+            if name not in documents:
+                documents[name] = Counter({
+                    token: NAME_WEIGHT
+                    for token in tokenize(name.replace("-", " ").replace("_", " "))
+                })
+
+        dated.sort(reverse=True)
+        return cls(documents, size=size, recent=[name for _, name in dated])
+
+    def scores(self, content: str) -> Dict[str, float]:
+        """
+        Cosine similarity of the content to each matching project.
+
+        Returns:
+            Project name -> score (projects sharing no term are absent)
+        """
+        counts = Counter(tokenize(content))
+        scores: Dict[str, float] = {}
+        for term, count in counts.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            query_weight = (1 + math.log(count)) * self._idf[term]
+            for name, weight in postings:
+                scores[name] = scores.get(name, 0.0) + query_weight * weight
+        return scores
+
+    def select(self, content: str, known_projects: List[str]) -> List[str]:
+        """
+        Choose the projects to offer the model for this content.
+
+        Args:
+            content: Text being analyzed
+            known_projects: All routable project names
+
+        Returns:
+            Up to size projects, best match first, followed by HOLDING;
+            known_projects unchanged if it is not longer than size
+        """
+        if self.size <= 0 or len(known_projects) <= self.size:
+            return known_projects
+
+        known = set(known_projects)
+        scores = self.scores(content)
+        ranked = sorted((name for name in scores if name in known),
+                        key=lambda name: (-scores[name], name))
+        selected = ranked[:self.size]
+
+        if len(selected) < self.size:
+            chosen = set(selected)
+            for name in self.recent:
+                if name in known and name not in chosen:
+                    selected.append(name)
+                    chosen.add(name)
+                    if len(selected) == self.size:
+                        break
+
+        return selected + [HOLDING]
@@ -0,0 +1,299 @@
+"""
+Full-text search over projects, tasks, meeting notes and captured messages.
+
+Uses an SQLite FTS5 index stored in ~/projects/.mission-control/search.db.
+Every indexed file is recorded with its signature (mtime, size, inode);
+update() re-indexes only files that changed and drops files that are gone,
+so searches after the first build only pay for a stat() per file.
+
+Indexed sources:
+- PROJECT.md, one entry per heading section
+- tasks.md, one entry per task (sub-tasks included)
+- <project>/meeting-notes/*.md, one entry per file
+- client-monitoring/data/**/*.json, one entry per captured message
+"""
+import json
+import re
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .models import Project
+from .project_index import file_signature
+from .task_index import iter_task_tree
+from .task_parser import parse_tasks_file
+
+
+# Bump when the schema or the way entries are extracted changes
+SEARCH_INDEX_VERSION = 1
+
+HEADING_PATTERN = re.compile(r'^#{1,6}\s+(.+?)\s*$')
+QUERY_TERM_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# (title, body, line) for one searchable entry
+Entry = Tuple[str, str, int]
+
+
+class SearchHit(NamedTuple):
+    """One ranked search result"""
+    kind: str             # "project", "task", "meeting", "message"
+    project: str          # Project directory name ("" for messages)
+    path: str             # Source file
+    line: int             # 1-based line of the entry in path
+    title: str
+    snippet: str          # Matching excerpt with [brackets] around hits
+    score: float          # bm25 rank (lower is better)
+
+
+def get_search_db_path(root_dir: Path) -> Path:
+    """Get the search database for a projects root"""
+    return root_dir / ".mission-control" / "search.db"
+
+
+def build_match_query(text: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 MATCH expression.
+
+    Every word must match; the last word also matches as a prefix so
+    results appear while typing. FTS5 operators in the input are ignored.
+
+    Returns:
+        MATCH expression, or None if the text has no searchable words
+    """
+    terms = QUERY_TERM_PATTERN.findall(text)
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+class SearchIndex:
+    """
+    SQLite FTS5 search index.
+
+    available is False when the SQLite build lacks FTS5 (or the database
+    cannot be opened); search() then returns no hits.
+    """
+
+    def __init__(self, db_path: Path, monitor_data_dir: Optional[Path] = None):
+        """
+        Initialize the search index.
+
+        Args:
+            db_path: Path to the SQLite database
+            monitor_data_dir: client-monitoring data directory (optional)
+        """
+        self.db_path = db_path
+        self.monitor_data_dir = monitor_data_dir
+        self.available = False
+        self.error: Optional[str] = None
+        self.conn: Optional[sqlite3.Connection] = None
+
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(db_path))
+            self._init_schema()
+            self.available = True
+        except (sqlite3.Error, OSError) as e:
+            self.error = str(e)
+
+    def update(self, projects: Iterable[Project]) -> int:
+        """
+        Re-index changed files and drop deleted ones.
+
+        Args:
+            projects: All loaded projects
+
+        Returns:
+            Number of files (re-)indexed
+        """
+        if not self.available:
+            return 0
+
+        known = dict(self.conn.execute("SELECT path, signature FROM documents"))
+        seen = set()
+        indexed = 0
+
+        with self.conn:
+            for kind, project, path in self._sources(projects):
+                key = str(path)
+                if key in seen:
+                    continue
+                try:
+                    signature = json.dumps(file_signature(path.stat()))
+                except OSError:
+                    continue
+                seen.add(key)
+
+                if known.get(key) == signature:
+                    continue
+
+                self._index_file(kind, project, path, signature)
+                indexed += 1
+
+            for key in known.keys() - seen:
+                self._delete_file(key)
+
+        return indexed
+
+    def search(self, text: str, limit: int = 50) -> List[SearchHit]:
+        """
+        Ranked full-text search.
+
+        Args:
+            text: Free-text query
+            limit: Maximum number of hits
+
+        Returns:
+            Hits ordered best first
+        """
+        query = build_match_query(text)
+        if not self.available or query is None:
+            return []
+
+        try:
+            rows = self.conn.execute(
+                """
+                SELECT kind, project, path, line, title,
+                       snippet(entries, 1, '[', ']', '…', 12),
+                       bm25(entries, 5.0, 1.0)
+                FROM entries
+                WHERE entries MATCH ?
+                ORDER BY bm25(entries, 5.0, 1.0)
+                LIMIT ?
+                """,
+                (query, limit)
+            ).fetchall()
+        except sqlite3.Error:
+            return []
+
+        return [SearchHit(*row) for row in rows]
+
+    def close(self):
+        """Close the database connection"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def _init_schema(self):
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SEARCH_INDEX_VERSION:
+            self.conn.executescript("""
+                DROP TABLE IF EXISTS documents;
+                DROP TABLE IF EXISTS entries;
+            """)
+
+        self.conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS documents (
+                path TEXT PRIMARY KEY,
+                signature TEXT NOT NULL
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS entries USING fts5(
+                title, body,
+                kind UNINDEXED, project UNINDEXED, path UNINDEXED, line UNINDEXED,
+                tokenize = 'porter unicode61'
+            );
+            PRAGMA user_version = {SEARCH_INDEX_VERSION};
+        """)
+
+    def _sources(self, projects: Iterable[Project]) -> Iterator[Tuple[str, str, Path]]:
+        """Yield (kind, project name, path) for every file to index"""
+        for project in projects:
+            name = project.project_dir.name
+            yield "project", name, project.project_md_path
+            yield "task", name, project.project_dir / "tasks.md"
+
+            notes_dir = project.project_dir / "meeting-notes"
+            if notes_dir.is_dir():
+                for note in sorted(notes_dir.glob("*.md")):
+                    yield "meeting", name, note
+
+        if self.monitor_data_dir is not None and self.monitor_data_dir.is_dir():
+            for item in sorted(self.monitor_data_dir.rglob("*.json")):
+                yield "message", "", item
+
+    def _index_file(self, kind: str, project: str, path: Path, signature: str):
+        """Replace all entries for one file"""
+        key = str(path)
+        try:
+            entries = list(EXTRACTORS[kind](path))
+        except Exception as e:
+            print(f"Warning: Could not index {path}: {e}")
+            entries = []
+
+        self.conn.execute("DELETE FROM entries WHERE path = ?", (key,))
+        self.conn.executemany(
+            "INSERT INTO entries (title, body, kind, project, path, line) VALUES (?, ?, ?, ?, ?, ?)",
+            [(title, body, kind, project, key, line) for title, body, line in entries]
+        )
+        self.conn.execute(
+            "INSERT OR REPLACE INTO documents (path, signature) VALUES (?, ?)",
+            (key, signature)
+        )
+
+    def _delete_file(self, key: str):
+        self.conn.execute("DELETE FROM entries WHERE path = ?", (key,))
+        self.conn.execute("DELETE FROM documents WHERE path = ?", (key,))
+
+
+def extract_project_sections(path: Path) -> Iterator[Entry]:
+    """PROJECT.md: one entry per heading section (frontmatter skipped)"""
+    lines = path.read_text().split('\n')
+    start = 0
+    if lines and lines[0].strip() == '---':
+        for i in range(1, len(lines)):
+            if lines[i].strip() == '---':
+                start = i + 1
+                break
+
+    title, title_line, body = path.parent.name, start + 1, []
+    for i in range(start, len(lines)):
+        match = HEADING_PATTERN.match(lines[i])
+        if match:
+            if body and any(part.strip() for part in body):
+                yield title, "\n".join(body), title_line
+            title, title_line, body = match.group(1), i + 1, []
+        else:
+            body.append(lines[i])
+
+    if any(part.strip() for part in body):
+        yield title, "\n".join(body), title_line
+
+
+def extract_tasks(path: Path) -> Iterator[Entry]:
+    """tasks.md: one entry per task, with its sub-item fields as body"""
+    for _, task in iter_task_tree(parse_tasks_file(path)):
+        body = [part for part in (task.assignee, task.due, task.context, task.source) if part]
+        body.extend(task.details)
+        yield task.text, "\n".join(body), task.line_number
+
+
+def extract_meeting_note(path: Path) -> Iterator[Entry]:
+    """meeting-notes/*.md: one entry per file, titled by its first heading"""
+    content = path.read_text()
+    title = path.stem
+    for line in content.split('\n', 20)[:20]:
+        match = HEADING_PATTERN.match(line)
+        if match:
+            title = match.group(1)
+            break
+    yield title, content, 1
+
+
+def extract_message(path: Path) -> Iterator[Entry]:
+    """client-monitoring JSON: one captured Teams message or email"""
+    data = json.loads(path.read_text())
+    title = data.get('subject') or data.get('from') or data.get('source', 'message')
+    body = "\n".join(
+        str(data[field]) for field in ('from', 'preview', 'content') if data.get(field)
+    )
+    yield title, body, 1
+
+
+EXTRACTORS = {
+    "project": extract_project_sections,
+    "task": extract_tasks,
+    "meeting": extract_meeting_note,
+    "message": extract_message,
+}
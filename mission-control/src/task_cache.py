@@ -0,0 +1,126 @@
+"""
+Task cache - parsed tasks.md files kept in memory between selections.
+
+Moving through the project list re-selects the same few projects over
+and over. The cache keeps each file's parsed tasks keyed by path and
+file signature (mtime, size, inode), so re-selecting a project costs one
+stat() instead of a read and parse. Neighbouring projects can be
+prefetched while the UI is idle.
+"""
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from .project_index import file_signature
+from .task_parser import Task, parse_tasks_file
+
+
+class TaskCache:
+    """
+    LRU cache of parse_tasks_file() results.
+
+    Entries are validated against the file signature on every get(), so
+    edits made outside Mission Control are picked up. Edits made through
+    Mission Control should call reload() (or invalidate()) afterwards.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        """
+        Initialize the task cache.
+
+        Args:
+            max_entries: Maximum number of files kept (least recently used dropped first)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Path, Tuple[List[int], List[Task]]]" = OrderedDict()
+
+    def get(self, tasks_file: Path) -> List[Task]:
+        """
+        Get the tasks for a file, parsing it only if it changed.
+
+        Args:
+            tasks_file: Path to tasks.md
+
+        Returns:
+            List of Task objects (empty if the file does not exist)
+        """
+        signature = self._signature(tasks_file)
+        if signature is None:
+            self._entries.pop(tasks_file, None)
+            return []
+
+        entry = self._entries.get(tasks_file)
+        if entry is not None and entry[0] == signature:
+            self._entries.move_to_end(tasks_file)
+            return list(entry[1])
+
+        return list(self._parse(tasks_file, signature))
+
+    def reload(self, tasks_file: Path) -> List[Task]:
+        """
+        Re-parse a file unconditionally (use after writing to it).
+
+        Args:
+            tasks_file: Path to tasks.md
+
+        Returns:
+            List of Task objects
+        """
+        self.invalidate(tasks_file)
+        return self.get(tasks_file)
+
+    def prefetch(self, tasks_files: Iterable[Path], limit: int = 2) -> int:
+        """
+        Parse files that are not cached yet (or changed), up to a limit.
+
+        Meant to be called from idle frames with the files of projects
+        next to the selection, so moving to them is a cache hit.
+
+        Args:
+            tasks_files: Candidate files, most important first
+            limit: Maximum number of files to parse in this call
+
+        Returns:
+            Number of files parsed
+        """
+        parsed = 0
+        for tasks_file in tasks_files:
+            if parsed >= limit:
+                break
+
+            signature = self._signature(tasks_file)
+            if signature is None:
+                continue
+
+            entry = self._entries.get(tasks_file)
+            if entry is not None and entry[0] == signature:
+                continue
+
+            self._parse(tasks_file, signature)
+            parsed += 1
+
+        return parsed
+
+    def invalidate(self, tasks_file: Path):
+        """Forget one file"""
+        self._entries.pop(tasks_file, None)
+
+    def clear(self):
+        """Forget every file"""
+        self._entries.clear()
+
+    def _parse(self, tasks_file: Path, signature: List[int]) -> List[Task]:
+        """Parse a file and store the result"""
+        tasks = parse_tasks_file(tasks_file)
+        self._entries[tasks_file] = (signature, tasks)
+        self._entries.move_to_end(tasks_file)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return tasks
+
+    @staticmethod
+    def _signature(tasks_file: Path) -> Optional[List[int]]:
+        try:
+            return file_signature(tasks_file.stat())
+        except OSError:
+            return None
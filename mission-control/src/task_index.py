@@ -0,0 +1,285 @@
+"""
+Global task index - every task from every tasks.md, queryable across projects.
+
+Parsed tasks are persisted in ~/projects/.mission-control/task-index.json
+together with each file's signature (mtime, size, inode), so a refresh
+only re-parses tasks.md files that changed since the last run. Queries
+(assignee, blocked, due dates, keyword) run against in-memory lookup
+tables built once per refresh.
+"""
+import json
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .document_writer import atomic_write_text
+from .models import Project, current_day
+from .project_index import file_signature
+from .task_parser import Task, COMPLETED_STATUSES, parse_tasks_file
+
+
+# Bump when the stored task fields change
+TASK_INDEX_VERSION = 1
+
+BLOCKED_STATUS = '[!]'
+
+
+class IndexedTask(NamedTuple):
+    """One task (or sub-task) as stored in the global index"""
+    project: str          # Project directory name
+    tasks_file: str       # Path to the tasks.md it came from
+    line_number: int
+    end_line: int
+    depth: int            # 0 for top-level tasks, 1+ for sub-tasks
+    status: str
+    text: str
+    assignee: Optional[str]
+    due: Optional[date]
+    context: Optional[str]
+    source: Optional[str]
+
+    @property
+    def is_open(self) -> bool:
+        """Returns True unless the task is completed or cancelled"""
+        return self.status not in COMPLETED_STATUSES
+
+
+def get_task_index_path(root_dir: Path) -> Path:
+    """Get the task index file for a projects root"""
+    return root_dir / ".mission-control" / "task-index.json"
+
+
+def iter_task_tree(tasks: List[Task], depth: int = 0) -> Iterator[Tuple[int, Task]]:
+    """
+    Walk a parsed task tree depth-first.
+
+    Yields:
+        (depth, Task) for every task and sub-task in file order
+    """
+    for task in tasks:
+        yield depth, task
+        if task.children:
+            yield from iter_task_tree(task.children, depth + 1)
+
+
+class TaskIndex:
+    """
+    Tasks from all projects with cross-project queries.
+
+    Call refresh() with the current project list before querying; it
+    stats every tasks.md and re-parses only the ones that changed.
+    """
+
+    def __init__(self, index_file: Path):
+        """
+        Initialize the task index.
+
+        Args:
+            index_file: Path to the JSON index file
+        """
+        self.index_file = index_file
+        self.files: Dict[str, Dict] = {}  # tasks.md path -> {"signature", "project", "tasks"}
+        self.dirty = False
+        self._tasks: Optional[List[IndexedTask]] = None
+        self._load()
+
+    def refresh(self, projects: Iterable[Project]) -> int:
+        """
+        Bring the index up to date with the projects' tasks.md files.
+
+        Args:
+            projects: All loaded projects
+
+        Returns:
+            Number of tasks.md files that were (re-)parsed
+        """
+        parsed = 0
+        live = set()
+
+        for project in projects:
+            tasks_file = project.project_dir / "tasks.md"
+            key = str(tasks_file)
+            try:
+                signature = file_signature(tasks_file.stat())
+            except OSError:
+                continue
+            live.add(key)
+
+            entry = self.files.get(key)
+            if entry is not None and entry["signature"] == signature and \
+                    entry["project"] == project.project_dir.name:
+                continue
+
+            self.files[key] = {
+                "signature": signature,
+                "project": project.project_dir.name,
+                "tasks": [
+                    [task.line_number, task.end_line, depth, task.status, task.text,
+                     task.assignee, task.due_date.isoformat() if task.due_date else None,
+                     task.context, task.source]
+                    for depth, task in iter_task_tree(parse_tasks_file(tasks_file))
+                ]
+            }
+            parsed += 1
+
+        stale = [key for key in self.files if key not in live]
+        for key in stale:
+            del self.files[key]
+
+        if parsed or stale:
+            self.dirty = True
+            self._tasks = None
+        return parsed
+
+    def tasks(self) -> List[IndexedTask]:
+        """All indexed tasks, ordered by project file then line"""
+        if self._tasks is None:
+            self._build()
+        return self._tasks
+
+    def open_tasks(self) -> List[IndexedTask]:
+        """All tasks that are not completed or cancelled"""
+        return [task for task in self.tasks() if task.is_open]
+
+    def assigned_to(self, assignee: str, open_only: bool = True) -> List[IndexedTask]:
+        """
+        Tasks assigned to someone.
+
+        Args:
+            assignee: Name, case-insensitive; a partial name ("jason")
+                      matches every assignee containing it
+            open_only: Skip completed/cancelled tasks
+
+        Returns:
+            Matching tasks in index order
+        """
+        self.tasks()
+        needle = assignee.strip().lower()
+        names = [needle] if needle in self._by_assignee else \
+            [name for name in self._by_assignee if needle in name]
+
+        positions = sorted(pos for name in names for pos in self._by_assignee[name])
+        return self._select(positions, open_only)
+
+    def blocked(self) -> List[IndexedTask]:
+        """All [!] tasks"""
+        self.tasks()
+        return self._select(self._by_status.get(BLOCKED_STATUS, []), open_only=False)
+
+    def due_between(self, start: date, end: date, open_only: bool = True) -> List[IndexedTask]:
+        """
+        Tasks due in a date range.
+
+        Args:
+            start: First day (inclusive)
+            end: Last day (inclusive)
+            open_only: Skip completed/cancelled tasks
+
+        Returns:
+            Matching tasks ordered by due date
+        """
+        self.tasks()
+        lo = bisect_left(self._due_keys, start.toordinal())
+        hi = bisect_right(self._due_keys, end.toordinal())
+        return self._select(self._due_positions[lo:hi], open_only, keep_order=True)
+
+    def due_this_week(self, today: Optional[date] = None) -> List[IndexedTask]:
+        """Open tasks due Monday-Sunday of the current week"""
+        today = today or current_day()
+        monday = today - timedelta(days=today.weekday())
+        return self.due_between(monday, monday + timedelta(days=6))
+
+    def overdue(self, today: Optional[date] = None) -> List[IndexedTask]:
+        """Open tasks whose due date has passed"""
+        today = today or current_day()
+        return self.due_between(date.min, today - timedelta(days=1))
+
+    def search(self, keyword: str, open_only: bool = False) -> List[IndexedTask]:
+        """
+        Tasks whose text, context or assignee contains a keyword.
+
+        Args:
+            keyword: Case-insensitive substring
+            open_only: Skip completed/cancelled tasks
+
+        Returns:
+            Matching tasks in index order
+        """
+        tasks = self.tasks()
+        needle = keyword.strip().lower()
+        if not needle:
+            return []
+        return [tasks[pos] for pos, text in enumerate(self._search_text)
+                if needle in text and (not open_only or tasks[pos].is_open)]
+
+    def save(self):
+        """Write the index to disk if it changed (atomic replace)"""
+        if not self.dirty:
+            return
+
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(self.index_file, json.dumps({
+                "version": TASK_INDEX_VERSION,
+                "files": self.files
+            }))
+            self.dirty = False
+        except OSError as e:
+            print(f"Warning: Could not save task index {self.index_file}: {e}")
+
+    def _select(self, positions: List[int], open_only: bool,
+                keep_order: bool = False) -> List[IndexedTask]:
+        tasks = self._tasks
+        if not keep_order:
+            positions = sorted(positions)
+        return [tasks[pos] for pos in positions if not open_only or tasks[pos].is_open]
+
+    def _build(self):
+        """Flatten stored files into IndexedTask records and lookup tables"""
+        tasks: List[IndexedTask] = []
+        for key in sorted(self.files):
+            entry = self.files[key]
+            for line_number, end_line, depth, status, text, assignee, due, context, source \
+                    in entry["tasks"]:
+                tasks.append(IndexedTask(
+                    entry["project"], key, line_number, end_line, depth, status, text,
+                    assignee, date.fromisoformat(due) if due else None, context, source
+                ))
+
+        by_assignee: Dict[str, List[int]] = {}
+        by_status: Dict[str, List[int]] = {}
+        dated = []
+        search_text = []
+        for pos, task in enumerate(tasks):
+            if task.assignee:
+                by_assignee.setdefault(task.assignee.lower(), []).append(pos)
+            by_status.setdefault(task.status, []).append(pos)
+            if task.due is not None:
+                dated.append((task.due.toordinal(), pos))
+            search_text.append(" ".join(
+                part for part in (task.text, task.context, task.assignee) if part
+            ).lower())
+
+        dated.sort()
+        self._tasks = tasks
+        self._by_assignee = by_assignee
+        self._by_status = by_status
+        self._due_keys = [ordinal for ordinal, _ in dated]
+        self._due_positions = [pos for _, pos in dated]
+        self._search_text = search_text
+
+    def _load(self):
+        """Load the index from disk, starting empty if missing or outdated"""
+        if not self.index_file.exists():
+            return
+
+        try:
+            data = json.loads(self.index_file.read_text())
+        except Exception:
+            return
+
+        if data.get("version") != TASK_INDEX_VERSION:
+            return
+
+        self.files = data.get("files", {})
@@ -6,6 +6,13 @@ from typing import List, Optional, Dict
 from dataclasses import dataclass
 import re
 
+try:
+    from .project_registry import get_project_registry
+    from .document_writer import DocumentTransaction
+except ImportError:
+    from project_registry import get_project_registry
+    from document_writer import DocumentTransaction
+
 
 @dataclass
 class TaskToMove:
@@ -32,14 +39,20 @@ class TaskManager:
             projects_dir: Root projects directory
         """
         self.projects_dir = projects_dir
+        self.registry = get_project_registry(projects_dir)
 
-    def move_task(self, task: TaskToMove, dest_project_name: str) -> Dict:
+    def move_task(self, task: TaskToMove, dest_project_name: str,
+                  txn: Optional[DocumentTransaction] = None) -> Dict:
         """
         Move a task from one project to another.
 
+        Both files are written together (atomically) or not at all.
+
         Args:
             task: TaskToMove object with source info
             dest_project_name: Destination project name
+            txn: Transaction to stage the edits in (committed by the caller);
+                 if None the move is committed immediately
 
         Returns:
             Result dict with success status and details
@@ -69,11 +82,22 @@ class TaskManager:
             return result
 
         try:
-            # Add task to destination
-            self._add_task_to_file(dest_tasks_file, task)
-
-            # Remove task from source
-            self._remove_task_from_file(task.source_file, task)
+            commit = txn is None
+            if commit:
+                txn = DocumentTransaction()
+
+            # Compute both edits before staging either, so a failed move
+            # leaves nothing behind in a shared transaction
+            source_content = txn.read(task.source_file)
+            if source_content is None:
+                raise ValueError(f"Source tasks.md not found: {task.source_file}")
+            source_content = self._remove_task_lines(source_content, task)
+            dest_content = self._insert_task_lines(txn.read(dest_tasks_file), task)
+
+            txn.write(task.source_file, source_content)
+            txn.write(dest_tasks_file, dest_content)
+            if commit:
+                txn.commit()
 
             result['success'] = True
 
@@ -114,7 +138,8 @@ class TaskManager:
 
         try:
             # Add task to destination (don't remove from source)
-            self._add_task_to_file(dest_tasks_file, task)
+            with DocumentTransaction() as txn:
+                txn.edit(dest_tasks_file, lambda content: self._insert_task_lines(content, task))
 
             result['success'] = True
 
@@ -128,6 +153,9 @@ class TaskManager:
         """
         Move multiple tasks to another project.
 
+        All moves are staged in one transaction, so each tasks.md involved
+        is read and written once no matter how many tasks move.
+
         Args:
             tasks: List of TaskToMove objects
             dest_project_name: Destination project name
@@ -142,8 +170,9 @@ class TaskManager:
             'errors': []
         }
 
+        txn = DocumentTransaction()
         for task in tasks:
-            result = self.move_task(task, dest_project_name)
+            result = self.move_task(task, dest_project_name, txn)
 
             if result['success']:
                 summary['moved'] += 1
@@ -151,24 +180,31 @@ class TaskManager:
                 summary['failed'] += 1
                 summary['errors'].append(result['error'])
 
+        try:
+            txn.commit()
+        except Exception as e:
+            # Nothing was written
+            summary['failed'] += summary['moved']
+            summary['moved'] = 0
+            summary['errors'].append(f'Write error: {e}')
+
         return summary
 
     def _find_project_dir(self, project_name: str) -> Optional[Path]:
         """Find project directory by name"""
-        for project_file in self.projects_dir.rglob("PROJECT.md"):
-            if project_file.parent.name == project_name:
-                return project_file.parent
-        return None
+        return self.registry.find(project_name)
 
-    def _add_task_to_file(self, tasks_file: Path, task: TaskToMove):
+    def _insert_task_lines(self, content: str, task: TaskToMove) -> str:
         """
-        Add a task to a tasks.md file.
+        Add a task to tasks.md content.
 
         Args:
-            tasks_file: Path to destination tasks.md
+            content: Destination tasks.md content
             task: TaskToMove object
+
+        Returns:
+            New content
         """
-        content = tasks_file.read_text()
         lines = content.split('\n')
 
         # Determine task priority from checkbox state or text
@@ -195,31 +231,30 @@ class TaskManager:
                     # Add section header if needed
                     task_lines = [f"\n{section_header}"] + task.lines + ['']
                     lines[insert_idx:insert_idx] = task_lines
-                    tasks_file.write_text('\n'.join(lines))
-                    return
+                    return '\n'.join(lines)
 
         # If we found the priority section, insert there
         if insert_idx is not None:
             # Insert task lines
             task_lines = task.lines + ['']  # Add blank line after
             lines[insert_idx:insert_idx] = task_lines
-            tasks_file.write_text('\n'.join(lines))
-            return
+            return '\n'.join(lines)
 
         # Last resort: append to end
-        new_content = content.rstrip() + '\n\n## Moved Tasks\n\n' + \
-                     section_header + '\n' + '\n'.join(task.lines) + '\n'
-        tasks_file.write_text(new_content)
+        return content.rstrip() + '\n\n## Moved Tasks\n\n' + \
+            section_header + '\n' + '\n'.join(task.lines) + '\n'
 
-    def _remove_task_from_file(self, tasks_file: Path, task: TaskToMove):
+    def _remove_task_lines(self, content: str, task: TaskToMove) -> str:
         """
-        Remove a task from a tasks.md file.
+        Remove a task from tasks.md content.
 
         Args:
-            tasks_file: Path to source tasks.md
+            content: Source tasks.md content
             task: TaskToMove object
+
+        Returns:
+            New content
         """
-        content = tasks_file.read_text()
         lines = content.split('\n')
 
         # Find and remove the task lines
@@ -246,7 +281,7 @@ class TaskManager:
         while task_start_idx < len(lines) and not lines[task_start_idx].strip():
             del lines[task_start_idx]
 
-        tasks_file.write_text('\n'.join(lines))
+        return '\n'.join(lines)
 
     def _find_section_end(self, lines: List[str], section_start: int) -> int:
         """
@@ -1,14 +1,43 @@
 """
 Task parser - reads and parses tasks from tasks.md files.
+
+Edits (toggle, delete, undo) address a task by the span captured when the
+file was parsed - its character offset, line range and a hash of its line -
+and splice only that region of the text. If the file changed in a way that
+moved or altered the task, the edit is rejected instead of touching the
+wrong line.
 """
 import re
+import sys
+from itertools import accumulate
 from pathlib import Path
 from typing import List, Optional, Tuple
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import date, datetime
 
+try:
+    from .models import SLOTS
+    from .document_writer import atomic_write_text
+except ImportError:
+    from models import SLOTS
+    from document_writer import atomic_write_text
 
-@dataclass
+
+# "[X] text" after a "- " bullet (status marker may be empty, e.g. "[]")
+CHECKBOX_PATTERN = re.compile(r'(\[.?\]) (.+)$')
+
+# Indented "- Name: value" field or any other "- item"
+SUB_ITEM_PATTERN = re.compile(r'^( +)- (?:(Assignee|Due|Context|Source):\s*(.+)|(.*))$')
+
+# "(from meeting-notes.docx)" appended to Context by the content router
+SOURCE_SUFFIX_PATTERN = re.compile(r'\(from (.+)\)\s*$')
+
+DUE_DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+COMPLETED_STATUSES = frozenset(('[✓]', '[×]'))
+
+
+@dataclass(**SLOTS)
 class Task:
     """Represents a single task from tasks.md"""
     text: str
@@ -16,6 +45,33 @@ class Task:
     line_number: int
     is_completed: bool
     assignee: Optional[str] = None  # Who owns this task
+    due: Optional[str] = None       # Raw "Due:" value, e.g. "2026-01-10 (Friday)"
+    context: Optional[str] = None   # "Context:" value
+    source: Optional[str] = None    # "Source:" value, or "(from ...)" at the end of Context
+    children: List["Task"] = field(default_factory=list)  # Indented sub-tasks
+    details: List[str] = field(default_factory=list)      # Other sub-items (notes, etc.)
+    end_line: int = 0  # Last line of the task block (line_number..end_line)
+    offset: int = 0     # Character offset of the task line in the file text
+    line_hash: int = 0  # hash() of the task line as parsed (in-process only)
+
+    def __post_init__(self):
+        # Only six status markers exist - share one string object per marker
+        self.status = sys.intern(self.status)
+        if not self.end_line:
+            self.end_line = self.line_number
+
+    @property
+    def due_date(self) -> Optional[date]:
+        """Returns the first YYYY-MM-DD date in the Due value, if any"""
+        if not self.due:
+            return None
+        match = DUE_DATE_PATTERN.search(self.due)
+        if not match:
+            return None
+        try:
+            return date.fromisoformat(match.group(0))
+        except ValueError:
+            return None
 
     @property
     def status_display(self) -> str:
@@ -38,6 +94,8 @@ class DeletedTask:
     line_number: int
     content: List[str]  # The task line and all its sub-items
     deleted_at: datetime
+    offset: int = 0                    # Character offset the block was removed from
+    anchor_hash: Optional[int] = None  # hash() of the line that followed it (None at EOF)
 
 
 def parse_tasks_file(tasks_file: Path) -> List[Task]:
@@ -48,93 +106,174 @@ def parse_tasks_file(tasks_file: Path) -> List[Task]:
         tasks_file: Path to tasks.md file
 
     Returns:
-        List of Task objects
+        List of top-level Task objects (sub-tasks are in Task.children)
     """
     if not tasks_file.exists():
         return []
 
     try:
-        content = tasks_file.read_text()
-        lines = content.split('\n')
-        tasks = []
-
-        # Match task lines: - [X] Task text
-        task_pattern = r'^- (\[.?\]) (.+)$'
-        assignee_pattern = r'^\s+- Assignee:\s*(.+)$'
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            match = re.match(task_pattern, line)
-            if match:
-                status = match.group(1)
-                text = match.group(2).strip()
-                is_completed = status in ['[✓]', '[×]']
-                assignee = None
-
-                # Look ahead for assignee on next lines
-                j = i + 1
-                while j < len(lines) and lines[j].startswith('  '):
-                    assignee_match = re.match(assignee_pattern, lines[j])
-                    if assignee_match:
-                        assignee = assignee_match.group(1).strip()
-                        break
-                    j += 1
-
-                tasks.append(Task(
-                    text=text,
-                    status=status,
-                    line_number=i + 1,
-                    is_completed=is_completed,
-                    assignee=assignee
-                ))
-            i += 1
-
-        return tasks
+        return parse_task_lines(tasks_file.read_text().split('\n'))
 
     except Exception as e:
         print(f"Error parsing tasks file {tasks_file}: {e}")
         return []
 
 
-def toggle_task_completion(tasks_file: Path, line_number: int) -> bool:
+def parse_task_lines(lines: List[str]) -> List[Task]:
+    """
+    Parse tasks.md content in a single pass.
+
+    A task block is a "- [X] text" line followed by lines indented with at
+    least two spaces. Inside a block, "- Assignee:", "- Due:", "- Context:"
+    and "- Source:" items set fields on the nearest enclosing task, nested
+    "- [X] text" items become child tasks, and other items go to details.
+
+    Args:
+        lines: File content split on newlines
+
+    Returns:
+        List of top-level Task objects in file order
+    """
+    tasks = []
+    open_tasks: List[Tuple[int, Task]] = []  # (indent, task) of the current block, outermost first
+    last_indented = 0  # Line number of the latest indented line
+    parsed: List[Task] = []  # Every task and sub-task, for the offset pass
+
+    for line_number, line in enumerate(lines, 1):
+        if line.startswith('  '):
+            if not open_tasks:
+                continue
+            last_indented = line_number
+
+            match = SUB_ITEM_PATTERN.match(line)
+            if match is None:
+                continue  # Continuation text
+
+            indent, name, value, item = match.groups()
+            depth = len(indent)
+            while len(open_tasks) > 1 and open_tasks[-1][0] >= depth:
+                open_tasks.pop()[1].end_line = line_number - 1
+            owner = open_tasks[-1][1]
+
+            # First value wins for each field
+            if name is None:
+                checkbox = CHECKBOX_PATTERN.match(item)
+                if checkbox:
+                    status, text = checkbox.groups()
+                    child = Task(text.strip(), status, line_number, status in COMPLETED_STATUSES)
+                    child.line_hash = hash(line)
+                    parsed.append(child)
+                    owner.children.append(child)
+                    open_tasks.append((depth, child))
+                else:
+                    owner.details.append(item.strip())
+            elif name == 'Assignee':
+                if owner.assignee is None:
+                    owner.assignee = value.strip()
+            elif name == 'Due':
+                if owner.due is None:
+                    owner.due = value.strip()
+            elif name == 'Context':
+                if owner.context is None:
+                    owner.context = value.strip()
+                    if owner.source is None:
+                        source = SOURCE_SUFFIX_PATTERN.search(value)
+                        if source:
+                            owner.source = source.group(1)
+            else:
+                # An explicit Source line wins over "(from ...)" in Context
+                owner.source = value.strip()
+            continue
+
+        # Anything unindented ends the current block
+        if open_tasks:
+            _close_block(open_tasks, last_indented)
+            open_tasks = []
+
+        if line.startswith('- '):
+            checkbox = CHECKBOX_PATTERN.match(line, 2)
+            if checkbox:
+                status, text = checkbox.groups()
+                task = Task(text.strip(), status, line_number, status in COMPLETED_STATUSES)
+                task.line_hash = hash(line)
+                parsed.append(task)
+                tasks.append(task)
+                open_tasks = [(0, task)]
+
+    _close_block(open_tasks, last_indented)
+
+    if parsed:
+        # Character offset of line n is len(lines[0..n-2]) plus n-1 newlines
+        ends = list(accumulate(map(len, lines)))
+        for task in parsed:
+            n = task.line_number
+            task.offset = ends[n - 2] + n - 1 if n > 1 else 0
+    return tasks
+
+
+def _close_block(open_tasks: List[Tuple[int, Task]], last_line: int):
+    """Extend the spans of the still-open tasks to the end of their block"""
+    for _, task in open_tasks:
+        if last_line > task.end_line:
+            task.end_line = last_line
+
+
+def _locate_task_line(text: str, task: Task) -> Optional[Tuple[int, int]]:
+    """
+    Find a parsed task's line in the current file text.
+
+    Returns:
+        (start, end) character span of the line, or None if the text at the
+        task's offset is no longer the line that was parsed
+    """
+    start = task.offset
+    if start > len(text) or (start and text[start - 1] != '\n'):
+        return None
+    end = text.find('\n', start)
+    if end < 0:
+        end = len(text)
+    if hash(text[start:end]) != task.line_hash:
+        return None
+    return start, end
+
+
+def toggle_task_completion(tasks_file: Path, task: Task) -> bool:
     """
     Toggle a task's completion status in the tasks.md file.
 
-    Toggles between [ ] and [✓].
+    Toggles between [ ] and [✓]. Only the task's line is patched.
 
     Args:
         tasks_file: Path to tasks.md file
-        line_number: Line number of the task to toggle (1-indexed)
+        task: Task as returned by parse_tasks_file() for this file
 
     Returns:
-        True if successful, False otherwise
+        True if successful, False otherwise (including when the file
+        changed since it was parsed)
     """
     if not tasks_file.exists():
         return False
 
     try:
-        lines = tasks_file.read_text().split('\n')
-
-        # Convert to 0-indexed
-        idx = line_number - 1
-
-        if idx < 0 or idx >= len(lines):
-            return False
+        text = tasks_file.read_text()
+        span = _locate_task_line(text, task)
+        if span is None:
+            return False  # File changed since it was parsed
 
-        line = lines[idx]
+        start, end = span
+        line = text[start:end]
 
         # Toggle [ ] <-> [✓]
         if '[ ]' in line:
-            lines[idx] = line.replace('[ ]', '[✓]', 1)
+            line = line.replace('[ ]', '[✓]', 1)
         elif '[✓]' in line:
-            lines[idx] = line.replace('[✓]', '[ ]', 1)
+            line = line.replace('[✓]', '[ ]', 1)
         else:
             # Line doesn't have a toggleable status
             return False
 
         # Write back to file
-        tasks_file.write_text('\n'.join(lines))
+        atomic_write_text(tasks_file, text[:start] + line + text[end:])
         return True
 
     except Exception as e:
@@ -157,15 +296,17 @@ def count_task_stats(tasks: List[Task]) -> Tuple[int, int]:
     return (total, completed)
 
 
-def delete_task(tasks_file: Path, line_number: int) -> Optional[DeletedTask]:
+def delete_task(tasks_file: Path, task: Task) -> Optional[DeletedTask]:
     """
     Delete a task from the tasks.md file.
 
-    Removes the task line and all its sub-items (lines starting with "  - ").
+    Removes the task line and its block (the indented lines after it, as
+    spanned at parse time). The block is verified before anything is cut:
+    if the task line changed or the block grew or shrank, nothing is deleted.
 
     Args:
         tasks_file: Path to tasks.md file
-        line_number: Line number of the task to delete (1-indexed)
+        task: Top-level Task as returned by parse_tasks_file() for this file
 
     Returns:
         DeletedTask object for undo, or None if deletion failed
@@ -174,43 +315,43 @@ def delete_task(tasks_file: Path, line_number: int) -> Optional[DeletedTask]:
         return None
 
     try:
-        lines = tasks_file.read_text().split('\n')
-
-        # Convert to 0-indexed
-        idx = line_number - 1
-
-        if idx < 0 or idx >= len(lines):
-            return None
-
-        line = lines[idx]
-
-        # Verify this is a task line
-        if not re.match(r'^- \[.?\] ', line):
-            return None
-
-        # Collect the task and all its sub-items
-        deleted_lines = [line]
-        j = idx + 1
-
-        # Get all following lines that start with "  - " (sub-items)
-        while j < len(lines) and lines[j].startswith('  - '):
-            deleted_lines.append(lines[j])
-            j += 1
+        text = tasks_file.read_text()
+        span = _locate_task_line(text, task)
+        if span is None or not text.startswith('- [', span[0]):
+            return None  # File changed since it was parsed (or not a top-level task)
+
+        # Walk the block's remaining lines; all must still be indented
+        start, block_end = span
+        for _ in range(task.end_line - task.line_number):
+            if block_end == len(text) or not text.startswith('  ', block_end + 1):
+                return None
+            block_end = text.find('\n', block_end + 1)
+            if block_end < 0:
+                block_end = len(text)
+        if block_end < len(text) and text.startswith('  ', block_end + 1):
+            return None  # Block has more lines than when parsed
+
+        # Cut the block together with one line separator
+        if block_end < len(text):
+            remaining = text[:start] + text[block_end + 1:]
+            anchor_end = text.find('\n', block_end + 1)
+            anchor_hash = hash(text[block_end + 1:anchor_end if anchor_end >= 0 else len(text)])
+        else:
+            remaining = text[:max(0, start - 1)]
+            anchor_hash = None
 
         # Create DeletedTask record for undo
         deleted_task = DeletedTask(
             file_path=tasks_file,
-            line_number=line_number,
-            content=deleted_lines,
-            deleted_at=datetime.now()
+            line_number=task.line_number,
+            content=text[start:block_end].split('\n'),
+            deleted_at=datetime.now(),
+            offset=start,
+            anchor_hash=anchor_hash
         )
 
-        # Remove the task and its sub-items
-        num_lines_to_remove = len(deleted_lines)
-        del lines[idx:idx + num_lines_to_remove]
-
         # Write back to file
-        tasks_file.write_text('\n'.join(lines))
+        atomic_write_text(tasks_file, remaining)
 
         return deleted_task
 
@@ -223,6 +364,10 @@ def undo_task_deletion(deleted_task: DeletedTask) -> bool:
     """
     Restore a previously deleted task.
 
+    The block is reinserted at its original offset, provided the line that
+    followed it is still there; otherwise the file changed and the undo is
+    refused.
+
     Args:
         deleted_task: DeletedTask object from delete_task()
 
@@ -233,17 +378,31 @@ def undo_task_deletion(deleted_task: DeletedTask) -> bool:
         return False
 
     try:
-        lines = deleted_task.file_path.read_text().split('\n')
-
-        # Convert to 0-indexed
-        idx = deleted_task.line_number - 1
+        text = deleted_task.file_path.read_text()
+        block = '\n'.join(deleted_task.content)
+        offset = deleted_task.offset
+
+        if deleted_task.anchor_hash is None:
+            # Deleted from the end of the file
+            if offset == 0 and not text:
+                restored = block
+            elif offset == len(text) + 1:
+                restored = text + '\n' + block
+            else:
+                restored = None
+        elif offset <= len(text) and (offset == 0 or text[offset - 1] == '\n'):
+            anchor_end = text.find('\n', offset)
+            anchor = text[offset:anchor_end if anchor_end >= 0 else len(text)]
+            restored = text[:offset] + block + '\n' + text[offset:] \
+                if hash(anchor) == deleted_task.anchor_hash else None
+        else:
+            restored = None
 
-        # Insert the deleted content back at the original position
-        for i, line in enumerate(deleted_task.content):
-            lines.insert(idx + i, line)
+        if restored is None:
+            return False  # File changed since the deletion
 
         # Write back to file
-        deleted_task.file_path.write_text('\n'.join(lines))
+        atomic_write_text(deleted_task.file_path, restored)
 
         return True
 
@@ -0,0 +1,109 @@
+"""
+Split long transcripts into analysis-sized chunks.
+
+Multi-hour meeting transcripts do not fit in one analysis call (and the
+JSON answer would be truncated), so ContentAnalyzer analyzes them in
+chunks. Chunks are cut at the most natural boundary that keeps each one
+under max_chars, in order of preference:
+
+    section heading ("## Budget", "ACTION ITEMS:")
+    speaker turn ("Jason Pace: ...", "[00:41:10] Michelle: ...", "Speaker 2 (12:03): ...")
+    paragraph (first line after a blank line)
+    any line
+
+A chunk that starts inside a section is prefixed with that section's
+heading so the model keeps the project context.
+"""
+import re
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Optional
+
+# ~6k tokens of input per chunk leaves room for a complete JSON answer
+CHUNK_CHARS = 24000
+
+# Cut points never leave a chunk smaller than this fraction of max_chars
+MIN_FILL = 0.5
+
+HEADING_PATTERN = re.compile(r'^(?:#{1,6}\s+\S.*|[A-Z][A-Z0-9 &/\'-]{3,}:?\s*)$')
+SPEAKER_PATTERN = re.compile(
+    r'^\s*(?:\[?\d{1,2}:\d{2}(?::\d{2})?\]?\s+)?'       # optional [00:41:10] timestamp
+    r'[A-Z][\w.\'-]*(?: [A-Z][\w.\'-]*){0,3}'            # one to four capitalized words
+    r'\s*(?:\(\d{1,2}:\d{2}(?::\d{2})?\))?:\s'           # optional (12:03), then ": "
+)
+
+LEVEL_LINE, LEVEL_PARAGRAPH, LEVEL_SPEAKER, LEVEL_HEADING = range(4)
+
+
+def boundary_level(lines: List[str], i: int) -> int:
+    """How good a place the start of line i is to cut at"""
+    line = lines[i]
+    if HEADING_PATTERN.match(line):
+        return LEVEL_HEADING
+    if SPEAKER_PATTERN.match(line):
+        return LEVEL_SPEAKER
+    if line.strip() and i > 0 and not lines[i - 1].strip():
+        return LEVEL_PARAGRAPH
+    return LEVEL_LINE
+
+
+def split_transcript(content: str, max_chars: int = CHUNK_CHARS) -> List[str]:
+    """
+    Split content into chunks of at most max_chars at natural boundaries.
+
+    Args:
+        content: Full transcript/notes text
+        max_chars: Maximum characters per chunk (a section-heading prefix
+                   may add one short line)
+
+    Returns:
+        Chunks in document order; [content] if it already fits
+    """
+    if len(content) <= max_chars:
+        return [content]
+
+    lines = content.split('\n')
+    # starts[i] = character offset of line i; starts[-1] = len(content) + 1
+    starts = [0] + list(accumulate(len(line) + 1 for line in lines))
+
+    chunks = []
+    section: Optional[str] = None  # Heading in effect at the chunk start
+    start = 0
+    while start < len(lines):
+        # Furthest line end that keeps the chunk within max_chars
+        end = bisect_right(starts, starts[start] + max_chars + 1) - 1
+
+        if end <= start:
+            # A single line longer than max_chars: hard-split it
+            line = lines[start]
+            chunks.extend(line[i:i + max_chars] for i in range(0, len(line), max_chars))
+            start += 1
+            continue
+
+        if end < len(lines):
+            # Best boundary in the back half of the window (latest of the best level)
+            floor = starts[start] + int(max_chars * MIN_FILL)
+            best, best_level = end, -1
+            for i in range(end, start, -1):
+                if starts[i] < floor:
+                    break
+                level = boundary_level(lines, i)
+                if level > best_level:
+                    best, best_level = i, level
+                    if level == LEVEL_HEADING:
+                        break
+            end = best
+
+        chunk_lines = lines[start:end]
+        text = '\n'.join(chunk_lines).strip('\n')
+        if text.strip():
+            if section and not HEADING_PATTERN.match(chunk_lines[0]):
+                text = f"{section} (continued)\n{text}"
+            chunks.append(text)
+
+        for line in chunk_lines:
+            if HEADING_PATTERN.match(line):
+                section = line.strip()
+        start = end
+
+    return chunks
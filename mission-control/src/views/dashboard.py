@@ -33,11 +33,11 @@ def get_status_color(project: Project) -> int:
         return COLOR_BLOCKED
     elif project.is_overdue:
         return COLOR_BLOCKED
-    elif project.status.lower() == "active":
+    elif project.status == "active":
         return COLOR_ACTIVE if not project.is_stale else COLOR_STALE
-    elif project.status.lower() == "on-hold":
+    elif project.status == "on-hold":
         return COLOR_HOLD
-    elif project.status.lower() == "completed":
+    elif project.status == "completed":
         return COLOR_COMPLETED
     else:
         return COLOR_STALE
@@ -51,9 +51,9 @@ def get_status_emoji(project: Project) -> str:
         return "⏰"
     elif project.needs_review:
         return "👀"
-    elif project.priority.lower() == "high":
+    elif project.priority == "high":
         return "📌"
-    elif project.status.lower() == "completed":
+    elif project.status == "completed":
         return "✅"
     else:
         return "  "
@@ -173,7 +173,7 @@ def render_dashboard(stdscr, projects: List[Project], selected_idx: int, sort_by
 
     # Count attention items
     blocked_projects = [p for p in projects if p.blocked]
-    stale_projects = [p for p in projects if p.is_stale and p.status.lower() == "active"]
+    stale_projects = [p for p in projects if p.is_stale and p.status == "active"]
     overdue_projects = [p for p in projects if p.is_overdue]
 
     attention_items = []
@@ -62,6 +62,9 @@ def render_help_modal(stdscr):
             ("s", "Cycle sort: priority → category → due → updated → name → risk"),
             ("f", "Cycle filter: all → active → blocked → work → personal → dev → family → high"),
             ("r", "Refresh all data from disk"),
+            ("t", "Portfolio stats: risk, overdue, burn-down, hours"),
+            ("a", "All tasks: due this week, overdue, blocked, by assignee"),
+            ("/", "Search projects, tasks, meeting notes and messages"),
         ]),
         ("Summary Pane", [
             ("↑/↓ or k/j", "Scroll summary content up/down"),
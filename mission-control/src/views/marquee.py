@@ -17,16 +17,18 @@ class Marquee:
     "Project Name: Update text • Project Name: Update text • ..."
     """
 
-    def __init__(self, refresh_interval: int = 30):
+    def __init__(self, refresh_interval: int = 30, max_items: int = 60):
         """
         Initialize marquee.
 
         Args:
             refresh_interval: Seconds between content refreshes (default: 30)
+            max_items: Maximum number of updates in the ticker (default: 60)
         """
         self.scroll_position = 0
         self.last_refresh = 0
         self.refresh_interval = refresh_interval
+        self.max_items = max_items
         self.content = ""
         self.last_update_time = 0
 
@@ -34,12 +36,19 @@ class Marquee:
         """
         Refresh marquee content from project list.
 
+        Most recently updated projects come first. Once max_items updates
+        are collected the remaining projects are skipped, so lazily loaded
+        projects only read the details the ticker actually shows.
+
         Args:
             projects: List of Project objects with recent_updates
         """
         updates = []
 
-        for project in projects:
+        for project in sorted(projects, key=lambda p: p.last_updated, reverse=True):
+            if len(updates) >= self.max_items:
+                break
+
             if hasattr(project, 'recent_updates') and project.recent_updates:
                 # Get up to 3 most recent updates per project
                 project_updates = project.recent_updates[:3]
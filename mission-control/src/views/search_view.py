@@ -0,0 +1,163 @@
+"""
+Search modal - ranked full-text search across projects, tasks, notes and messages.
+"""
+import curses
+import time
+from typing import List, Optional
+
+from ..search_index import SearchIndex, SearchHit
+from .dashboard import COLOR_HEADER, COLOR_ACTIVE, COLOR_BLOCKED, COLOR_STALE
+
+
+KIND_ICONS = {
+    "project": "📁",
+    "task": "☐",
+    "meeting": "📝",
+    "message": "📧",
+}
+
+
+def render_search_modal(stdscr, search_index: SearchIndex) -> Optional[SearchHit]:
+    """
+    Render the search modal. Results update as you type.
+
+    Args:
+        stdscr: Curses window object
+        search_index: Up-to-date SearchIndex
+
+    Returns:
+        The hit chosen with Enter, or None if cancelled
+    """
+    stdscr.timeout(-1)  # Block until key pressed
+    try:
+        return _search_loop(stdscr, search_index)
+    finally:
+        stdscr.timeout(100)  # Restore timeout
+
+
+def _search_loop(stdscr, search_index: SearchIndex) -> Optional[SearchHit]:
+    """Input/render loop for render_search_modal()"""
+    query = ""
+    results: List[SearchHit] = []
+    selected_idx = 0
+    elapsed_ms = 0.0
+
+    while True:
+        stdscr.clear()
+        height, width = stdscr.getmaxyx()
+
+        # Calculate modal dimensions
+        modal_width = min(120, width - 4)
+        modal_height = max(10, height - 4)
+        start_x = (width - modal_width) // 2
+        start_y = (height - modal_height) // 2
+        content_x = start_x + 3
+
+        _draw_modal_border(stdscr, start_x, start_y, modal_width, modal_height)
+
+        title = " Search "
+        try:
+            stdscr.addstr(start_y, start_x + (modal_width - len(title)) // 2, title,
+                         curses.color_pair(COLOR_HEADER) | curses.A_BOLD)
+            stdscr.addstr(start_y + 2, content_x, f"/ {query}_"[:modal_width - 6],
+                         curses.color_pair(COLOR_ACTIVE) | curses.A_BOLD)
+        except curses.error:
+            pass
+
+        line_y = start_y + 3
+        if not search_index.available:
+            status = f"Search unavailable: {search_index.error or 'SQLite FTS5 not supported'}"
+            status_attr = curses.color_pair(COLOR_BLOCKED)
+        elif query.strip():
+            status = f"{len(results)} results ({elapsed_ms:.1f} ms)"
+            status_attr = curses.color_pair(COLOR_STALE)
+        else:
+            status = "Type to search projects, tasks, meeting notes and messages"
+            status_attr = curses.color_pair(COLOR_STALE)
+        try:
+            stdscr.addstr(line_y, content_x, status[:modal_width - 6], status_attr)
+        except curses.error:
+            pass
+        line_y += 2
+
+        # Results: two lines each (title, snippet)
+        max_visible = max(1, (start_y + modal_height - 3 - line_y) // 2)
+        scroll_offset = max(0, selected_idx - max_visible + 1)
+        for idx, hit in enumerate(results[scroll_offset:scroll_offset + max_visible]):
+            actual_idx = idx + scroll_offset
+            icon = KIND_ICONS.get(hit.kind, "•")
+            where = hit.project or "messages"
+            heading = f"{icon} {hit.title}  ({where})"
+            snippet = " ".join(hit.snippet.split())
+
+            attr = curses.color_pair(COLOR_HEADER)
+            if actual_idx == selected_idx:
+                attr |= curses.A_REVERSE
+            try:
+                stdscr.addstr(line_y, content_x, heading[:modal_width - 6], attr)
+                stdscr.addstr(line_y + 1, content_x + 3, snippet[:modal_width - 9])
+            except curses.error:
+                pass
+            line_y += 2
+
+        # Footer
+        footer = "Type to search | ↑/↓: Navigate | Enter: Open | Esc: Close"
+        try:
+            stdscr.addstr(start_y + modal_height - 2, start_x + max(1, (modal_width - len(footer)) // 2),
+                         footer[:modal_width - 2], curses.color_pair(COLOR_STALE))
+        except curses.error:
+            pass
+
+        stdscr.refresh()
+
+        # Handle input (letters are query text, so only arrows navigate)
+        key = stdscr.getch()
+
+        if key == 27:  # ESC
+            return None
+
+        elif key == ord('\n') or key == curses.KEY_ENTER or key == 10 or key == 13:
+            if results:
+                return results[selected_idx]
+
+        elif key == curses.KEY_UP:
+            selected_idx = max(0, selected_idx - 1)
+
+        elif key == curses.KEY_DOWN:
+            selected_idx = min(max(0, len(results) - 1), selected_idx + 1)
+
+        elif key == curses.KEY_BACKSPACE or key == 127 or key == 8:
+            query = query[:-1]
+            results, elapsed_ms = _run(search_index, query)
+            selected_idx = 0
+
+        elif 32 <= key <= 126:
+            query += chr(key)
+            results, elapsed_ms = _run(search_index, query)
+            selected_idx = 0
+
+
+def _run(search_index: SearchIndex, query: str):
+    """Run a search and time it"""
+    start = time.perf_counter()
+    results = search_index.search(query)
+    return results, (time.perf_counter() - start) * 1000
+
+
+def _draw_modal_border(stdscr, start_x: int, start_y: int,
+                       modal_width: int, modal_height: int):
+    """Draw modal border"""
+    for y in range(start_y, start_y + modal_height):
+        try:
+            stdscr.addstr(y, start_x, "│", curses.color_pair(COLOR_HEADER))
+            stdscr.addstr(y, start_x + modal_width - 1, "│", curses.color_pair(COLOR_HEADER))
+        except curses.error:
+            pass
+
+    try:
+        stdscr.addstr(start_y, start_x, "╭" + "─" * (modal_width - 2) + "╮",
+                     curses.color_pair(COLOR_HEADER))
+        stdscr.addstr(start_y + modal_height - 1, start_x, "╰" + "─" * (modal_width - 2) + "╯",
+                     curses.color_pair(COLOR_HEADER))
+    except curses.error:
+        pass
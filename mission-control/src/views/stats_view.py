@@ -0,0 +1,132 @@
+"""
+Portfolio stats modal for Mission Control.
+"""
+import curses
+from typing import Any, Dict
+
+from .dashboard import COLOR_HEADER, COLOR_ACTIVE, COLOR_BLOCKED, COLOR_STALE
+
+
+def render_stats_modal(stdscr, stats: Dict[str, Any]):
+    """
+    Render a modal with portfolio-wide numbers.
+
+    Args:
+        stdscr: Curses window object
+        stats: Output of ProjectCollection.stats()
+    """
+    stdscr.clear()
+    height, width = stdscr.getmaxyx()
+
+    # Calculate modal dimensions
+    modal_width = min(70, width - 4)
+    modal_height = min(30, height - 4)
+    start_x = (width - modal_width) // 2
+    start_y = (height - modal_height) // 2
+
+    # Draw border
+    for y in range(start_y, start_y + modal_height):
+        try:
+            stdscr.addstr(y, start_x, "│", curses.color_pair(COLOR_HEADER))
+            stdscr.addstr(y, start_x + modal_width - 1, "│", curses.color_pair(COLOR_HEADER))
+        except curses.error:
+            pass
+
+    try:
+        stdscr.addstr(start_y, start_x, "╭" + "─" * (modal_width - 2) + "╮",
+                     curses.color_pair(COLOR_HEADER))
+        stdscr.addstr(start_y + modal_height - 1, start_x, "╰" + "─" * (modal_width - 2) + "╯",
+                     curses.color_pair(COLOR_HEADER))
+    except curses.error:
+        pass
+
+    # Title
+    title = " Portfolio Stats "
+    title_x = start_x + (modal_width - len(title)) // 2
+    try:
+        stdscr.addstr(start_y, title_x, title,
+                     curses.color_pair(COLOR_HEADER) | curses.A_BOLD)
+    except curses.error:
+        pass
+
+    risk = stats["risk"]
+    burn_down = stats["burn_down"]
+    by_due = burn_down["remaining_by_due"]
+    hours = stats["hours"]
+    overdue_by_category = ", ".join(
+        f"{name} {count}" for name, count in stats["overdue_by_category"].items() if count
+    ) or "none"
+
+    sections = [
+        ("Projects", [
+            ("Total", f"{stats['projects']}  (active {stats['active']}, completed {stats['completed']})"),
+            ("Attention", f"blocked {stats['blocked']}, overdue {stats['overdue']}, "
+                          f"stale {stats['stale']}, review {stats['needs_review']}"),
+            ("Progress", f"{stats['avg_progress']}% average"),
+        ]),
+        ("Risk", [
+            ("Distribution", f"🔴 {risk['high']}  🟡 {risk['medium']}  🟢 {risk['low']}  ⚪ {risk['none']}"),
+            ("Overdue by", overdue_by_category),
+        ]),
+        ("Burn-down", [
+            ("Tasks", f"{burn_down['tasks_completed']}/{burn_down['tasks_total']} done "
+                      f"({burn_down['percent_complete']}%), {burn_down['tasks_remaining']} remaining"),
+            ("Remaining", f"overdue {by_due['overdue']}, this week {by_due['this_week']}, "
+                          f"4 weeks {by_due['next_4_weeks']}"),
+            ("", f"later {by_due['later']}, no due date {by_due['no_due']}"),
+        ]),
+        ("Hours", [
+            ("Est / actual", f"{hours['estimated']:.0f}h / {hours['actual']:.0f}h"),
+            ("Variance", f"{hours['variance']:+.0f}h ({hours['variance_percent']:+.1f}%), "
+                         f"{hours['over_budget']} over budget"),
+        ]),
+    ]
+
+    # Content
+    line_y = start_y + 2
+    content_x = start_x + 3
+
+    for section_name, rows in sections:
+        if line_y >= start_y + modal_height - 3:
+            break
+
+        try:
+            stdscr.addstr(line_y, content_x, section_name,
+                         curses.color_pair(COLOR_ACTIVE) | curses.A_BOLD)
+            line_y += 1
+
+            for label, value in rows:
+                if line_y >= start_y + modal_height - 3:
+                    break
+                stdscr.addstr(line_y, content_x, f"  {label:<14}", curses.color_pair(COLOR_HEADER))
+                stdscr.addstr(line_y, content_x + 16, value[:modal_width - 21])
+                line_y += 1
+
+            line_y += 1  # Space between sections
+
+        except curses.error:
+            pass
+
+    if stats["overdue"] or stats["blocked"]:
+        try:
+            stdscr.addstr(start_y + modal_height - 3, content_x,
+                         "Tip: press f to filter to blocked projects, s to sort by risk"[:modal_width - 6],
+                         curses.color_pair(COLOR_BLOCKED))
+        except curses.error:
+            pass
+
+    # Footer
+    footer = "Press any key to close"
+    footer_x = start_x + (modal_width - len(footer)) // 2
+    try:
+        stdscr.addstr(start_y + modal_height - 2, footer_x, footer,
+                     curses.color_pair(COLOR_STALE))
+    except curses.error:
+        pass
+
+    stdscr.refresh()
+
+    # Wait for any key
+    stdscr.timeout(-1)  # Block until key pressed
+    stdscr.getch()
+    stdscr.timeout(100)  # Restore timeout
@@ -0,0 +1,229 @@
+"""
+Cross-project task view - queries over the global task index.
+"""
+import curses
+from typing import List, Optional
+
+from ..task_index import TaskIndex, IndexedTask
+from .dashboard import COLOR_HEADER, COLOR_ACTIVE, COLOR_BLOCKED, COLOR_HOLD, COLOR_STALE
+
+
+# (key, label, needs text input)
+QUERIES = [
+    ("1", "Open", False),
+    ("2", "Due this week", False),
+    ("3", "Overdue", False),
+    ("4", "Blocked", False),
+    ("5", "Assignee", True),
+    ("6", "Search", True),
+]
+
+
+def run_query(task_index: TaskIndex, query_idx: int, text: str) -> List[IndexedTask]:
+    """
+    Run one of the QUERIES against the index.
+
+    Args:
+        task_index: Refreshed TaskIndex
+        query_idx: Index into QUERIES
+        text: Assignee name or keyword for text queries
+
+    Returns:
+        Matching tasks
+    """
+    label = QUERIES[query_idx][1]
+    if label == "Open":
+        return task_index.open_tasks()
+    if label == "Due this week":
+        return task_index.due_this_week()
+    if label == "Overdue":
+        return task_index.overdue()
+    if label == "Blocked":
+        return task_index.blocked()
+    if not text:
+        return []
+    if label == "Assignee":
+        return task_index.assigned_to(text)
+    return task_index.search(text)
+
+
+def render_task_index_modal(stdscr, task_index: TaskIndex) -> Optional[IndexedTask]:
+    """
+    Render the cross-project task view.
+
+    Args:
+        stdscr: Curses window object
+        task_index: Refreshed TaskIndex
+
+    Returns:
+        The task chosen with Enter (to jump to its project), or None
+    """
+    stdscr.timeout(-1)  # Block until key pressed
+    try:
+        return _task_index_loop(stdscr, task_index)
+    finally:
+        stdscr.timeout(100)  # Restore timeout
+
+
+def _task_index_loop(stdscr, task_index: TaskIndex) -> Optional[IndexedTask]:
+    """Input/render loop for render_task_index_modal()"""
+    query_idx = 0
+    query_text = {"Assignee": "", "Search": ""}
+    editing = False
+    selected_idx = 0
+    results = run_query(task_index, query_idx, "")
+
+    while True:
+        stdscr.clear()
+        height, width = stdscr.getmaxyx()
+        label = QUERIES[query_idx][1]
+
+        # Calculate modal dimensions
+        modal_width = min(120, width - 4)
+        modal_height = max(10, height - 4)
+        start_x = (width - modal_width) // 2
+        start_y = (height - modal_height) // 2
+
+        _draw_modal_border(stdscr, start_x, start_y, modal_width, modal_height)
+
+        title = f" All Tasks: {label} ({len(results)}) "
+        title_x = start_x + (modal_width - len(title)) // 2
+        content_x = start_x + 3
+        try:
+            stdscr.addstr(start_y, title_x, title, curses.color_pair(COLOR_HEADER) | curses.A_BOLD)
+        except curses.error:
+            pass
+
+        # Query tabs
+        line_y = start_y + 2
+        tab_x = content_x
+        for idx, (key, tab_label, _) in enumerate(QUERIES):
+            tab = f"[{key}] {tab_label}"
+            attr = curses.color_pair(COLOR_HEADER)
+            if idx == query_idx:
+                attr |= curses.A_REVERSE | curses.A_BOLD
+            try:
+                if tab_x + len(tab) < start_x + modal_width - 2:
+                    stdscr.addstr(line_y, tab_x, tab, attr)
+            except curses.error:
+                pass
+            tab_x += len(tab) + 2
+
+        # Text prompt for assignee/search
+        line_y += 1
+        if QUERIES[query_idx][2]:
+            prompt = f"{label}: {query_text[label]}{'_' if editing else ''}"
+            hint = "  (Enter: run, Esc: cancel)" if editing else "  (/: edit)"
+            try:
+                stdscr.addstr(line_y, content_x, (prompt + hint)[:modal_width - 6],
+                             curses.color_pair(COLOR_ACTIVE) if editing else curses.color_pair(COLOR_STALE))
+            except curses.error:
+                pass
+        line_y += 2
+
+        # Results
+        max_visible = start_y + modal_height - 3 - line_y
+        scroll_offset = max(0, selected_idx - max_visible + 1)
+        for idx, task in enumerate(results[scroll_offset:scroll_offset + max_visible]):
+            actual_idx = idx + scroll_offset
+            due = task.due.isoformat() if task.due else ""
+            assignee = (task.assignee or "")[:14]
+            text = "  " * task.depth + task.text
+            row = f"{task.status} {task.project[:24]:<24} {due:<10} {assignee:<14} {text}"
+
+            attr = _status_attr(task)
+            if actual_idx == selected_idx:
+                attr |= curses.A_REVERSE
+            try:
+                stdscr.addstr(line_y, content_x, row[:modal_width - 6], attr)
+            except curses.error:
+                pass
+            line_y += 1
+
+        if not results:
+            message = "Type a name or keyword with /" if QUERIES[query_idx][2] and not query_text[label] \
+                else "No matching tasks"
+            try:
+                stdscr.addstr(line_y, content_x, message, curses.color_pair(COLOR_STALE))
+            except curses.error:
+                pass
+
+        # Footer
+        footer = "1-6: Query | ↑/↓ or j/k: Navigate | Enter: Go to project | q: Close"
+        footer_x = start_x + max(1, (modal_width - len(footer)) // 2)
+        try:
+            stdscr.addstr(start_y + modal_height - 2, footer_x, footer[:modal_width - 2],
+                         curses.color_pair(COLOR_STALE))
+        except curses.error:
+            pass
+
+        stdscr.refresh()
+
+        # Handle input
+        key = stdscr.getch()
+
+        if editing:
+            if key == 27:  # ESC
+                editing = False
+            elif key == ord('\n') or key == curses.KEY_ENTER or key == 10 or key == 13:
+                editing = False
+                results = run_query(task_index, query_idx, query_text[label])
+                selected_idx = 0
+            elif key == curses.KEY_BACKSPACE or key == 127 or key == 8:
+                query_text[label] = query_text[label][:-1]
+            elif 32 <= key <= 126:
+                query_text[label] += chr(key)
+            continue
+
+        if key == curses.KEY_UP or key == ord('k'):
+            selected_idx = max(0, selected_idx - 1)
+
+        elif key == curses.KEY_DOWN or key == ord('j'):
+            selected_idx = min(max(0, len(results) - 1), selected_idx + 1)
+
+        elif ord('1') <= key <= ord(str(len(QUERIES))):
+            query_idx = key - ord('1')
+            label = QUERIES[query_idx][1]
+            editing = QUERIES[query_idx][2] and not query_text[label]
+            results = run_query(task_index, query_idx, query_text.get(label, ""))
+            selected_idx = 0
+
+        elif key == ord('/') and QUERIES[query_idx][2]:
+            editing = True
+
+        elif key == ord('\n') or key == curses.KEY_ENTER or key == 10 or key == 13:
+            if results:
+                return results[selected_idx]
+
+        elif key == ord('q') or key == ord('Q') or key == 27:
+            return None
+
+
+def _status_attr(task: IndexedTask) -> int:
+    """Color for a task row"""
+    if task.status == '[!]':
+        return curses.color_pair(COLOR_BLOCKED)
+    if task.status == '[~]':
+        return curses.color_pair(COLOR_HOLD)
+    if not task.is_open:
+        return curses.color_pair(COLOR_STALE)
+    return curses.color_pair(COLOR_ACTIVE)
+
+
+def _draw_modal_border(stdscr, start_x: int, start_y: int,
+                       modal_width: int, modal_height: int):
+    """Draw modal border"""
+    for y in range(start_y, start_y + modal_height):
+        try:
+            stdscr.addstr(y, start_x, "│", curses.color_pair(COLOR_HEADER))
+            stdscr.addstr(y, start_x + modal_width - 1, "│", curses.color_pair(COLOR_HEADER))
+        except curses.error:
+            pass
+
+    try:
+        stdscr.addstr(start_y, start_x, "╭" + "─" * (modal_width - 2) + "╮",
+                     curses.color_pair(COLOR_HEADER))
+        stdscr.addstr(start_y + modal_height - 1, start_x, "╰" + "─" * (modal_width - 2) + "╯",
+                     curses.color_pair(COLOR_HEADER))
+    except curses.error:
+        pass
@@ -2,7 +2,7 @@
 Three-pane view: [Projects | Summary] (top), Tasks (bottom)
 """
 import curses
-from typing import List
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 
 from ..models import Project
@@ -18,7 +18,9 @@ from .dashboard import (
 def render_three_pane_view(stdscr, projects: List[Project], tasks: List[Task],
                            selected_project_idx: int, selected_task_idx: int,
                            active_pane: str, sort_by: str, summary_scroll_offset: int = 0,
-                           filter_by: str = "all", total_projects: int = 0):
+                           filter_by: str = "all", total_projects: int = 0,
+                           portfolio: Optional[Dict[str, Any]] = None,
+                           status: Optional[str] = None):
     """
     Render three-pane view: Top split into Projects (left) | Summary (right), Tasks (bottom)
 
@@ -33,6 +35,8 @@ def render_three_pane_view(stdscr, projects: List[Project], tasks: List[Task],
         summary_scroll_offset: Scroll offset for summary pane
         filter_by: Current filter criterion
         total_projects: Total number of projects before filtering
+        portfolio: Portfolio stats for the header (ProjectCollection.stats())
+        status: Background import status shown in the footer (optional)
     """
     stdscr.clear()
     height, width = stdscr.getmaxyx()
@@ -44,7 +48,7 @@ def render_three_pane_view(stdscr, projects: List[Project], tasks: List[Task],
     # === TOP-LEFT: PROJECTS ===
     draw_projects_pane(stdscr, projects, selected_project_idx, sort_by,
                        active_pane == "projects", 0, 0, top_split_x, top_height,
-                       filter_by, total_projects)
+                       filter_by, total_projects, portfolio)
 
     # === TOP-RIGHT: PROJECT SUMMARY ===
     selected_project = projects[selected_project_idx] if projects and selected_project_idx < len(projects) else None
@@ -67,14 +71,15 @@ def render_three_pane_view(stdscr, projects: List[Project], tasks: List[Task],
     # Lines height-3 (border) and height-2 (content) reserved for marquee
 
     # === FOOTER ===
-    draw_footer(stdscr, height, width, active_pane)
+    draw_footer(stdscr, height, width, active_pane, status)
 
     stdscr.refresh()
 
 
 def draw_projects_pane(stdscr, projects: List[Project], selected_idx: int,
                       sort_by: str, is_active: bool, x: int, y: int, width: int, height: int,
-                      filter_by: str = "all", total_projects: int = 0):
+                      filter_by: str = "all", total_projects: int = 0,
+                      portfolio: Optional[Dict[str, Any]] = None):
     """Draw the projects pane (top-left)"""
     # Title bar
     title = "PROJECTS" if is_active else "Projects"
@@ -89,6 +94,8 @@ def draw_projects_pane(stdscr, projects: List[Project], selected_idx: int,
         filter_str = f"[{filter_by}]" if filter_by != "all" else ""
         sort_str = f"[{sort_by[:8]}]"
         info = f"  {count_str}  Filter: {filter_str}  Sort: {sort_str}" if filter_str else f"  {count_str}  Sort: {sort_str}"
+        if portfolio:
+            info += f"  🚫{portfolio['blocked']} ⏰{portfolio['overdue']} 🔴{portfolio['risk']['high']}"
         stdscr.addstr(y, x + len(title) + 2, info[:width - len(title) - 4],
                      curses.color_pair(COLOR_HEADER))
     except curses.error:
@@ -393,18 +400,25 @@ def draw_tasks_pane(stdscr, tasks: List[Task], selected_idx: int, is_active: boo
             pass
 
 
-def draw_footer(stdscr, height: int, width: int, active_pane: str):
-    """Draw footer with keybindings"""
+def draw_footer(stdscr, height: int, width: int, active_pane: str,
+                status: Optional[str] = None):
+    """Draw footer with keybindings (prefixed by the import status, if any)"""
     footer_y = height - 1
 
     if active_pane == "projects":
-        footer = "[↑↓] Navigate  [Tab] Tasks  [p] Summary  [s] Sort  [f] Filter  [?] Help  [q] Quit"
+        footer = "[↑↓] Navigate  [Tab] Tasks  [p] Summary  [s] Sort  [f] Filter  [/] Search  [a] All Tasks  [t] Stats  [?] Help  [q] Quit"
     elif active_pane == "summary":
         footer = "[↑↓] Scroll  [Tab] Projects  [p] Stay  [?] Help  [q] Quit"
     else:  # tasks
         footer = "[↑↓] Navigate  [Tab] Projects  [p] Summary  [Space] Toggle  [d] Delete  [u] Undo  [?] Help  [q] Quit"
 
     try:
-        stdscr.addstr(footer_y, 0, footer[:width], curses.color_pair(COLOR_HEADER))
+        if status:
+            status = f" {status} "[:width - 1]
+            stdscr.addstr(footer_y, 0, status, curses.color_pair(COLOR_ACTIVE) | curses.A_REVERSE)
+            stdscr.addstr(footer_y, len(status) + 1, footer[:max(0, width - len(status) - 2)],
+                         curses.color_pair(COLOR_HEADER))
+        else:
+            stdscr.addstr(footer_y, 0, footer[:width], curses.color_pair(COLOR_HEADER))
     except curses.error:
         pass
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Add mission-control to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
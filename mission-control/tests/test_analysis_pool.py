@@ -0,0 +1,119 @@
+"""AnalysisPool ordering, concurrency bound and rate-limit backoff"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from src.analysis_pool import AnalysisPool
+from src.content_analyzer import RateLimitError
+
+
+class FakeClock:
+    """Monotonic clock that only moves when sleep() is called"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeAnalyzer:
+    """
+    Stands in for ContentAnalyzer: each file is analyzed as several chunk
+    calls made at once, each held inside call_gate like the real API calls.
+    """
+
+    def __init__(self, chunks: int = 1, delay: float = 0.0, failures=None):
+        self.chunks = chunks
+        self.delay = delay
+        self.failures = list(failures or [])  # RateLimitErrors raised by the first calls
+        self.call_gate = None
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _call(self, path: Path, delay: float):
+        with self.call_gate():
+            with self._lock:
+                self.calls += 1
+                self.in_flight += 1
+                self.peak = max(self.peak, self.in_flight)
+                failure = self.failures.pop(0) if self.failures else None
+            try:
+                time.sleep(delay)
+                if failure is not None:
+                    raise failure
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+
+    def analyze_file(self, path: Path, known_projects):
+        # Earlier files take longer, so they finish last
+        delay = self.delay / (1 + int(path.stem))
+        with ThreadPoolExecutor(max_workers=self.chunks) as executor:
+            for future in [executor.submit(self._call, path, delay) for _ in range(self.chunks)]:
+                future.result()
+        return f"analysis of {path.name}"
+
+
+def test_results_come_back_in_input_order():
+    analyzer = FakeAnalyzer(delay=0.05)
+    pool = AnalysisPool(analyzer, max_workers=4)
+    paths = [Path(f"{i}.md") for i in range(8)]
+
+    outcomes = list(pool.analyze_files(paths, []))
+
+    assert [outcome.path for outcome in outcomes] == paths
+    assert [outcome.analysis for outcome in outcomes] == [f"analysis of {p.name}" for p in paths]
+    assert all(outcome.error is None and outcome.attempts == 1 for outcome in outcomes)
+
+
+def test_call_gate_bounds_api_calls_in_flight():
+    # 3 files x 3 chunks could put 9 calls in flight without the slots
+    analyzer = FakeAnalyzer(chunks=3, delay=0.05)
+    pool = AnalysisPool(analyzer, max_workers=3)
+
+    outcomes = list(pool.analyze_files([Path(f"{i}.md") for i in range(6)], []))
+
+    assert analyzer.call_gate == pool.api_call
+    assert all(outcome.error is None for outcome in outcomes)
+    assert analyzer.calls == 18
+    assert analyzer.peak == 3
+
+
+def test_rate_limit_backs_off_through_injected_sleep_and_clock(monkeypatch):
+    monkeypatch.setattr("src.analysis_pool.random.uniform", lambda low, high: high)
+    clock = FakeClock()
+    analyzer = FakeAnalyzer(failures=[RateLimitError("slow down", retry_after=7.0),
+                                      RateLimitError("slow down")])
+    pool = AnalysisPool(analyzer, max_workers=1, base_delay=2.0,
+                        sleep=clock.sleep, clock=clock)
+
+    [outcome] = pool.analyze_files([Path("0.md")], [])
+
+    assert outcome.error is None
+    assert outcome.attempts == 3
+    # Retry-After is honoured as given; without it the second retry waits base_delay * 2
+    assert clock.sleeps == [7.0, 4.0]
+    assert clock.now == 11.0
+
+
+def test_rate_limit_gives_up_after_max_retries():
+    clock = FakeClock()
+    analyzer = FakeAnalyzer(failures=[RateLimitError("slow down", retry_after=1.0)] * 3)
+    pool = AnalysisPool(analyzer, max_workers=1, max_retries=2,
+                        sleep=clock.sleep, clock=clock)
+
+    [outcome] = pool.analyze_files([Path("0.md")], [])
+
+    assert isinstance(outcome.error, RateLimitError)
+    assert outcome.analysis is None
+    assert outcome.attempts == 3
+    assert clock.sleeps == [1.0, 1.0]
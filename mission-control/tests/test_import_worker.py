@@ -0,0 +1,38 @@
+"""ImportWorker retry scheduling"""
+import time
+
+from src import import_worker
+from src.import_worker import ImportWorker
+
+
+def test_deleted_failed_file_does_not_spin(tmp_path, monkeypatch):
+    import_dir = tmp_path / "import"
+    import_dir.mkdir()
+
+    def failing_process_all(self, **kwargs):
+        raise RuntimeError("API down")
+
+    monkeypatch.setattr(import_worker.ImportProcessor, "process_all", failing_process_all)
+
+    worker = ImportWorker(import_dir, tmp_path, retry_interval=0.2)
+    runs = []
+    run_once = worker.run_once
+    monkeypatch.setattr(worker, "run_once", lambda *a, **k: runs.append(1) or run_once(*a, **k))
+
+    notes = import_dir / "notes.md"
+    notes.write_text("meeting notes")
+    worker.start()
+    try:
+        deadline = time.monotonic() + 5
+        while worker._retry_at is None and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert worker._failed == [notes]
+
+        notes.unlink()  # Gone before its retry
+        time.sleep(1.0)
+
+        assert len(runs) <= 3
+        assert worker._failed == []
+        assert worker._retry_at is None
+    finally:
+        worker.stop()